@@ -1,109 +1,125 @@
-// Simple cache-first service worker
-const CACHE_NAME = 'evo-sdk-cache-v3';
+// Service worker: precaches the site on first visit for instant, offline later visits.
+//
+// The list of files and the cache version come from precache-manifest.js, which
+// scripts/generate_docs.py writes from the hashes of what it publishes. Any
+// content change yields a new version (and so a new cache); nothing here needs
+// a manual bump.
+//
+// - Immutable entries (content-hashed names) are served from the cache and
+//   never revalidated; a new build references new names instead.
+// - Other precached entries (pages, data, unhashed assets) are served
+//   stale-while-revalidate.
+// - Everything else goes straight to the network.
 
-// Core assets to cache for offline usage
-const urlsToCache = [
-  '/',
-  '/index.html',
-  '/index.css',
-  '/app.js',
-  '/dist/evo-sdk.module.js',
-  '/playground.html',
-  '/playground.css',
-  '/src/playground.js',
-  '/src/result-format.js',
-  '/src/vendor/prism/prism-core.min.js',
-  '/src/vendor/prism/prism-clike.min.js',
-  '/src/vendor/prism/prism-javascript.min.js'
-];
+self.EVO_PRECACHE = { version: 'dev', urls: [], immutable: [] };
+try {
+  importScripts('./precache-manifest.js');
+} catch (error) {
+  // Not generated yet (plain checkout): install with an empty precache and pass everything through.
+  console.warn('[SW] No precache manifest, running without a precache:', error);
+}
 
-// Install event - pre-cache resources
-self.addEventListener('install', event => {
-  console.log('[SW] Installing and caching files...');
-  event.waitUntil(
-    caches.open(CACHE_NAME)
-      .then(cache => cache.addAll(urlsToCache))
-      .then(() => {
-        console.log('[SW] All files cached');
-        return self.skipWaiting();
-      })
-  );
+const CACHE_PREFIX = 'evo-sdk-cache-';
+const LEGACY_CACHE_PREFIX = 'wasm-sdk-cache-';
+const CACHE_NAME = `${CACHE_PREFIX}${self.EVO_PRECACHE.version}`;
+
+const scopeUrl = (path) => new URL(path, self.registration.scope).href;
+const PRECACHE = new Set([scopeUrl('./'), ...self.EVO_PRECACHE.urls.map(scopeUrl)]);
+const IMMUTABLE = new Set(self.EVO_PRECACHE.immutable.map(scopeUrl));
+// The scope root is served as index.html.
+const ALIASES = new Map([[scopeUrl('./'), scopeUrl('index.html')]]);
+
+const cacheKey = (url) => ALIASES.get(url) ?? url;
+
+async function previousCaches() {
+  const names = await caches.keys();
+  return names.filter((name) => name !== CACHE_NAME && (name.startsWith(CACHE_PREFIX) || name.startsWith(LEGACY_CACHE_PREFIX)));
+}
+
+async function precache() {
+  const cache = await caches.open(CACHE_NAME);
+  const older = await Promise.all((await previousCaches()).map((name) => caches.open(name)));
+  const keys = new Set([...PRECACHE].map(cacheKey));
+  await Promise.all([...keys].map(async (url) => {
+    if (IMMUTABLE.has(url)) {
+      // Same name, same bytes: carry hashed files over instead of downloading them again.
+      for (const old of older) {
+        const response = await old.match(url);
+        if (response) {
+          await cache.put(url, response);
+          return;
+        }
+      }
+    }
+    // Bypass the HTTP cache so a new version never precaches a stale copy.
+    const response = await fetch(url, { cache: IMMUTABLE.has(url) ? 'default' : 'reload' });
+    if (!response.ok) {
+      throw new Error(`${url}: HTTP ${response.status}`);
+    }
+    await cache.put(url, response);
+  }));
+}
+
+self.addEventListener('install', (event) => {
+  console.log(`[SW] Installing ${CACHE_NAME} (${PRECACHE.size} files)`);
+  event.waitUntil(precache().then(() => self.skipWaiting()));
 });
 
-// Activate event - clean up old caches
-self.addEventListener('activate', event => {
-  console.log('[SW] Activating...');
-  event.waitUntil(
-    caches.keys().then(cacheNames => {
-      return Promise.all(
-        cacheNames.map(cacheName => {
-          if (cacheName !== CACHE_NAME && (cacheName.startsWith('evo-sdk-cache-') || cacheName.startsWith('wasm-sdk-cache-'))) {
-            console.log('[SW] Deleting old cache:', cacheName);
-            return caches.delete(cacheName);
-          }
-        })
-      );
-    }).then(() => {
-      console.log('[SW] Claiming all clients');
-      return self.clients.claim();
-    })
-  );
+self.addEventListener('activate', (event) => {
+  event.waitUntil((async () => {
+    const older = await previousCaches();
+    await Promise.all(older.map((name) => {
+      console.log('[SW] Deleting old cache:', name);
+      return caches.delete(name);
+    }));
+    await self.clients.claim();
+    if (older.length) {
+      // Open pages still run the previous version's code.
+      const clients = await self.clients.matchAll({ type: 'window' });
+      clients.forEach((client) => client.postMessage({ type: 'cache-updated', version: self.EVO_PRECACHE.version }));
+    }
+  })());
 });
 
-// Fetch event - cache first, with background update
-self.addEventListener('fetch', event => {
-  const url = new URL(event.request.url);
-  
-  // Only handle our cached files
-  if (!urlsToCache.some(path => path === url.pathname)) {
+async function revalidate(cache, request, key) {
+  const response = await fetch(request);
+  if (response.ok && response.type === 'basic') {
+    await cache.put(key, response.clone());
+  }
+  return response;
+}
+
+self.addEventListener('fetch', (event) => {
+  const { request } = event;
+  if (request.method !== 'GET') {
+    return;
+  }
+  const url = new URL(request.url);
+  url.search = '';
+  url.hash = '';
+  if (!PRECACHE.has(url.href)) {
     return;
   }
+  const key = cacheKey(url.href);
 
-  event.respondWith(
-    caches.match(event.request).then(cachedResponse => {
-      // Always return from cache if available
-      if (cachedResponse) {
-        console.log('[SW] Cache hit:', url.pathname);
-        
-        // Update cache in background
-        event.waitUntil(
-          fetch(event.request).then(response => {
-            if (response && response.status === 200) {
-              const responseToCache = response.clone();
-              caches.open(CACHE_NAME).then(cache => {
-                cache.put(event.request, responseToCache);
-                console.log('[SW] Cache updated in background:', url.pathname);
-              });
-            }
-          }).catch(() => {
-            console.log('[SW] Background update failed, keeping cached version');
-          })
-        );
-        
-        return cachedResponse;
-      }
-      
-      // Cache miss - fetch and cache
-      console.log('[SW] Cache miss, fetching:', url.pathname);
-      return fetch(event.request).then(response => {
-        if (!response || response.status !== 200) {
-          return response;
-        }
-        
-        const responseToCache = response.clone();
-        caches.open(CACHE_NAME).then(cache => {
-          cache.put(event.request, responseToCache);
-          console.log('[SW] Cached:', url.pathname);
-        });
-        
-        return response;
-      });
-    })
-  );
+  event.respondWith((async () => {
+    const cache = await caches.open(CACHE_NAME);
+    const cached = await cache.match(key);
+    if (IMMUTABLE.has(key)) {
+      return cached ?? revalidate(cache, request, key);
+    }
+    if (cached) {
+      event.waitUntil(revalidate(cache, request, key).catch(() => {
+        console.log('[SW] Background update failed, keeping cached version:', key);
+      }));
+      return cached;
+    }
+    return revalidate(cache, request, key);
+  })());
 });
 
 // Handle cache clear message
-self.addEventListener('message', event => {
+self.addEventListener('message', (event) => {
   if (event.data.action === 'clearCache') {
     caches.delete(CACHE_NAME).then(() => {
       console.log('[SW] Cache cleared');
@@ -0,0 +1,73 @@
+// Lazy loader for the sharded SDK operation catalog written by
+// scripts/generate_docs.py (see scripts/catalog_shards.py for the layout).
+//
+// catalog/index.json lists operations, the shard file for each SDK namespace,
+// and which namespaces carry each type declaration. Shards are named by
+// content hash, so they are fetched at most once per page and may be cached
+// indefinitely; only the index is revalidated. DOM-free so it can be
+// unit-tested in node with an injected fetch.
+
+export const CATALOG_BASE_URL = './catalog/';
+
+export function methodNamespace(sdkMethod) {
+  return String(sdkMethod).split('.', 1)[0];
+}
+
+export function createCatalogLoader({ baseUrl = CATALOG_BASE_URL, fetchImpl = globalThis.fetch } = {}) {
+  const root = baseUrl.endsWith('/') ? baseUrl : `${baseUrl}/`;
+  let indexPromise = null;
+  const shardPromises = new Map();
+
+  async function fetchJson(file, init) {
+    const response = await fetchImpl(`${root}${file}`, init);
+    if (!response.ok) {
+      throw new Error(`Failed to load catalog/${file} (${response.status})`);
+    }
+    return response.json();
+  }
+
+  function loadIndex() {
+    if (!indexPromise) {
+      indexPromise = fetchJson('index.json', { cache: 'no-cache' }).catch((error) => {
+        indexPromise = null;
+        throw error;
+      });
+    }
+    return indexPromise;
+  }
+
+  async function loadNamespace(namespace) {
+    const index = await loadIndex();
+    const entry = index.namespaces?.[namespace];
+    if (!entry) return null;
+    if (!shardPromises.has(entry.file)) {
+      const promise = fetchJson(entry.file).catch((error) => {
+        shardPromises.delete(entry.file);
+        throw error;
+      });
+      shardPromises.set(entry.file, promise);
+    }
+    return shardPromises.get(entry.file);
+  }
+
+  async function getMethod(sdkMethod) {
+    const shard = await loadNamespace(methodNamespace(sdkMethod));
+    return shard?.methods?.[sdkMethod] ?? null;
+  }
+
+  async function getType(name) {
+    const index = await loadIndex();
+    const bare = String(name).replace(/^wasm\./, '');
+    const [namespace] = index.types?.[bare] || [];
+    if (!namespace) return null;
+    const shard = await loadNamespace(namespace);
+    return shard?.types?.[bare] ?? null;
+  }
+
+  async function getOperation(key) {
+    const index = await loadIndex();
+    return index.operations?.find((operation) => operation.key === key) ?? null;
+  }
+
+  return { loadIndex, loadNamespace, getMethod, getType, getOperation };
+}
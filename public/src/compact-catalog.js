@@ -0,0 +1,107 @@
+// Expands sdk-operation-catalog.compact.json (written by scripts/generate_docs.py,
+// see scripts/compact_catalog.py for the encoding) back into the schema of
+// sdk-operation-catalog.json. Recurring names live in one `strings` table,
+// operations reference their method by index, and records are positional
+// arrays. DOM-free so it can run in node tooling and unit tests.
+
+export const COMPACT_CATALOG_URL = './sdk-operation-catalog.compact.json';
+export const COMPACT_FORMAT = 'evo-sdk-catalog-compact';
+export const COMPACT_FORMAT_VERSION = 1;
+
+const PARAMETER_OPTIONAL = 1;
+const PARAMETER_REST = 2;
+
+export function defaultAnchor(name) {
+  return `type-${name.replace('wasm.', '').toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '')}`;
+}
+
+function expandProperties(properties, strings) {
+  return properties.map(([name, type, optional, description, references]) => ({
+    name: strings[name],
+    type: strings[type],
+    optional: Boolean(optional),
+    description,
+    references: references.map((item) => strings[item]),
+  }));
+}
+
+function expandParameters(parameters, strings) {
+  return parameters.map(([name, type, flags, description, references, properties]) => ({
+    name: strings[name],
+    type: strings[type],
+    optional: Boolean(flags & PARAMETER_OPTIONAL),
+    rest: Boolean(flags & PARAMETER_REST),
+    description,
+    references: references.map((item) => strings[item]),
+    properties: expandProperties(properties, strings),
+  }));
+}
+
+export function expandCatalog(compact) {
+  if (compact?.format !== COMPACT_FORMAT || compact?.formatVersion !== COMPACT_FORMAT_VERSION) {
+    throw new Error(`Unsupported compact catalog format ${compact?.format} v${compact?.formatVersion}`);
+  }
+  const { strings, methods } = compact;
+  const variants = methods.map(() => []);
+
+  const operations = compact.operations.map(([key, group, category, methodRef, label, description, disabled]) => {
+    const [sdkMethod, signature, , parameters, returnType, returnReferences] = methods[methodRef];
+    variants[methodRef].push({ key, group: strings[group], category: strings[category] });
+    return {
+      key,
+      group: strings[group],
+      category: strings[category],
+      sdkMethod,
+      label,
+      description,
+      disabled,
+      signature,
+      parameters: expandParameters(parameters, strings),
+      returnType: strings[returnType],
+      references: returnReferences.map((item) => strings[item]),
+    };
+  });
+
+  const expandedMethods = {};
+  methods.forEach(([sdkMethod, signature, description, parameters, returnType, returnReferences, source], index) => {
+    expandedMethods[sdkMethod] = {
+      sdkMethod,
+      signature,
+      description,
+      parameters: expandParameters(parameters, strings),
+      returnType: strings[returnType],
+      returnReferences: returnReferences.map((item) => strings[item]),
+      references: returnReferences.map((item) => strings[item]),
+      variants: variants[index],
+      source: strings[source],
+    };
+  });
+
+  const types = {};
+  for (const [name, kind, anchor, declaration, properties, references, source] of compact.types) {
+    types[name] = {
+      kind: strings[kind],
+      anchor: anchor ?? defaultAnchor(name),
+      declaration,
+      properties: expandProperties(properties, strings),
+      references: references.map((item) => strings[item]),
+      source: strings[source],
+    };
+  }
+
+  return {
+    schemaVersion: compact.schemaVersion,
+    sdk: compact.sdk,
+    operations,
+    methods: expandedMethods,
+    types,
+  };
+}
+
+export async function loadCompactCatalog(url = COMPACT_CATALOG_URL, { fetchImpl = globalThis.fetch } = {}) {
+  const response = await fetchImpl(url);
+  if (!response.ok) {
+    throw new Error(`Failed to load ${url} (${response.status})`);
+  }
+  return expandCatalog(await response.json());
+}
@@ -81,6 +81,15 @@ export function populateOperations(categoryKey) {
   hideOperationDetails();
 }
 
+export function selectOperation(type, categoryKey, operationKey) {
+  elements.operationType.value = type;
+  populateCategories();
+  elements.queryCategory.value = categoryKey;
+  populateOperations(categoryKey);
+  elements.queryType.value = operationKey;
+  onOperationChange(categoryKey, operationKey);
+}
+
 export function hideOperationDetails() {
   elements.queryDescription.style.display = 'none';
   elements.queryInputs.style.display = 'none';
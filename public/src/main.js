@@ -1,6 +1,7 @@
 import { getTypeConfig, loadDefinitions } from './definitions.js';
 import { clearCache, clearResults, copyResults, executeSelected } from './execute.js';
 import { hideOperationDetails, onOperationChange, populateCategories, populateOperations, updateGeneratedCodePreview } from './form/render.js';
+import { attachOperationSearch } from './operation-search.js';
 import { applyAdvancedConfig, loadVersionInfo, updateNetworkIndicator } from './sdk-client.js';
 import { elements, state } from './state.js';
 import { defaultResultMessage, hidePreloader, setNoProofInfoVisibility, setProgress, setStatus, showApiError, showPreloader } from './ui.js';
@@ -67,6 +68,7 @@ export function attachEventListeners() {
   if (elements.applyConfig) {
     elements.applyConfig.addEventListener('click', applyAdvancedConfig);
   }
+  attachOperationSearch();
   if (elements.apiRetryButton) {
     elements.apiRetryButton.addEventListener('click', async () => {
       showPreloader('Retrying...');
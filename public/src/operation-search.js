@@ -0,0 +1,114 @@
+import { getTypeConfig } from './definitions-data.js';
+import { selectOperation } from './form/render.js';
+import { createSearchIndexLoader } from './search-index.js';
+import { elements, state } from './state.js';
+
+const RESULT_LIMIT = 20;
+
+const loadSearchIndex = createSearchIndexLoader();
+let results = [];
+let active = -1;
+
+// The index covers every documented operation; the playground offers a filtered subset.
+function isAvailable(operation) {
+  const config = getTypeConfig(operation.group);
+  return Boolean(config && state.definitions[config.definitionKey]?.[operation.category]?.[config.itemsKey]?.[operation.key]);
+}
+
+function closeResults() {
+  results = [];
+  active = -1;
+  elements.operationSearchResults.hidden = true;
+  elements.operationSearchResults.innerHTML = '';
+  elements.operationSearch.setAttribute('aria-expanded', 'false');
+  elements.operationSearch.removeAttribute('aria-activedescendant');
+}
+
+function highlight(index) {
+  active = index;
+  Array.from(elements.operationSearchResults.children).forEach((item, position) => {
+    item.setAttribute('aria-selected', String(position === index));
+  });
+  if (index >= 0) {
+    elements.operationSearch.setAttribute('aria-activedescendant', `operationSearchResult-${index}`);
+  }
+}
+
+function choose(index) {
+  const operation = results[index];
+  if (!operation) return;
+  closeResults();
+  elements.operationSearch.value = '';
+  selectOperation(operation.group, operation.category, operation.key);
+}
+
+function renderResults() {
+  const list = elements.operationSearchResults;
+  list.innerHTML = '';
+  results.forEach((operation, index) => {
+    const item = document.createElement('li');
+    item.id = `operationSearchResult-${index}`;
+    item.setAttribute('role', 'option');
+    item.textContent = operation.label;
+    const group = document.createElement('span');
+    group.className = 'operation-search-group';
+    group.textContent = operation.group === 'transitions' ? 'State Transition' : 'Query';
+    item.appendChild(group);
+    // mousedown, so the choice lands before the input's blur closes the list.
+    item.addEventListener('mousedown', (event) => {
+      event.preventDefault();
+      choose(index);
+    });
+    list.appendChild(item);
+  });
+  if (!results.length) {
+    const empty = document.createElement('li');
+    empty.className = 'operation-search-empty';
+    empty.textContent = 'No matching operations';
+    list.appendChild(empty);
+  }
+  list.hidden = false;
+  elements.operationSearch.setAttribute('aria-expanded', 'true');
+  highlight(results.length ? 0 : -1);
+}
+
+async function onInput(event) {
+  const query = event.target.value.trim();
+  if (!query) {
+    closeResults();
+    return;
+  }
+  let index;
+  try {
+    index = await loadSearchIndex();
+  } catch (error) {
+    console.warn('Operation search unavailable:', error);
+    return;
+  }
+  if (event.target.value.trim() !== query) return;
+  results = index.search(query, { limit: RESULT_LIMIT, filter: isAvailable });
+  renderResults();
+}
+
+function onKeyDown(event) {
+  if (elements.operationSearchResults.hidden) return;
+  if (event.key === 'ArrowDown' || event.key === 'ArrowUp') {
+    event.preventDefault();
+    if (!results.length) return;
+    const step = event.key === 'ArrowDown' ? 1 : -1;
+    highlight((active + step + results.length) % results.length);
+  } else if (event.key === 'Enter') {
+    event.preventDefault();
+    choose(active);
+  } else if (event.key === 'Escape') {
+    closeResults();
+  }
+}
+
+export function attachOperationSearch() {
+  if (!elements.operationSearch || !elements.operationSearchResults) return;
+  elements.operationSearch.addEventListener('focus', () => loadSearchIndex().catch(() => {}), { once: true });
+  elements.operationSearch.addEventListener('input', onInput);
+  elements.operationSearch.addEventListener('keydown', onKeyDown);
+  elements.operationSearch.addEventListener('blur', closeResults);
+}
@@ -0,0 +1,164 @@
+// Queries search-index.json, the prebuilt operation index written by
+// scripts/generate_docs.py (see scripts/search_index.py for the layout).
+// Shared by the docs sidebar and the playground operation picker.
+//
+// Each query word must match some term of an operation, exactly, as a prefix
+// (binary search over the sorted terms) or, from three letters on, as a
+// substring (intersection of the trigram lists). Matches are weighed by the
+// field they occur in and by how exact they are, so a lookup costs the terms
+// and postings it touches rather than a pass over every operation. Words the
+// index never holds (its stopwords and too-short words) are dropped from the
+// query unless nothing else is left. DOM-free so it can be unit-tested in node.
+
+export const SEARCH_INDEX_URL = './search-index.json';
+export const SEARCH_INDEX_FORMAT = 'evo-sdk-search-index';
+export const SEARCH_INDEX_VERSION = 2;
+
+// Weights for the field names listed in the index (SEARCH_FIELDS in scripts/search_index.py).
+const FIELD_WEIGHTS = { label: 8, sdkMethod: 6, parameter: 3, returnType: 3, description: 1 };
+const EXACT = 1;
+const PREFIX = 0.6;
+const SUBSTRING = 0.3;
+const TRIGRAM_LENGTH = 3;
+// A one- or two-letter prefix can match much of the vocabulary; past this many
+// terms, more expansions only cost time.
+const MAX_EXPANSIONS = 256;
+
+const WORD_RE = /[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+/g;
+
+export function tokenize(query) {
+  return Array.from(new Set((String(query).match(WORD_RE) || []).map((word) => word.toLowerCase())));
+}
+
+function lowerBound(terms, value) {
+  let low = 0;
+  let high = terms.length;
+  while (low < high) {
+    const middle = (low + high) >>> 1;
+    if (terms[middle] < value) low = middle + 1;
+    else high = middle;
+  }
+  return low;
+}
+
+export function createSearchIndex(data) {
+  if (data?.format !== SEARCH_INDEX_FORMAT || data.version !== SEARCH_INDEX_VERSION) {
+    throw new Error(`Unsupported search index (${data?.format} v${data?.version})`);
+  }
+  const { terms, postings, trigrams } = data;
+  const stopwords = new Set(data.stopwords);
+  const isIndexable = (word) => word.length >= data.minTermLength && !stopwords.has(word);
+  const operations = data.operations.map(([group, category, key, label, anchor], id) => ({
+    id, group, category, key, label, anchor,
+  }));
+  const weights = data.fields.map((field) => FIELD_WEIGHTS[field] ?? 1);
+  // Total weight of each field mask, computed once per distinct mask.
+  const maskWeights = new Map();
+  const maskWeight = (mask) => {
+    let weight = maskWeights.get(mask);
+    if (weight === undefined) {
+      weight = weights.reduce((sum, value, bit) => (mask & (1 << bit) ? sum + value : sum), 0);
+      maskWeights.set(mask, weight);
+    }
+    return weight;
+  };
+
+  // Term id -> match quality for one query word.
+  function expand(word) {
+    const matches = new Map();
+    const start = lowerBound(terms, word);
+    for (let id = start; id < terms.length && matches.size < MAX_EXPANSIONS && terms[id].startsWith(word); id += 1) {
+      matches.set(id, terms[id] === word ? EXACT : PREFIX);
+    }
+    if (word.length < TRIGRAM_LENGTH || matches.size >= MAX_EXPANSIONS) {
+      return matches;
+    }
+    const lists = [];
+    for (let offset = 0; offset + TRIGRAM_LENGTH <= word.length; offset += 1) {
+      const list = trigrams[word.slice(offset, offset + TRIGRAM_LENGTH)];
+      if (!list) return matches;
+      lists.push(list);
+    }
+    lists.sort((a, b) => a.length - b.length);
+    const [shortest, ...rest] = lists;
+    const others = rest.map((list) => new Set(list));
+    for (const id of shortest) {
+      if (matches.size >= MAX_EXPANSIONS) break;
+      if (!matches.has(id) && others.every((set) => set.has(id)) && terms[id].includes(word)) {
+        matches.set(id, SUBSTRING);
+      }
+    }
+    return matches;
+  }
+
+  // Operations matching every word of `query`, best first.
+  function search(query, { limit = Infinity, filter = null } = {}) {
+    const words = tokenize(query);
+    if (!words.length) return [];
+    // "Get Identity by Public Key Hash": `by` is in no operation's terms.
+    const indexable = words.filter(isIndexable);
+    let scores = null;
+    for (const word of indexable.length ? indexable : words) {
+      const wordScores = new Map();
+      for (const [termId, quality] of expand(word)) {
+        const list = postings[termId];
+        for (let i = 0; i < list.length; i += 2) {
+          const operation = list[i];
+          if (scores && !scores.has(operation)) continue;
+          const score = quality * maskWeight(list[i + 1]);
+          if (score > (wordScores.get(operation) ?? 0)) wordScores.set(operation, score);
+        }
+      }
+      if (scores) {
+        for (const [operation, score] of wordScores) wordScores.set(operation, score + scores.get(operation));
+      }
+      scores = wordScores;
+      if (!scores.size) return [];
+    }
+    if (words.length > 1) {
+      // `getIdentityBalance` as typed is also one indexed term: prefer operations named exactly that.
+      const compound = words.join('');
+      const termId = lowerBound(terms, compound);
+      if (terms[termId] === compound) {
+        const list = postings[termId];
+        for (let i = 0; i < list.length; i += 2) {
+          if (scores.has(list[i])) scores.set(list[i], scores.get(list[i]) + EXACT * maskWeight(list[i + 1]));
+        }
+      }
+    }
+    const results = [];
+    for (const [id, score] of scores) {
+      const operation = operations[id];
+      if (!filter || filter(operation)) results.push({ operation, score });
+    }
+    // Among equal scores, the shorter label is the closer match.
+    results.sort((a, b) => b.score - a.score
+      || a.operation.label.length - b.operation.label.length
+      || a.operation.id - b.operation.id);
+    return results.slice(0, limit).map(({ operation }) => operation);
+  }
+
+  return { operations, search };
+}
+
+export function createSearchIndexLoader({ url = SEARCH_INDEX_URL, fetchImpl = globalThis.fetch } = {}) {
+  let indexPromise = null;
+
+  async function fetchIndex() {
+    const response = await fetchImpl(url);
+    if (!response.ok) {
+      throw new Error(`Failed to load ${url} (${response.status})`);
+    }
+    return createSearchIndex(await response.json());
+  }
+
+  return function loadSearchIndex() {
+    if (!indexPromise) {
+      indexPromise = fetchIndex().catch((error) => {
+        indexPromise = null;
+        throw error;
+      });
+    }
+    return indexPromise;
+  };
+}
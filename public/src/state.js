@@ -16,6 +16,8 @@ export const elements = {
   networkRadios: Array.from(document.querySelectorAll('input[name="network"]')),
   networkIndicator: document.getElementById('networkIndicator'),
   trustedMode: document.getElementById('trustedMode'),
+  operationSearch: document.getElementById('operationSearch'),
+  operationSearchResults: document.getElementById('operationSearchResults'),
   operationType: document.getElementById('operationType'),
   queryCategory: document.getElementById('queryCategory'),
   queryType: document.getElementById('queryType'),
@@ -0,0 +1,228 @@
+"""
+Atomic, write-if-changed storage for generated documentation artifacts.
+
+Renderers yield text chunks; `write_chunks` encodes them into a buffered
+temporary file next to the target and computes the SHA-256 as the bytes
+stream out. When the finished bytes match the artifact already on disk the
+temporary file is discarded and the original (and its mtime) is left alone;
+otherwise it is renamed over the target atomically, so an interrupted build
+never leaves a half-written file behind. The digests recorded here feed
+docs_manifest.json directly, so nothing is re-read to hash it.
+
+Each artifact also gets precompressed siblings for static servers that can
+serve them as-is (nginx `gzip_static`/`brotli_static`): `.gz` at level 9 with
+a zeroed header timestamp so it is reproducible, and `.br` at quality 11 when
+the optional `brotli` package is installed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Tuple
+
+try:
+    import brotli
+except ImportError:  # optional: without it only .gz siblings are produced
+    brotli = None
+
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+class ArtifactRecord(NamedTuple):
+    name: str
+    sha256: str
+    size: int
+    changed: bool = False
+
+
+def hash_path(path: Path) -> Tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+            size += len(block)
+    return digest.hexdigest(), size
+
+
+def _default_mode(target: Path) -> int:
+    try:
+        return target.stat().st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _commit(temp_path: Path, target: Path, digest: str, size: int) -> bool:
+    """Move `temp_path` over `target` unless the target already holds the same bytes."""
+    try:
+        if target.stat().st_size == size and hash_path(target)[0] == digest:
+            temp_path.unlink()
+            return False
+    except FileNotFoundError:
+        pass
+    os.chmod(temp_path, _default_mode(target))
+    os.replace(temp_path, target)
+    return True
+
+
+class HashingSink:
+    """Buffered temporary-file sink that hashes everything written through it."""
+
+    def __init__(self, target: Path):
+        self.target = target
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.', suffix='.tmp')
+        self.temp_path = Path(temp_name)
+        self._file = os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE)
+        self._digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, chunk: str) -> None:
+        self.write_bytes(chunk.encode('utf-8'))
+
+    def write_bytes(self, data: bytes) -> None:
+        self._digest.update(data)
+        self._file.write(data)
+        self.size += len(data)
+
+    def commit(self) -> Tuple[str, bool]:
+        self._file.close()
+        digest = self._digest.hexdigest()
+        return digest, _commit(self.temp_path, self.target, digest, self.size)
+
+    def abort(self) -> None:
+        self._file.close()
+        self.temp_path.unlink(missing_ok=True)
+
+
+def write_chunks(output_dir: Path, name: str, chunks: Iterable[str]) -> ArtifactRecord:
+    sink = HashingSink(output_dir / name)
+    try:
+        for chunk in chunks:
+            sink.write(chunk)
+    except BaseException:
+        sink.abort()
+        raise
+    digest, changed = sink.commit()
+    return ArtifactRecord(name, digest, sink.size, changed)
+
+
+def write_bytes(output_dir: Path, name: str, data: bytes) -> ArtifactRecord:
+    sink = HashingSink(output_dir / name)
+    try:
+        sink.write_bytes(data)
+    except BaseException:
+        sink.abort()
+        raise
+    digest, changed = sink.commit()
+    return ArtifactRecord(name, digest, sink.size, changed)
+
+
+def atomic_copy(source: Path, target: Path) -> None:
+    """Copy `source` over `target` through a temporary file and an atomic rename."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.', suffix='.tmp')
+    os.close(fd)
+    try:
+        shutil.copyfile(source, temp_name)
+        os.chmod(temp_name, _default_mode(target))
+        os.replace(temp_name, target)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def compression_formats() -> Tuple[str, ...]:
+    """Precompressed sibling formats this interpreter can produce, as file suffixes without the dot."""
+    return ('br', 'gz') if brotli is not None else ('gz',)
+
+
+def compress(data: bytes, fmt: str) -> bytes:
+    if fmt == 'gz':
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if fmt == 'br' and brotli is not None:
+        return brotli.compress(data, quality=11)
+    raise ValueError(f'Unsupported compression format: {fmt}')
+
+
+def decompress(data: bytes, fmt: str) -> bytes:
+    if fmt == 'gz':
+        return gzip.decompress(data)
+    if fmt == 'br' and brotli is not None:
+        return brotli.decompress(data)
+    raise ValueError(f'Unsupported compression format: {fmt}')
+
+
+def _holds(path: Path, fmt: str, source: bytes) -> bool:
+    try:
+        return decompress(path.read_bytes(), fmt) == source
+    except Exception:  # missing, truncated, or corrupt (gzip and brotli raise different errors)
+        return False
+
+
+def write_compressed_variants(output_dir: Path, name: str) -> List[ArtifactRecord]:
+    """Bring the `.br`/`.gz` siblings of `name` in line with its current bytes.
+
+    Maximum-level compression is slow, so siblings that already decompress to
+    the artifact are kept rather than recompressed. A `.br` left behind by a
+    build that had brotli is removed when this one cannot refresh it.
+    """
+    source = (output_dir / name).read_bytes()
+    formats = compression_formats()
+    records = []
+    for fmt in formats:
+        variant = f'{name}.{fmt}'
+        if _holds(output_dir / variant, fmt, source):
+            records.append(record_existing(output_dir, variant))
+        else:
+            records.append(write_bytes(output_dir, variant, compress(source, fmt)))
+    if 'br' not in formats:
+        (output_dir / f'{name}.br').unlink(missing_ok=True)
+    return records
+
+
+def record_existing(output_dir: Path, name: str) -> ArtifactRecord:
+    """Describe an artifact that was not regenerated in this run."""
+    digest, size = hash_path(output_dir / name)
+    return ArtifactRecord(name, digest, size)
+
+
+class ArtifactStore:
+    """Collects the records of everything written to one output directory in a build."""
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = output_dir
+        self.records: dict[str, ArtifactRecord] = {}
+
+    def add(self, record: ArtifactRecord) -> ArtifactRecord:
+        self.records[record.name] = record
+        return record
+
+    def write(self, name: str, chunks: Iterable[str]) -> ArtifactRecord:
+        return self.add(write_chunks(self.output_dir, name, chunks))
+
+    def write_text(self, name: str, text: str) -> ArtifactRecord:
+        return self.add(write_bytes(self.output_dir, name, text.encode('utf-8')))
+
+    def write_json(self, name: str, data, **dumps_options) -> ArtifactRecord:
+        return self.write_text(name, json.dumps(data, **dumps_options))
+
+    def record(self, name: str) -> ArtifactRecord:
+        """Return the record for `name`, hashing the file on disk if this build did not write it."""
+        if name not in self.records:
+            self.add(record_existing(self.output_dir, name))
+        return self.records[name]
+
+    def sha256(self, names: Iterable[str]) -> dict[str, str]:
+        return {name: self.record(name).sha256 for name in names}
+
+    def changed(self) -> list[str]:
+        return [name for name, record in self.records.items() if record.changed]
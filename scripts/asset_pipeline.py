@@ -0,0 +1,348 @@
+"""
+Content-hashed asset names for a deployable copy of the site (`--site-dir`).
+
+public/ keeps plain names, so the dev server, the tests and the hand-written
+pages stay simple. For deployment, every script, stylesheet, WebAssembly
+binary and lazily fetched HTML fragment gets a name that embeds the SHA-256 of
+its final bytes (`src/state.3f9c2a1b7d.js`), and every reference to it is
+rewritten. A CDN can then serve those files with `Cache-Control: immutable`,
+and a repeat visit revalidates only the entry pages. The entry pages, the
+service worker and the data files keep their names.
+
+A name hashes the rewritten content, which embeds the names of the assets it
+references, so names are assigned dependencies first. Modules that import each
+other in a cycle share one hash taken over all of their sources.
+
+References are recognised in:
+- HTML: any quoted relative URL (attributes, inline module imports, the
+  split-layout fragment map). HTML is resolved against the site root, where
+  the pages live and where docs fragments are inserted.
+- JavaScript: static and dynamic import specifiers, and
+  `new URL('./x', import.meta.url)`, resolved against the module.
+- CSS: `url(...)` and `@import`, resolved against the stylesheet.
+Computed specifiers (`import(variable)`) and document-relative fetches are not
+rewritten, so they must only name files that keep their names.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import posixpath
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Set, Tuple
+
+from artifact_store import compression_formats, write_bytes, write_compressed_variants
+from dist_sync import SyncResult, is_current, place_file, remove_stale
+
+# Entry points: their URLs are what visitors and links know, so they are never renamed.
+PAGES = ('index.html', 'playground.html', 'docs.html', 'TYPE_REFERENCE.html')
+# A service worker is identified by its URL; renaming it would install a second one.
+# The precache manifest is loaded by the worker with importScripts under a fixed name.
+STABLE_NAMES = frozenset({'service-worker-simple.js', 'precache-manifest.js'})
+ASSET_SUFFIXES = ('.js', '.mjs', '.css', '.wasm', '.html')
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+HASH_LENGTH = 10
+
+HTML_REFERENCES = (re.compile(r'''(["'])(?P<url>[^"'\s<>]+)\1'''),)
+JS_REFERENCES = (
+    re.compile(r'''(?:\bfrom\s*|\bimport\s*\(?\s*)(["'])(?P<url>\.{1,2}/[^"'\n]+)\1'''),
+    re.compile(r'''\bnew\s+URL\(\s*(["'])(?P<url>\.{1,2}/[^"'\n]+)\1(?=\s*,\s*import\.meta\.url)'''),
+)
+EXPORT_DECLARATION_RE = re.compile(
+    r'\bexport\s+(?:(?P<default>default)\b|(?:async\s+)?function\s*\*?\s*(?P<function>[\w$]+)'
+    r'|class\s+(?P<class>[\w$]+)|(?:const|let|var)\s+(?P<variable>[\w$]+))'
+)
+EXPORT_LIST_RE = re.compile(r'\bexport\s*\{(?P<names>[^}]*)\}')
+EXPORT_ALL_RE = re.compile(r'''\bexport\s*\*\s*(?:as\s+(?P<namespace>[\w$]+)\s*)?from\s*(["'])(?P<url>[^"']+)\2''')
+CSS_REFERENCES = (
+    re.compile(r'''\burl\(\s*(["']?)(?P<url>[^"')\s]+)\1\s*\)'''),
+    re.compile(r'''@import\s+(["'])(?P<url>[^"']+)\1'''),
+)
+
+
+class AssetPlan(NamedTuple):
+    # Site file (relative, POSIX) -> the file it is read from.
+    sources: Dict[str, Path]
+    # Asset -> its content-hashed name.
+    assets: Dict[str, str]
+    # Pages and assets whose references were rewritten -> their final bytes.
+    rewritten: Dict[str, bytes]
+    # Page or asset -> the assets it references.
+    references: Dict[str, Set[str]]
+
+    def read(self, name: str) -> bytes:
+        """The final bytes of a site file."""
+        if name in self.rewritten:
+            return self.rewritten[name]
+        return self.sources[name].read_bytes()
+
+    def reachable(self, roots: Iterable[str]) -> Set[str]:
+        """`roots` and every asset they load, directly or through other assets."""
+        seen = set()
+        pending = [name for name in roots if name in self.sources]
+        while pending:
+            name = pending.pop()
+            if name not in seen:
+                seen.add(name)
+                pending.extend(self.references.get(name, ()))
+        return seen
+
+
+def is_asset(name: str) -> bool:
+    return name.endswith(ASSET_SUFFIXES) and name not in PAGES and name not in STABLE_NAMES
+
+
+def hashed_name(name: str, digest: str) -> str:
+    stem, suffix = posixpath.splitext(name)
+    if stem.endswith(f'.{digest[:HASH_LENGTH]}'):
+        # Already named after its content (the SDK's WebAssembly binary in public/dist).
+        return name
+    return f'{stem}.{digest[:HASH_LENGTH]}{suffix}'
+
+
+def _reference_rules(name: str) -> tuple:
+    """(patterns, base directory) used to find and resolve the references in `name`."""
+    if name.endswith('.html'):
+        return HTML_REFERENCES, ''
+    if name.endswith(('.js', '.mjs')):
+        return JS_REFERENCES, posixpath.dirname(name)
+    if name.endswith('.css'):
+        return CSS_REFERENCES, posixpath.dirname(name)
+    return (), ''
+
+
+def _resolve(reference: str, base: str, assets: Iterable[str]) -> str | None:
+    if reference.startswith(('/', '#')) or ':' in reference:
+        # Root-relative, in-page, or another scheme (https:, data:, ...).
+        return None
+    path = re.split(r'[?#]', reference, 1)[0]
+    if not path:
+        return None
+    name = posixpath.normpath(posixpath.join(base, path))
+    return name if name in assets else None
+
+
+class _Text:
+    """An asset or page decoded once, with the spans of its references to assets."""
+
+    def __init__(self, name: str, data: bytes, assets: Set[str]):
+        patterns, self.base = _reference_rules(name)
+        self.data = data
+        self.spans = []
+        if not patterns:
+            return
+        try:
+            self.text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            return
+        for pattern in patterns:
+            for match in pattern.finditer(self.text):
+                reference = match.group('url')
+                target = _resolve(reference, self.base, assets)
+                if target is not None:
+                    self.spans.append((match.start('url'), match.end('url'), reference, target))
+        self.spans.sort()
+
+    @property
+    def dependencies(self) -> Set[str]:
+        return {target for _start, _end, _reference, target in self.spans}
+
+    def rewrite(self, names: Dict[str, str]) -> bytes:
+        if not self.spans:
+            return self.data
+        parts = []
+        position = 0
+        for start, end, reference, target in self.spans:
+            path = re.split(r'[?#]', reference, 1)[0]
+            replacement = posixpath.relpath(names[target], self.base or '.')
+            if reference.startswith('./') and not replacement.startswith('.'):
+                replacement = f'./{replacement}'
+            parts += [self.text[position:start], replacement, reference[len(path):]]
+            position = end
+        parts.append(self.text[position:])
+        return ''.join(parts).encode('utf-8')
+
+
+def _strongly_connected(graph: Dict[str, Set[str]]) -> List[List[str]]:
+    """Tarjan's components, dependencies before the assets that reference them."""
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    components = []
+
+    def visit(node: str) -> None:
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        for dependency in sorted(graph[node]):
+            if dependency not in index:
+                visit(dependency)
+                low[node] = min(low[node], low[dependency])
+            elif dependency in on_stack:
+                low[node] = min(low[node], index[dependency])
+        if low[node] == index[node]:
+            component = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.append(member)
+                if member == node:
+                    break
+            components.append(sorted(component))
+
+    for node in sorted(graph):
+        if node not in index:
+            visit(node)
+    return components
+
+
+def site_sources(roots: Sequence[Path]) -> Dict[str, Path]:
+    """Every file of the site; a file in a later root replaces the same name in an earlier one."""
+    sources = {}
+    for root in roots:
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(name for name in dirnames if not name.startswith('.'))
+            for filename in sorted(filenames):
+                if filename.startswith('.'):
+                    continue
+                path = Path(directory) / filename
+                sources[path.relative_to(root).as_posix()] = path
+    return sources
+
+
+def plan_assets(roots: Sequence[Path]) -> AssetPlan:
+    sources = site_sources(roots)
+    assets = {name for name in sources if is_asset(name)}
+    texts = {
+        name: _Text(name, sources[name].read_bytes(), assets)
+        for name in sorted(assets | {page for page in PAGES if page in sources})
+    }
+    names: Dict[str, str] = {}
+    final: Dict[str, bytes] = {}
+    graph = {name: texts[name].dependencies for name in assets}
+    for component in _strongly_connected(graph):
+        if len(component) == 1 and component[0] not in graph[component[0]]:
+            name = component[0]
+            final[name] = texts[name].rewrite(names)
+            names[name] = hashed_name(name, hashlib.sha256(final[name]).hexdigest())
+            continue
+        # A cycle: no member's final bytes are known before the others' names, so
+        # the members share a name hash over all of their sources instead.
+        digest = hashlib.sha256()
+        for name in component:
+            digest.update(name.encode('utf-8') + b'\0' + texts[name].data + b'\0')
+        for dependency in sorted(set().union(*(graph[name] for name in component)) - set(component)):
+            digest.update(names[dependency].encode('utf-8') + b'\0')
+        for name in component:
+            names[name] = hashed_name(name, digest.hexdigest())
+        for name in component:
+            final[name] = texts[name].rewrite(names)
+    for page in PAGES:
+        if page in texts:
+            final[page] = texts[page].rewrite(names)
+    rewritten = {name: data for name, data in final.items() if data is not texts[name].data}
+    references = {name: text.dependencies for name, text in texts.items()}
+    return AssetPlan(sources, dict(sorted(names.items())), rewritten, references)
+
+
+def module_files(root: Path, entry: str) -> List[Tuple[str, int]]:
+    """`entry` and every file it loads through relative imports or `new URL(..., import.meta.url)`.
+
+    Returns (name relative to `root`, size) pairs, `entry` first, or an empty
+    list when `entry` does not exist.
+    """
+    sources = site_sources([root])
+    if entry not in sources:
+        return []
+    loadable = {name for name in sources if name.endswith(('.js', '.mjs', '.wasm'))}
+    ordered: List[str] = []
+    pending = [entry]
+    while pending:
+        name = pending.pop()
+        if name in ordered:
+            continue
+        ordered.append(name)
+        pending.extend(sorted(_Text(name, sources[name].read_bytes(), loadable).dependencies, reverse=True))
+    return [(name, sources[name].stat().st_size) for name in ordered]
+
+
+def module_exports(root: Path, entry: str) -> Set[str] | None:
+    """Names `entry` (relative to `root`) exports, following relative `export * from` re-exports.
+
+    None when they cannot be listed: `entry` is missing, or it re-exports
+    everything from a module outside `root`.
+    """
+    exports: Set[str] = set()
+    seen: Set[str] = set()
+    pending = [(entry, True)]
+    while pending:
+        name, is_entry = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        path = root / name
+        if not path.is_file():
+            return None
+        text = path.read_text(encoding='utf-8', errors='replace')
+        names = set()
+        for match in EXPORT_DECLARATION_RE.finditer(text):
+            names.add(next(value for value in match.groupdict().values() if value))
+        for match in EXPORT_LIST_RE.finditer(text):
+            names.update(
+                specifier.split(' as ')[-1].strip()
+                for specifier in match.group('names').split(',') if specifier.strip()
+            )
+        for match in EXPORT_ALL_RE.finditer(text):
+            if match.group('namespace'):
+                names.add(match.group('namespace'))
+            elif match.group('url').startswith(('./', '../')):
+                target = posixpath.normpath(posixpath.join(posixpath.dirname(name), match.group('url')))
+                pending.append((target, False))
+            else:
+                return None
+        # `export *` passes on every name but `default`.
+        exports.update(names if is_entry else names - {'default'})
+    return exports
+
+
+def write_site(plan: AssetPlan, site_dir: Path) -> SyncResult:
+    """Mirror the planned site into `site_dir`: assets under their hashed names, references rewritten.
+
+    Files that are neither renamed nor rewritten are placed as in dist_sync
+    (hardlinked or cloned when possible); compressed siblings are carried over
+    for them and regenerated for rewritten files.
+    """
+    copied = unchanged = 0
+    expected = set()
+
+    def place(source: Path, target_name: str) -> bool:
+        if is_current(source, site_dir / target_name):
+            return False
+        place_file(source, site_dir / target_name)
+        return True
+
+    for name, source in plan.sources.items():
+        if name.endswith(COMPRESSED_SUFFIXES) and posixpath.splitext(name)[0] in plan.sources:
+            continue
+        target_name = plan.assets.get(name, name)
+        expected.add(target_name)
+        compressed = [name + suffix for suffix in COMPRESSED_SUFFIXES if name + suffix in plan.sources]
+        if name in plan.rewritten:
+            changed = write_bytes(site_dir, target_name, plan.rewritten[name]).changed
+            if compressed:
+                changed |= any(record.changed for record in write_compressed_variants(site_dir, target_name))
+                expected.update(f'{target_name}.{fmt}' for fmt in compression_formats())
+        else:
+            changed = place(source, target_name)
+            for sibling in compressed:
+                sibling_name = target_name + sibling[len(name):]
+                expected.add(sibling_name)
+                changed |= place(plan.sources[sibling], sibling_name)
+        if changed:
+            copied += 1
+        else:
+            unchanged += 1
+    return SyncResult(copied, unchanged, remove_stale(site_dir, expected))
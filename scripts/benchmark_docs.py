@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmarks for the documentation pipeline.
+
+Synthesizes api-definitions.json and operation-catalog inputs at several
+multiples of the committed ones (94 operations and 269 types at 1x). Each copy
+gets suffixed operation keys, SDK method names and type names, with every type
+reference rewritten, so the type-link scan sees N times as many names. The
+benchmark then times and memory-profiles the IR build, the docs.html,
+AI_REFERENCE.md and TYPE_REFERENCE renderers, and the checker's validations.
+No Node process is started.
+
+Timings are the median of several runs. Peak memory comes from a separate
+tracemalloc run, so tracing does not distort the timings. Results are compared
+with benchmarks/docs_pipeline_baseline.json and the run fails when a benchmark
+regresses past the baseline's thresholds. For each benchmark the report also
+prints how time scales between the smallest and largest multiple (1.0 is
+linear). Pass --update-baseline to record a new baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import copy
+import hashlib
+import json
+import math
+import platform
+import re
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import check_documentation as checker
+import generate_docs as g
+from catalog_merkle import catalog_tree
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASELINE_FILE = REPO_ROOT / 'benchmarks' / 'docs_pipeline_baseline.json'
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_THRESHOLDS = {
+    # A benchmark regresses when it is this many times slower (or larger) than
+    # the baseline and the difference is above the noise floor. Steps of a few
+    # milliseconds swing by more than that from run to run on a shared machine.
+    'time_ratio': 1.5,
+    'min_seconds': 0.05,
+    'peak_ratio': 1.25,
+    'min_peak_kib': 256,
+}
+BENCHMARK_SCHEMA = 1
+
+
+def _suffix(name: str, copy_index: int) -> str:
+    return name if copy_index == 0 else f'{name}X{copy_index}'
+
+
+def _method_name(sdk_method: str, copy_index: int) -> str:
+    namespace, separator, method = sdk_method.rpartition('.')
+    return f'{namespace}{separator}{_suffix(method, copy_index)}'
+
+
+def synthesize_inputs(definitions: dict, catalog: dict, scale: int) -> Tuple[dict, dict, dict]:
+    """Return (query definitions, transition definitions, catalog) at `scale` times the originals.
+
+    Copy k renames operation `getIdentity` to `getIdentityXk`, method
+    `identities.fetch` to `identities.fetchXk` and type `Identity` to
+    `IdentityXk`, including every reference to them.
+    """
+    type_names = sorted(catalog['types'], key=len, reverse=True)
+    type_pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, type_names)) + r')\b')
+
+    queries: Dict[str, dict] = {}
+    transitions: Dict[str, dict] = {}
+    operations: List[dict] = []
+    methods: Dict[str, dict] = {}
+    types: Dict[str, dict] = {}
+    for copy_index in range(scale):
+        if copy_index:
+            suffix = f'X{copy_index}'
+            text = type_pattern.sub(lambda match: match.group(0) + suffix, json.dumps(
+                [catalog['operations'], catalog['methods'], catalog['types']]
+            ))
+            copy_operations, copy_methods, copy_types = json.loads(text)
+        else:
+            copy_operations, copy_methods, copy_types = copy.deepcopy(
+                [catalog['operations'], catalog['methods'], catalog['types']]
+            )
+        for operation in copy_operations:
+            operation['key'] = _suffix(operation['key'], copy_index)
+            operation['sdkMethod'] = _method_name(operation['sdkMethod'], copy_index)
+            operations.append(operation)
+        for name, method in copy_methods.items():
+            method['sdkMethod'] = _method_name(name, copy_index)
+            for variant in method['variants']:
+                variant['key'] = _suffix(variant['key'], copy_index)
+            methods[method['sdkMethod']] = method
+        # Type names (the keys included) were already renamed by the substitution above.
+        for name, declaration in copy_types.items():
+            declaration['anchor'] = g.type_anchor(name)
+            types[name] = declaration
+
+        for group, target in (('queries', queries), ('transitions', transitions)):
+            for cat_key, category in definitions[group].items():
+                entries = target.setdefault(cat_key, {**category, group: {}})[group]
+                for item_key, item in (category.get(group) or {}).items():
+                    entries[_suffix(item_key, copy_index)] = {
+                        **item,
+                        'sdk_method': _method_name(item['sdk_method'], copy_index),
+                    }
+
+    synthetic_catalog = {
+        'schemaVersion': catalog['schemaVersion'],
+        'sdk': catalog['sdk'],
+        'operations': operations,
+        'methods': methods,
+        'types': types,
+    }
+    return queries, transitions, synthetic_catalog
+
+
+@contextlib.contextmanager
+def scaled_examples(queries: dict, transitions: dict) -> Iterator[None]:
+    """Give every synthesized operation the example of the operation it was copied from.
+
+    The generator's example tables are restored on exit, so the synthetic
+    operations never leak into later calls in the same process.
+    """
+    base_key = re.compile(r'X\d+$')
+    query_examples = dict(g.QUERY_EXAMPLES)
+    for category in queries.values():
+        for key in category.get('queries') or {}:
+            example = g.QUERY_EXAMPLES.get(base_key.sub('', key))
+            if example:
+                query_examples[key] = example
+    # The transition registry needs Node; a placeholder keeps every transition documented.
+    examples = {}
+    for category in transitions.values():
+        for key, item in (category.get('transitions') or {}).items():
+            examples[key] = (
+                item.get('sdk_example')
+                or g.TRANSITION_FALLBACK_EXAMPLES.get(base_key.sub('', key))
+                or f"await sdk.{item['sdk_method']}(options)"
+            )
+    saved = g.QUERY_EXAMPLES, g.TRANSITION_OPERATION_EXAMPLES
+    g.QUERY_EXAMPLES, g.TRANSITION_OPERATION_EXAMPLES = query_examples, examples
+    try:
+        yield
+    finally:
+        g.QUERY_EXAMPLES, g.TRANSITION_OPERATION_EXAMPLES = saved
+
+
+class Fixture:
+    """Inputs and rendered artifacts for one scale, plus a checker view of them on disk.
+
+    Build and benchmark it inside `scaled_examples` for the same inputs.
+    """
+
+    def __init__(self, scale: int, queries: dict, transitions: dict, catalog: dict, root: Path):
+        self.scale = scale
+        self.queries, self.transitions, self.catalog = queries, transitions, catalog
+        self.ir = g.build_operation_ir(self.queries, self.transitions, self.catalog)
+        self.root = root
+        artifacts = {
+            checker.DOCS_NAME: g.generate_docs_html(self.ir),
+            checker.AI_NAME: g.generate_ai_reference_md(self.ir),
+            checker.TYPE_REFERENCE_NAME: g.generate_type_reference_md(self.catalog),
+            checker.TYPE_REFERENCE_HTML_NAME: g.generate_type_reference_html(self.catalog),
+            checker.CATALOG_NAME: json.dumps(self.catalog, indent=2) + '\n',
+        }
+        for name, text in artifacts.items():
+            (root / name).write_text(text, encoding='utf-8')
+        self.manifest = {
+            'documented_operations': len(self.catalog['operations']),
+            'resolved_sdk_methods': len(self.catalog['methods']),
+            'content_sha256': {
+                name: hashlib.sha256(text.encode('utf-8')).hexdigest() for name, text in artifacts.items()
+            },
+            'catalog_merkle': catalog_tree(self.catalog),
+        }
+
+    def artifacts(self) -> checker.SharedArtifacts:
+        # A fresh view per run, so every run pays for reading what it checks.
+        return checker.SharedArtifacts(self.root)
+
+
+def fresh_type_links() -> None:
+    # Each renderer process builds its own link engine, so include that in the timing.
+    g.TYPE_LINKS = g.TypeLinkEngine()
+
+
+BENCHMARKS: Dict[str, Callable[[Fixture], object]] = {
+    'build_operation_ir': lambda f: g.build_operation_ir(f.queries, f.transitions, f.catalog),
+    'generate_docs_html': lambda f: (fresh_type_links(), g.generate_docs_html(f.ir)),
+    'generate_ai_reference_md': lambda f: (fresh_type_links(), g.generate_ai_reference_md(f.ir)),
+    'generate_type_reference_md': lambda f: (fresh_type_links(), g.generate_type_reference_md(f.catalog)),
+    'generate_type_reference_html': lambda f: (fresh_type_links(), g.generate_type_reference_html(f.catalog)),
+    'check_return_blocks': lambda f: checker.check_return_blocks(f.artifacts(), f.manifest, f.catalog),
+    'check_content_hashes': lambda f: checker.check_content_hashes(f.artifacts(), f.manifest),
+    'check_markdown_anchors': lambda f: checker.check_markdown_anchors(f.artifacts()),
+    'check_html_anchors': lambda f: checker.check_html_anchors(f.artifacts()),
+    'check_catalogs': lambda f: checker.check_catalogs(
+        f.artifacts(), f.manifest, checker.MetadataResult('deep', f.catalog, []),
+    ),
+}
+
+
+def measure(
+    run: Callable[[], object], min_runs: int = 5, min_total: float = 1.0, max_runs: int = 15,
+) -> Tuple[float, float]:
+    """Median wall time of `min_runs` to `max_runs` runs, and the tracemalloc peak (KiB) of one more run.
+
+    Fast steps repeat until they have run for `min_total` seconds; slow ones
+    stop after `min_runs`.
+    """
+    run()  # Warm caches and lazily built tables outside the timings.
+    timings = []
+    while len(timings) < max_runs and (len(timings) < min_runs or sum(timings) < min_total):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return statistics.median(timings), peak / 1024
+
+
+def run_suite(scales: List[int], selected: List[str]) -> dict:
+    definitions = json.loads((g.PUBLIC_DIR / 'api-definitions.json').read_text(encoding='utf-8'))
+    catalog = json.loads((g.PUBLIC_DIR / 'sdk-operation-catalog.json').read_text(encoding='utf-8'))
+    results = {}
+    for scale in scales:
+        queries, transitions, scaled_catalog = synthesize_inputs(definitions, catalog, scale)
+        temp = tempfile.TemporaryDirectory(prefix=f'docs-bench-{scale}x-')
+        with temp as temp_dir, scaled_examples(queries, transitions):
+            fixture = Fixture(scale, queries, transitions, scaled_catalog, Path(temp_dir))
+            entry = {
+                'operations': len(fixture.catalog['operations']),
+                'types': len(fixture.catalog['types']),
+                'benchmarks': {},
+            }
+            print(f"{scale}x: {entry['operations']} operations, {entry['types']} types")
+            for name in selected:
+                seconds, peak_kib = measure(lambda: BENCHMARKS[name](fixture))
+                entry['benchmarks'][name] = {'seconds': round(seconds, 6), 'peak_kib': round(peak_kib, 1)}
+                print(f'  {name:<30} {seconds * 1000:>10.1f} ms {peak_kib:>12.1f} KiB')
+            results[f'{scale}x'] = entry
+    return results
+
+
+def scaling_lines(results: dict) -> List[str]:
+    scales = sorted(results, key=lambda label: int(label[:-1]))
+    if len(scales) < 2:
+        return []
+    low, high = results[scales[0]], results[scales[-1]]
+    size_ratio = high['operations'] / low['operations']
+    lines = [f'Scaling {scales[0]} -> {scales[-1]} (exponent; 1.0 is linear):']
+    for name, measured in high['benchmarks'].items():
+        base = low['benchmarks'].get(name)
+        if not base or base['seconds'] <= 0:
+            continue
+        exponent = math.log(measured['seconds'] / base['seconds']) / math.log(size_ratio)
+        lines.append(f'  {name:<30} {exponent:>5.2f}')
+    return lines
+
+
+def compare(baseline: dict, results: dict) -> List[str]:
+    thresholds = {**DEFAULT_THRESHOLDS, **baseline.get('thresholds', {})}
+    regressions = []
+    for label, entry in results.items():
+        recorded = baseline.get('results', {}).get(label, {}).get('benchmarks', {})
+        for name, measured in entry['benchmarks'].items():
+            base = recorded.get(name)
+            if base is None:
+                continue
+            if (
+                measured['seconds'] > base['seconds'] * thresholds['time_ratio']
+                and measured['seconds'] - base['seconds'] > thresholds['min_seconds']
+            ):
+                regressions.append(
+                    f"{label} {name}: {measured['seconds'] * 1000:.1f} ms vs baseline {base['seconds'] * 1000:.1f} ms"
+                )
+            if (
+                measured['peak_kib'] > base['peak_kib'] * thresholds['peak_ratio']
+                and measured['peak_kib'] - base['peak_kib'] > thresholds['min_peak_kib']
+            ):
+                regressions.append(
+                    f"{label} {name}: peak {measured['peak_kib']:.0f} KiB vs baseline {base['peak_kib']:.0f} KiB"
+                )
+    return regressions
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark the documentation pipeline on synthesized inputs.')
+    parser.add_argument(
+        '--scales',
+        default=','.join(map(str, DEFAULT_SCALES)),
+        help='Comma-separated multiples of the committed inputs (default: 1,10,100).',
+    )
+    parser.add_argument(
+        '--only',
+        metavar='BENCHMARKS',
+        help='Comma-separated benchmarks to run: ' + ', '.join(BENCHMARKS) + '.',
+    )
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE, help='Baseline JSON to compare against.')
+    parser.add_argument('--update-baseline', action='store_true', help='Record these results as the new baseline.')
+    parser.add_argument('--output', type=Path, help='Also write the results of this run to a JSON file.')
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    scales = [int(value) for value in args.scales.split(',') if value.strip()]
+    selected = [name.strip() for name in (args.only or ','.join(BENCHMARKS)).split(',') if name.strip()]
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        raise SystemExit(f"Unknown benchmark {', '.join(unknown)}; choose from: {', '.join(BENCHMARKS)}")
+
+    results = run_suite(scales, selected)
+    for line in scaling_lines(results):
+        print(line)
+
+    try:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        baseline = {}
+    report = {
+        'schema': BENCHMARK_SCHEMA,
+        'thresholds': {**DEFAULT_THRESHOLDS, **baseline.get('thresholds', {})},
+        'environment': {'python': platform.python_version(), 'machine': platform.machine()},
+        'results': results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+    if args.update_baseline:
+        if args.only or set(scales) != set(DEFAULT_SCALES):
+            # Keep the recorded entries this run did not measure.
+            merged = baseline.get('results', {})
+            for label, entry in results.items():
+                merged.setdefault(label, {**entry, 'benchmarks': {}})
+                merged[label].update({key: value for key, value in entry.items() if key != 'benchmarks'})
+                merged[label]['benchmarks'].update(entry['benchmarks'])
+            report['results'] = merged
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+        print(f'Recorded baseline in {args.baseline}')
+        return
+    if not baseline:
+        print(f'No baseline at {args.baseline}; run with --update-baseline to record one.')
+        return
+    regressions = compare(baseline, results)
+    if regressions:
+        print('Regressions against the baseline:')
+        for line in regressions:
+            print(f'  {line}')
+        sys.exit(1)
+    print('No regressions against the baseline.')
+
+
+if __name__ == '__main__':
+    main()
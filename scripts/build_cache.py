@@ -0,0 +1,173 @@
+"""
+Content-addressed build cache for the documentation generator.
+
+`generate_docs.py` fingerprints every file that can influence its output and
+keeps a copy of the generated artifacts under `node_modules/.cache`, keyed by
+that fingerprint. When the inputs are unchanged the generator restores (or
+simply keeps) the artifacts instead of copying the SDK bundle, spawning Node,
+and re-rendering every document.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable
+
+from artifact_store import atomic_copy
+
+# Bump when the cache entry layout changes so stale entries are never reused.
+CACHE_FORMAT_VERSION = 1
+MAX_CACHE_ENTRIES = 5
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_tree(paths: Iterable[Path], root: Path) -> str:
+    """Hash a set of files by relative path and content, independent of walk order."""
+    digest = hashlib.sha256()
+    for path in sorted(paths, key=lambda item: item.relative_to(root).as_posix()):
+        digest.update(path.relative_to(root).as_posix().encode('utf-8') + b'\0')
+        digest.update(hash_file(path).encode('ascii') + b'\n')
+    return digest.hexdigest()
+
+
+def input_patterns(repo_root: Path, api_file: Path) -> dict[str, list[Path]]:
+    """Glob patterns (`**` spans directories) for every input of the documentation build.
+
+    The inputs are the API definitions, the installed Evo SDK and wasm-sdk
+    package metadata (public/dist is built from both), the declaration trees
+    the extractor parses (including the wasm-sdk declarations it follows), the
+    transition-operation registry used to render examples, and every
+    generator/extractor source under scripts/. `generate_docs.py --watch`
+    polls the same patterns, so it rebuilds on exactly what the cache keys on.
+    """
+    node_modules = repo_root / 'node_modules'
+    sdk_root = node_modules / '@dashevo' / 'evo-sdk'
+    wasm_root = node_modules / '@dashevo' / 'wasm-sdk'
+    scripts_dir = repo_root / 'scripts'
+    return {
+        'api_definitions': [api_file],
+        'sdk_package': [sdk_root / 'package.json'],
+        'wasm_sdk_package': [wasm_root / 'package.json'],
+        'sdk_declarations': [sdk_root / 'dist' / '**' / '*.d.ts', wasm_root / 'dist' / '**' / '*.d.ts'],
+        'transition_modules': [repo_root / 'public' / 'src' / 'transitions' / '*.js'],
+        # Every generator module, not a hand-kept list: a helper the generator
+        # imports changes its output as surely as generate_docs.py itself.
+        'generator_sources': [scripts_dir / '*.py', scripts_dir / '*.mjs'],
+    }
+
+
+def matching_files(patterns: Iterable[Path]) -> list[Path]:
+    return sorted({
+        Path(name) for pattern in patterns
+        for name in glob.glob(str(pattern), recursive=True) if os.path.isfile(name)
+    })
+
+
+def input_fingerprints(repo_root: Path, api_file: Path) -> dict[str, str]:
+    """Digest every input of the documentation build (see `input_patterns`)."""
+    return {
+        name: hash_tree(matching_files(patterns), repo_root)
+        for name, patterns in input_patterns(repo_root, api_file).items()
+    }
+
+
+def cache_key(fingerprints: dict[str, str], options: dict | None = None) -> str:
+    payload = {
+        'format': CACHE_FORMAT_VERSION,
+        'inputs': fingerprints,
+        'options': options or {},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class BuildCache:
+    """Directory of `<key>/` entries holding byte-exact copies of generated artifacts."""
+
+    def __init__(self, root: Path, max_entries: int = MAX_CACHE_ENTRIES):
+        self.root = root
+        self.max_entries = max_entries
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def _load_entry(self, key: str) -> dict | None:
+        entry_file = self._entry_dir(key) / 'entry.json'
+        try:
+            entry = json.loads(entry_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if entry.get('key') != key:
+            return None
+        return entry
+
+    def restore(self, key: str, output_dir: Path) -> list[str] | None:
+        """Bring `output_dir` in line with the cached entry for `key`.
+
+        Returns the names of the artifacts that had to be restored (an empty
+        list when everything on disk already matched), or None on a cache miss.
+        """
+        entry = self._load_entry(key)
+        if entry is None:
+            return None
+        entry_dir = self._entry_dir(key)
+        files: dict[str, str] = entry.get('files', {})
+        for name in files:
+            cached = entry_dir / name
+            if not cached.exists() or cached.stat().st_size != entry.get('sizes', {}).get(name):
+                return None
+
+        restored = []
+        for name, expected in files.items():
+            target = output_dir / name
+            if target.exists() and hash_file(target) == expected:
+                continue
+            atomic_copy(entry_dir / name, target)
+            restored.append(name)
+        # Touch the entry so pruning keeps recently used fingerprints.
+        os.utime(entry_dir / 'entry.json')
+        return restored
+
+    def store(self, key: str, output_dir: Path, names: Iterable[str]) -> None:
+        entry_dir = self._entry_dir(key)
+        staging = self.root / f'.{key}.tmp'
+        if staging.exists():
+            shutil.rmtree(staging)
+        staging.mkdir(parents=True)
+        files = {}
+        sizes = {}
+        for name in names:
+            source = output_dir / name
+            target = staging / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, target)
+            files[name] = hash_file(target)
+            sizes[name] = target.stat().st_size
+        (staging / 'entry.json').write_text(
+            json.dumps({'key': key, 'files': files, 'sizes': sizes}, indent=2, sort_keys=True),
+            encoding='utf-8',
+        )
+        if entry_dir.exists():
+            shutil.rmtree(entry_dir)
+        staging.rename(entry_dir)
+        self.prune()
+
+    def prune(self) -> None:
+        entries = [
+            path for path in self.root.iterdir()
+            if path.is_dir() and not path.name.startswith('.') and (path / 'entry.json').exists()
+        ]
+        entries.sort(key=lambda path: (path / 'entry.json').stat().st_mtime, reverse=True)
+        for stale in entries[self.max_entries:]:
+            shutil.rmtree(stale, ignore_errors=True)
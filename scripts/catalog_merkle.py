@@ -0,0 +1,97 @@
+"""
+Merkle tree over the SDK operation catalog.
+
+docs_manifest.json records one leaf hash per operation, SDK method and type
+declaration, a root per section, a hash of the operation order (the sidebar
+and every document list operations in catalog order), and a root for the
+whole catalog. Every
+generated artifact is rendered from this catalog, so comparing a fresh
+extraction's tree with the recorded one tells the checker exactly which
+operations, methods, or types drifted, and a clean check is a single
+root comparison. The generator uses the same diff to summarise what an SDK
+bump changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Dict, List, NamedTuple
+
+TREE_VERSION = 2
+SECTIONS = ('operations', 'methods', 'types')
+
+
+def leaf_hash(value) -> str:
+    canonical = json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def node_hash(children: Dict[str, str]) -> str:
+    digest = hashlib.sha256()
+    for name in sorted(children):
+        digest.update(name.encode('utf-8') + b'\0' + children[name].encode('ascii') + b'\n')
+    return digest.hexdigest()
+
+
+def _section_leaves(catalog: dict, section: str) -> Dict[str, str]:
+    if section == 'operations':
+        return {operation['key']: leaf_hash(operation) for operation in catalog.get('operations', [])}
+    return {name: leaf_hash(value) for name, value in catalog.get(section, {}).items()}
+
+
+def catalog_tree(catalog: dict) -> dict:
+    sections = {}
+    for section in SECTIONS:
+        leaves = _section_leaves(catalog, section)
+        sections[section] = {'root': node_hash(leaves), 'leaves': leaves}
+    header = leaf_hash({'schemaVersion': catalog.get('schemaVersion'), 'sdk': catalog.get('sdk')})
+    # Leaves are keyed by name, so a catalog that only reorders operations needs its own leaf.
+    order = leaf_hash([operation['key'] for operation in catalog.get('operations', [])])
+    root = node_hash({'header': header, 'order': order, **{section: sections[section]['root'] for section in SECTIONS}})
+    return {'version': TREE_VERSION, 'root': root, 'header': header, 'order': order, **sections}
+
+
+class SectionDrift(NamedTuple):
+    added: List[str]
+    removed: List[str]
+    changed: List[str]
+    # Operations only: the same operations, listed in a different order.
+    reordered: bool = False
+
+
+def diff_trees(recorded: dict, current: dict) -> Dict[str, SectionDrift]:
+    """Per-section leaves that differ; sections whose roots match are skipped without visiting leaves."""
+    drift = {}
+    for section in SECTIONS:
+        old = recorded.get(section) or {}
+        new = current.get(section) or {}
+        if old.get('root') and old.get('root') == new.get('root'):
+            continue
+        old_leaves = old.get('leaves', {})
+        new_leaves = new.get('leaves', {})
+        entry = SectionDrift(
+            added=sorted(set(new_leaves) - set(old_leaves)),
+            removed=sorted(set(old_leaves) - set(new_leaves)),
+            changed=sorted(name for name in set(old_leaves) & set(new_leaves) if old_leaves[name] != new_leaves[name]),
+        )
+        if entry.added or entry.removed or entry.changed:
+            drift[section] = entry
+    if recorded.get('order') and current.get('order') and recorded['order'] != current['order']:
+        operations = drift.get('operations')
+        if operations is None:
+            drift['operations'] = SectionDrift([], [], [], reordered=True)
+        elif not operations.added and not operations.removed:
+            drift['operations'] = operations._replace(reordered=True)
+    return drift
+
+
+def describe_drift(drift: Dict[str, SectionDrift]) -> List[str]:
+    lines = []
+    for section, entry in drift.items():
+        for label, names in (('changed', entry.changed), ('added', entry.added), ('removed', entry.removed)):
+            if names:
+                lines.append(f"{section} {label} ({len(names)}): {', '.join(names)}")
+        if entry.reordered:
+            lines.append(f'{section} reordered')
+    return lines
@@ -0,0 +1,143 @@
+"""
+Sharded layout of the SDK operation catalog.
+
+`sdk-operation-catalog.json` holds every operation, method and type
+declaration in one file. Next to it the generator writes `catalog/`:
+
+    catalog/index.json                  operations, namespace table, type table
+    catalog/<namespace>.<hash>.json     methods of one SDK namespace plus every
+                                        type declaration they reach
+
+A client that needs `identities.*` fetches the index and one shard. Shard
+names carry a prefix of their SHA-256, so they can be cached forever; the
+index (small, unhashed) is the only file that has to be revalidated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from artifact_store import ArtifactRecord, write_bytes
+
+CATALOG_DIR = 'catalog'
+INDEX_NAME = f'{CATALOG_DIR}/index.json'
+SHARD_HASH_LENGTH = 16
+INDEX_OPERATION_FIELDS = ('key', 'group', 'category', 'sdkMethod', 'label', 'disabled')
+
+
+def _type_name(reference: str) -> str:
+    # Same normalization the extractor applies to the `types` table keys.
+    return reference[len('wasm.'):] if reference.startswith('wasm.') else reference
+
+
+def _property_references(properties: Iterable[dict]) -> Iterable[str]:
+    for prop in properties or ():
+        yield from prop.get('references', ())
+
+
+def method_references(method: dict) -> Iterable[str]:
+    yield from method.get('references', ())
+    yield from method.get('returnReferences', ())
+    for parameter in method.get('parameters', ()):
+        yield from parameter.get('references', ())
+        yield from _property_references(parameter.get('properties'))
+
+
+def reachable_types(types: dict, roots: Iterable[str]) -> List[str]:
+    """Names of every declaration reachable from `roots`, in sorted order."""
+    seen = set()
+    pending = [_type_name(name) for name in roots]
+    while pending:
+        name = pending.pop()
+        if name in seen or name not in types:
+            continue
+        seen.add(name)
+        declaration = types[name]
+        pending.extend(_type_name(item) for item in declaration.get('references', ()))
+        pending.extend(_type_name(item) for item in _property_references(declaration.get('properties')))
+    return sorted(seen)
+
+
+def method_namespace(sdk_method: str) -> str:
+    return sdk_method.split('.', 1)[0]
+
+
+def encode_shard(data: dict) -> bytes:
+    return json.dumps(data, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def shard_catalog(type_metadata: dict) -> Tuple[dict, Dict[str, bytes]]:
+    """Split the catalog into an index document and `{relative name: bytes}` shards."""
+    types = type_metadata.get('types', {})
+    grouped: Dict[str, Dict[str, dict]] = {}
+    for sdk_method, method in sorted(type_metadata.get('methods', {}).items()):
+        grouped.setdefault(method_namespace(sdk_method), {})[sdk_method] = method
+
+    shards: Dict[str, bytes] = {}
+    namespaces = {}
+    type_shards: Dict[str, List[str]] = {}
+    for namespace, methods in grouped.items():
+        type_names = reachable_types(types, (ref for method in methods.values() for ref in method_references(method)))
+        data = encode_shard({
+            'schemaVersion': type_metadata.get('schemaVersion'),
+            'namespace': namespace,
+            'methods': methods,
+            'types': {name: types[name] for name in type_names},
+        })
+        digest = hashlib.sha256(data).hexdigest()
+        file_name = f'{namespace}.{digest[:SHARD_HASH_LENGTH]}.json'
+        shards[f'{CATALOG_DIR}/{file_name}'] = data
+        namespaces[namespace] = {
+            'file': file_name,
+            'sha256': digest,
+            'size': len(data),
+            'methods': list(methods),
+        }
+        for name in type_names:
+            type_shards.setdefault(name, []).append(namespace)
+
+    index = {
+        'schemaVersion': type_metadata.get('schemaVersion'),
+        'sdk': type_metadata.get('sdk'),
+        'operations': [
+            {field: operation.get(field) for field in INDEX_OPERATION_FIELDS}
+            for operation in type_metadata.get('operations', [])
+        ],
+        'namespaces': namespaces,
+        # Type name -> namespaces whose shard carries its declaration; any one will do.
+        'types': {name: type_shards[name] for name in sorted(type_shards)},
+    }
+    return index, shards
+
+
+def shard_names(index: dict) -> List[str]:
+    return [f"{CATALOG_DIR}/{entry['file']}" for entry in index.get('namespaces', {}).values()]
+
+
+def read_index(output_dir: Path) -> dict:
+    return json.loads((output_dir / INDEX_NAME).read_text(encoding='utf-8'))
+
+
+def prune_stale_shards(output_dir: Path, keep: Iterable[str]) -> None:
+    """Delete shards (and their compressed siblings) that the current index no longer names."""
+    keep_files = {Path(name).name for name in keep} | {Path(INDEX_NAME).name}
+    catalog_dir = output_dir / CATALOG_DIR
+    for path in catalog_dir.glob('*.json*'):
+        base = path.name
+        for suffix in ('.br', '.gz'):
+            if base.endswith(suffix):
+                base = base[:-len(suffix)]
+        if base.endswith('.json') and base not in keep_files:
+            path.unlink(missing_ok=True)
+
+
+def write_catalog_shards(output_dir: Path, type_metadata: dict) -> List[ArtifactRecord]:
+    index, shards = shard_catalog(type_metadata)
+    records = [write_bytes(output_dir, name, data) for name, data in shards.items()]
+    # The index goes last so a reader never sees it point at a shard that isn't there yet.
+    records.append(write_bytes(output_dir, INDEX_NAME, json.dumps(index, separators=(',', ':')).encode('utf-8')))
+    prune_stale_shards(output_dir, shards)
+    return records
@@ -2,29 +2,483 @@
 """
 Check that Evo SDK documentation artifacts are up to date with api-definitions.json
 Outputs a documentation-check-report.txt (similar to wasm-sdk checker) and exits non-zero on errors.
+
+When the input fingerprints recorded in docs_manifest.json still match the
+repository (API definitions, installed SDK, declarations, transition modules,
+generator sources), the committed catalog is trusted as the extraction result
+and Node is not started. Pass --deep to always re-extract and compare.
+
+Every artifact is read at most once and shared between the checks, which run
+on a thread pool while the SDK extraction (when needed) runs alongside them.
+With --profile, each check and the metadata resolution are timed; the summary
+is appended to the report and a Chrome trace is written next to it.
+
+With --reproducible, the generator is run again into a temporary directory
+(under the SOURCE_DATE_EPOCH recorded in the manifest, if any) and every
+artifact must hash the same as the one in public/.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Callable, List, NamedTuple
+import argparse
+import os
 import sys
 import json
 import re
-import subprocess
 import hashlib
+import subprocess
+import tempfile
+import threading
+
+from artifact_store import compression_formats, decompress
+from asset_pipeline import plan_assets
+from build_cache import input_fingerprints
+from catalog_merkle import TREE_VERSION, catalog_tree, describe_drift, diff_trees
+from catalog_shards import INDEX_NAME
+from compact_catalog import COMPACT_CATALOG_NAME, expand_catalog
+from phase_profiler import PhaseProfiler, summary_lines
+from precache_manifest import PRECACHE_MANIFEST_NAME, render_precache_manifest
+from sdk_worker import SdkWorker, SdkWorkerError
+from search_index import SEARCH_INDEX_FORMAT, SEARCH_INDEX_NAME, SEARCH_INDEX_VERSION
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 PUBLIC_DIR = REPO_ROOT / 'public'
+REPORT_FILE = PUBLIC_DIR / 'documentation-check-report.txt'
+PROFILE_TRACE_FILE = REPO_ROOT / 'check-documentation.trace.json'
+GENERATE_TRACE_FILE = REPO_ROOT / 'generate-docs.trace.json'
+PROFILER = PhaseProfiler()
 
+DOCS_NAME = 'docs.html'
+AI_NAME = 'AI_REFERENCE.md'
+TYPE_REFERENCE_NAME = 'TYPE_REFERENCE.md'
+TYPE_REFERENCE_HTML_NAME = 'TYPE_REFERENCE.html'
+CATALOG_NAME = 'sdk-operation-catalog.json'
+MANIFEST_NAME = 'docs_manifest.json'
+DOCS_FRAGMENT_MAP_RE = re.compile(r'<script type="application/json" id="docs-fragment-map">(.*?)</script>')
+DOCS_FRAGMENT_RE = re.compile(r'data-fragment="(docs/[^"]+\.html)"')
+REQUIRED_ARTIFACTS = (
+    DOCS_NAME, AI_NAME, TYPE_REFERENCE_NAME, TYPE_REFERENCE_HTML_NAME, CATALOG_NAME,
+    COMPACT_CATALOG_NAME, INDEX_NAME, SEARCH_INDEX_NAME, MANIFEST_NAME,
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Check that generated Evo SDK documentation is up to date.')
+    parser.add_argument(
+        '--deep',
+        action='store_true',
+        help='Re-extract SDK metadata and compare it even when the recorded input fingerprints match.',
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Maximum checks to run concurrently (default: CPU count).',
+    )
+    parser.add_argument(
+        '--reproducible',
+        action='store_true',
+        help='Regenerate into a temporary directory and require byte-identical artifacts.',
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const=str(PROFILE_TRACE_FILE),
+        metavar='TRACE',
+        help=(
+            'Record wall time, CPU time and peak memory per check; writes a Chrome trace '
+            f'(default: {PROFILE_TRACE_FILE.name}) and appends a summary to the report.'
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+class Findings(NamedTuple):
+    errors: List[str]
+    warnings: List[str]
+
+
+class SharedArtifacts:
+    """Thread-safe, read-once view of the files under public/.
+
+    Each file is read on first use and its bytes, decoded text, and parsed
+    JSON are kept, so the checks running on the pool never read or parse the
+    same artifact twice.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._guard = threading.Lock()
+        self._slots: dict = {}
+
+    def _once(self, key, load):
+        with self._guard:
+            slot = self._slots.setdefault(key, [threading.Lock(), self._MISSING])
+        with slot[0]:
+            if slot[1] is self._MISSING:
+                slot[1] = load()
+            return slot[1]
+
+    def exists(self, name: str) -> bool:
+        return (self.root / name).exists()
+
+    def read_bytes(self, name: str) -> bytes:
+        return self._once(('bytes', name), lambda: (self.root / name).read_bytes())
+
+    def read_text(self, name: str) -> str:
+        return self._once(('text', name), lambda: self.read_bytes(name).decode('utf-8'))
+
+    def read_json(self, name: str):
+        return self._once(('json', name), lambda: json.loads(self.read_bytes(name)))
+
+    def sha256(self, name: str) -> str:
+        return self._once(('sha256', name), lambda: hashlib.sha256(self.read_bytes(name)).hexdigest())
+
+
+class MetadataResult(NamedTuple):
+    mode: str
+    metadata: dict | None
+    errors: List[str]
+
+
+def resolve_metadata(artifacts: SharedArtifacts, manifest: dict, api_file: Path, deep: bool) -> MetadataResult:
+    """Return the SDK metadata to check against: the committed catalog when the
+    recorded input fingerprints still match, otherwise a fresh extraction."""
+    recorded_fingerprints = manifest.get('input_fingerprints')
+    if not deep and recorded_fingerprints is not None:
+        with PROFILER.phase('fingerprint inputs'):
+            fingerprints_match = recorded_fingerprints == input_fingerprints(REPO_ROOT, api_file)
+    else:
+        fingerprints_match = False
+    if fingerprints_match:
+        # Inputs are byte-identical to the generating run, and the content
+        # hash check proves the catalog is what that run wrote.
+        try:
+            return MetadataResult('fast (input fingerprints match)', artifacts.read_json(CATALOG_NAME), [])
+        except Exception as e:
+            return MetadataResult('fast (input fingerprints match)', None, [f'ERROR: Invalid {CATALOG_NAME}: {e}'])
+    try:
+        with SdkWorker(REPO_ROOT) as worker, PROFILER.phase('node: extract SDK types', 'node'):
+            return MetadataResult('deep', worker.call('extract', apiFile=str(api_file)), [])
+    except SdkWorkerError as e:
+        return MetadataResult('deep', None, [f'ERROR: SDK return type extraction failed: {e}'])
+
+
+def check_sdk_version(artifacts: SharedArtifacts, manifest: dict) -> Findings:
+    sdk_package_file = REPO_ROOT / 'node_modules' / '@dashevo' / 'evo-sdk' / 'package.json'
+    if not sdk_package_file.exists():
+        return Findings(['ERROR: Installed @dashevo/evo-sdk package metadata not found'], [])
+    sdk_package = json.loads(sdk_package_file.read_text(encoding='utf-8'))
+    manifest_sdk = manifest.get('sdk_types', {})
+    if manifest_sdk.get('version') != sdk_package.get('version'):
+        return Findings([
+            f"ERROR: Generated return types use SDK {manifest_sdk.get('version')}; "
+            f"installed SDK is {sdk_package.get('version')}"
+        ], [])
+    return Findings([], [])
+
+
+def check_catalogs(artifacts: SharedArtifacts, manifest: dict, result: MetadataResult) -> Findings:
+    """Compare the catalogs with a fresh extraction (deep mode only).
+
+    With a recorded Merkle tree this names the operations, methods, and types
+    that drifted; the committed catalogs are covered by their content hashes.
+    Older manifests without a tree (or with an older tree layout) fall back to
+    whole-catalog equality.
+    """
+    errors = []
+    if result.metadata is None or result.mode != 'deep':
+        return Findings(errors, [])
+    recorded_tree = manifest.get('catalog_merkle')
+    if recorded_tree and recorded_tree.get('version') == TREE_VERSION:
+        current_tree = catalog_tree(result.metadata)
+        if current_tree['root'] == recorded_tree.get('root'):
+            return Findings(errors, [])
+        drift = describe_drift(diff_trees(recorded_tree, current_tree))
+        if not drift:
+            drift = ['catalog schema version or SDK metadata changed']
+        errors.append('ERROR: SDK operation catalog differs from installed declarations; run yarn generate')
+        errors.extend(f'  - {line}' for line in drift)
+        return Findings(errors, [])
+    try:
+        catalog = artifacts.read_json(CATALOG_NAME)
+    except Exception as e:
+        errors.append(f'ERROR: Invalid {CATALOG_NAME}: {e}')
+    else:
+        if catalog != result.metadata:
+            errors.append('ERROR: SDK operation catalog differs from installed declarations; run yarn generate')
+    try:
+        compact_catalog = expand_catalog(artifacts.read_json(COMPACT_CATALOG_NAME))
+    except Exception as e:
+        errors.append(f'ERROR: Invalid {COMPACT_CATALOG_NAME}: {e}')
+    else:
+        if compact_catalog != result.metadata:
+            errors.append(f'ERROR: {COMPACT_CATALOG_NAME} differs from installed declarations; run yarn generate')
+    return Findings(errors, [])
+
+
+def check_catalog_index(artifacts: SharedArtifacts, metadata: dict) -> Findings:
+    errors = []
+    try:
+        catalog_index = artifacts.read_json(INDEX_NAME)
+    except Exception as e:
+        return Findings([f'ERROR: Invalid {INDEX_NAME}: {e}'], [])
+    namespaces = catalog_index.get('namespaces', {})
+    sharded_methods = {method for entry in namespaces.values() for method in entry.get('methods', [])}
+    if sharded_methods != set(metadata.get('methods', {})) or set(catalog_index.get('types', {})) != set(metadata.get('types', {})):
+        errors.append(f'ERROR: {INDEX_NAME} does not cover the extracted methods and types; run yarn generate')
+    for entry in namespaces.values():
+        if not artifacts.exists(f"catalog/{entry['file']}"):
+            errors.append(f"ERROR: Missing catalog shard catalog/{entry['file']}; run yarn generate")
+    return Findings(errors, [])
+
+
+def docs_html_text(artifacts: SharedArtifacts) -> str:
+    """docs.html, followed by the category fragments a split-layout shell loads."""
+    shell = artifacts.read_text(DOCS_NAME)
+    fragments = [name for name in DOCS_FRAGMENT_RE.findall(shell) if artifacts.exists(name)]
+    return ''.join([shell, *(artifacts.read_text(name) for name in fragments)])
+
+
+def check_search_index(artifacts: SharedArtifacts) -> Findings:
+    """The search index covers the catalog's operations and its postings line up with its terms."""
+    try:
+        index = artifacts.read_json(SEARCH_INDEX_NAME)
+        catalog_index = artifacts.read_json(INDEX_NAME)
+    except Exception as e:
+        return Findings([f'ERROR: Invalid {SEARCH_INDEX_NAME}: {e}'], [])
+    if (index.get('format'), index.get('version')) != (SEARCH_INDEX_FORMAT, SEARCH_INDEX_VERSION):
+        return Findings([f'ERROR: {SEARCH_INDEX_NAME} has an unsupported format; run yarn generate'], [])
+    errors = []
+    indexed = {(group, category, key) for group, category, key, _label, _anchor in index['operations']}
+    catalogued = {(entry['group'], entry['category'], entry['key']) for entry in catalog_index.get('operations', [])}
+    if indexed != catalogued:
+        errors.append(f'ERROR: {SEARCH_INDEX_NAME} does not cover the catalog operations; run yarn generate')
+    if len(index['terms']) != len(index['postings']) or index['terms'] != sorted(index['terms']):
+        errors.append(f'ERROR: {SEARCH_INDEX_NAME} terms and postings are inconsistent; run yarn generate')
+    return Findings(errors, [])
 
-def main():
-    api_file = PUBLIC_DIR / 'api-definitions.json'
 
-    docs_file = PUBLIC_DIR / 'docs.html'
-    ai_file = PUBLIC_DIR / 'AI_REFERENCE.md'
-    type_reference_file = PUBLIC_DIR / 'TYPE_REFERENCE.md'
-    type_reference_html_file = PUBLIC_DIR / 'TYPE_REFERENCE.html'
-    manifest_file = PUBLIC_DIR / 'docs_manifest.json'
-    catalog_file = PUBLIC_DIR / 'sdk-operation-catalog.json'
+def check_docs_fragments(artifacts: SharedArtifacts, manifest: dict) -> Findings:
+    """In the split layout, every placeholder's fragment exists and every deep link resolves."""
+    shell = artifacts.read_text(DOCS_NAME)
+    fragments = DOCS_FRAGMENT_RE.findall(shell)
+    if not fragments:
+        return Findings([], [])
+    errors = []
+    listed = set(manifest.get('files', []))
+    for name in fragments:
+        if not artifacts.exists(name):
+            errors.append(f'ERROR: Missing docs fragment {name}; run yarn generate')
+        elif name not in listed:
+            errors.append(f'ERROR: Docs fragment {name} is not listed in {MANIFEST_NAME}; run yarn generate')
+    match = DOCS_FRAGMENT_MAP_RE.search(shell)
+    if match is None:
+        return Findings(errors + [f'ERROR: {DOCS_NAME} has fragments but no docs-fragment-map'], [])
+    unresolved = sorted(
+        anchor for anchor, name in json.loads(match.group(1)).items()
+        if name not in fragments or not artifacts.exists(name) or f'id="{anchor}"' not in artifacts.read_text(name)
+    )
+    if unresolved:
+        errors.append(f"ERROR: Deep links not found in their docs fragments: {', '.join(unresolved)}")
+    return Findings(errors, [])
+
+
+def check_return_blocks(artifacts: SharedArtifacts, manifest: dict, metadata: dict) -> Findings:
+    errors = []
+    expected_operations = len(metadata.get('operations', []))
+    expected_methods = len(metadata.get('methods', {}))
+    if manifest.get('documented_operations') != expected_operations:
+        errors.append('ERROR: Documentation manifest operation count does not match extracted metadata')
+    if manifest.get('resolved_sdk_methods') != expected_methods:
+        errors.append('ERROR: Documentation manifest method count does not match extracted metadata')
+    if docs_html_text(artifacts).count('<div class="returns">') != expected_operations:
+        errors.append(f'ERROR: {DOCS_NAME} must contain return blocks for all {expected_operations} operations')
+    if artifacts.read_text(AI_NAME).count('\nReturns:\n') != expected_operations:
+        errors.append(f'ERROR: {AI_NAME} must contain return blocks for all {expected_operations} operations')
+    return Findings(errors, [])
+
+
+def check_content_hashes(artifacts: SharedArtifacts, manifest: dict) -> Findings:
+    errors = []
+    for name, expected_hash in manifest.get('content_sha256', {}).items():
+        if artifacts.exists(name) and artifacts.sha256(name) != expected_hash:
+            errors.append(f'ERROR: {name} differs from the generated manifest; run yarn generate')
+    return Findings(errors, [])
+
+
+def check_compressed(artifacts: SharedArtifacts, manifest: dict) -> Findings:
+    errors = []
+    warnings = []
+    available_formats = compression_formats()
+    for name, variants in manifest.get('compressed', {}).items():
+        if not artifacts.exists(name):
+            continue
+        for fmt, expected in variants.items():
+            variant = f'{name}.{fmt}'
+            if not artifacts.exists(variant):
+                errors.append(f'ERROR: Missing precompressed {Path(variant).name}; run yarn generate')
+                continue
+            data = artifacts.read_bytes(variant)
+            if len(data) != expected.get('size') or hashlib.sha256(data).hexdigest() != expected.get('sha256'):
+                errors.append(f'ERROR: {Path(variant).name} differs from the generated manifest; run yarn generate')
+            elif fmt not in available_formats:
+                warnings.append(f'WARNING: Cannot decompress {Path(variant).name} to verify it (install brotli)')
+            else:
+                try:
+                    matches = decompress(data, fmt) == artifacts.read_bytes(name)
+                except Exception:
+                    matches = False
+                if not matches:
+                    errors.append(f'ERROR: {Path(variant).name} does not decompress to {name}; run yarn generate')
+    return Findings(errors, warnings)
+
+
+def check_asset_map(manifest: dict) -> Findings:
+    """The content-hashed asset names and the precache manifest match the files in public/ now."""
+    recorded = manifest.get('assets')
+    if recorded is None:
+        return Findings([f'ERROR: {MANIFEST_NAME} has no asset map; run yarn generate'], [])
+    plan = plan_assets([PUBLIC_DIR])
+    errors = []
+    current = plan.assets
+    stale = sorted(name for name in current.keys() | recorded.keys() if current.get(name) != recorded.get(name))
+    if stale:
+        listed = ', '.join(stale[:10]) + (f' and {len(stale) - 10} more' if len(stale) > 10 else '')
+        errors.append(f'ERROR: Asset fingerprints in {MANIFEST_NAME} are stale for {listed}; run yarn generate')
+    version, text = render_precache_manifest(plan, fingerprinted=False)
+    precache_path = PUBLIC_DIR / PRECACHE_MANIFEST_NAME
+    if not precache_path.exists() or precache_path.read_text(encoding='utf-8') != text:
+        errors.append(f'ERROR: {PRECACHE_MANIFEST_NAME} is missing or stale (cache version {version}); run yarn generate')
+    return Findings(errors, [])
+
+
+def check_markdown_anchors(artifacts: SharedArtifacts) -> Findings:
+    linked_anchors = set(re.findall(r'TYPE_REFERENCE\.md#(type-[a-z0-9-]+)', artifacts.read_text(AI_NAME)))
+    declared_anchors = set(re.findall(r'<a id="(type-[a-z0-9-]+)"></a>', artifacts.read_text(TYPE_REFERENCE_NAME)))
+    missing_anchors = sorted(linked_anchors - declared_anchors)
+    if missing_anchors:
+        return Findings([f"ERROR: Missing return type anchors: {', '.join(missing_anchors)}"], [])
+    return Findings([], [])
+
+
+def check_html_anchors(artifacts: SharedArtifacts) -> Findings:
+    linked_anchors = set(re.findall(r'TYPE_REFERENCE\.html#(type-[a-z0-9-]+)', docs_html_text(artifacts)))
+    declared_anchors = set(re.findall(r'id="(type-[a-z0-9-]+)"', artifacts.read_text(TYPE_REFERENCE_HTML_NAME)))
+    missing_anchors = sorted(linked_anchors - declared_anchors)
+    if missing_anchors:
+        return Findings([f"ERROR: Missing HTML return type anchors: {', '.join(missing_anchors)}"], [])
+    return Findings([], [])
+
+
+def check_reproducible(artifacts: SharedArtifacts, manifest: dict, api_file: Path, jobs: int) -> Findings:
+    warnings = []
+    names = list(manifest.get('files', []))
+    names += [f'{name}.{fmt}' for name, variants in manifest.get('compressed', {}).items() for fmt in variants]
+    env = dict(os.environ)
+    epoch = manifest.get('source_date_epoch')
+    if epoch is None:
+        env.pop('SOURCE_DATE_EPOCH', None)
+        # The precache version covers version-info.json, so it moves with the build time too.
+        names = [name for name in names if name not in ('version-info.json', PRECACHE_MANIFEST_NAME)]
+        warnings.append(
+            f'WARNING: {MANIFEST_NAME} was not generated under SOURCE_DATE_EPOCH; '
+            f'skipping it, version-info.json and {PRECACHE_MANIFEST_NAME} in the reproducibility check'
+        )
+    else:
+        env['SOURCE_DATE_EPOCH'] = str(epoch)
+        names.append(MANIFEST_NAME)
+
+    with tempfile.TemporaryDirectory(prefix='evo-docs-reproducible-') as output_dir:
+        command = [
+            sys.executable, str(REPO_ROOT / 'scripts' / 'generate_docs.py'),
+            '--output-dir', output_dir, '--no-cache', '--jobs', str(jobs),
+            '--docs-layout', manifest.get('docs_layout', 'single'),
+        ]
+        with PROFILER.phase('regenerate into temporary directory'):
+            result = subprocess.run(command, cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+        if result.returncode != 0:
+            tail = '\n'.join(result.stderr.strip().splitlines()[-5:])
+            return Findings([f'ERROR: Regenerating for the reproducibility check failed:\n{tail}'], warnings)
+        regenerated = SharedArtifacts(Path(output_dir))
+        differing = [
+            name for name in names
+            if not artifacts.exists(name) or not regenerated.exists(name)
+            or artifacts.sha256(name) != regenerated.sha256(name)
+        ]
+    if not differing:
+        return Findings([], warnings)
+    if manifest.get('input_fingerprints') == input_fingerprints(REPO_ROOT, api_file):
+        problem = 'is not reproducible: regenerating from the same inputs changed'
+    else:
+        problem = 'is stale: regenerating from the current inputs changed'
+    return Findings([f"ERROR: The documentation {problem} {', '.join(sorted(differing))}"], warnings)
+
+
+def _run_check(check: Callable[..., Findings], *args) -> Findings:
+    try:
+        with PROFILER.phase(check.__name__, 'check'):
+            return check(*args)
+    except Exception as e:
+        return Findings([f'ERROR: {check.__name__} failed: {e}'], [])
+
+
+def _resolve_metadata_timed(*args) -> MetadataResult:
+    with PROFILER.phase('resolve metadata'):
+        return resolve_metadata(*args)
+
+
+def run_checks(
+    artifacts: SharedArtifacts,
+    manifest: dict,
+    api_file: Path,
+    deep: bool,
+    reproducible: bool,
+    jobs: int,
+) -> tuple[str, Findings]:
+    """Run every check concurrently; the findings keep a fixed report order."""
+    with ThreadPoolExecutor(max_workers=max(2, jobs)) as pool:
+        # Submitted first so it owns a worker before any check blocks on it.
+        metadata_future: Future = pool.submit(_resolve_metadata_timed, artifacts, manifest, api_file, deep)
+
+        def with_metadata(check: Callable[..., Findings], *args) -> Callable[[], Findings]:
+            def run() -> Findings:
+                result = metadata_future.result()
+                if result.metadata is None:
+                    return Findings([], [])
+                return _run_check(check, *args, result.metadata)
+            return run
+
+        futures = [
+            pool.submit(_run_check, check_sdk_version, artifacts, manifest),
+            pool.submit(lambda: Findings(metadata_future.result().errors, [])),
+            pool.submit(lambda: _run_check(check_catalogs, artifacts, manifest, metadata_future.result())),
+            pool.submit(with_metadata(check_catalog_index, artifacts)),
+            pool.submit(with_metadata(check_return_blocks, artifacts, manifest)),
+            pool.submit(_run_check, check_content_hashes, artifacts, manifest),
+            pool.submit(_run_check, check_compressed, artifacts, manifest),
+            pool.submit(_run_check, check_asset_map, manifest),
+            pool.submit(_run_check, check_markdown_anchors, artifacts),
+            pool.submit(_run_check, check_html_anchors, artifacts),
+            pool.submit(_run_check, check_docs_fragments, artifacts, manifest),
+            pool.submit(_run_check, check_search_index, artifacts),
+        ]
+        if reproducible:
+            futures.append(pool.submit(_run_check, check_reproducible, artifacts, manifest, api_file, jobs))
+        findings = [future.result() for future in futures]
+    return metadata_future.result().mode, Findings(
+        [error for item in findings for error in item.errors],
+        [warning for item in findings for warning in item.warnings],
+    )
+
+
+def check(args: argparse.Namespace) -> tuple[str, List[str], List[str]]:
+    api_file = PUBLIC_DIR / 'api-definitions.json'
+    mode = 'deep'
 
     errors = []
     warnings = []
@@ -32,100 +486,31 @@ def main():
     if not api_file.exists():
         errors.append(f"ERROR: api-definitions.json not found at {api_file}")
 
-    for f in (docs_file, ai_file, type_reference_file, type_reference_html_file, catalog_file, manifest_file):
-        if not f.exists():
-            errors.append(f"ERROR: Missing {f.name}. Run: python3 scripts/generate_docs.py")
+    artifacts = SharedArtifacts(PUBLIC_DIR)
+    for name in REQUIRED_ARTIFACTS:
+        if not artifacts.exists(name):
+            errors.append(f"ERROR: Missing {Path(name).name}. Run: python3 scripts/generate_docs.py")
 
-    if not errors and manifest_file.exists():
+    if not errors:
         try:
-            manifest = json.loads(manifest_file.read_text(encoding='utf-8'))
+            with PROFILER.phase('read manifest'):
+                manifest = artifacts.read_json(MANIFEST_NAME)
         except Exception as e:
-            errors.append(f"ERROR: Invalid docs_manifest.json: {e}")
+            errors.append(f"ERROR: Invalid {MANIFEST_NAME}: {e}")
         else:
-            sdk_package_file = REPO_ROOT / 'node_modules' / '@dashevo' / 'evo-sdk' / 'package.json'
-            if not sdk_package_file.exists():
-                errors.append('ERROR: Installed @dashevo/evo-sdk package metadata not found')
-            else:
-                sdk_package = json.loads(sdk_package_file.read_text(encoding='utf-8'))
-                manifest_sdk = manifest.get('sdk_types', {})
-                if manifest_sdk.get('version') != sdk_package.get('version'):
-                    errors.append(
-                        f"ERROR: Generated return types use SDK {manifest_sdk.get('version')}; "
-                        f"installed SDK is {sdk_package.get('version')}"
-                    )
-
-            extractor = REPO_ROOT / 'scripts' / 'extract_sdk_types.mjs'
-            extracted = subprocess.run(
-                ['node', str(extractor), '--api', str(api_file)],
-                cwd=REPO_ROOT,
-                capture_output=True,
-                text=True,
-            )
-            if extracted.returncode != 0:
-                errors.append(f'ERROR: SDK return type extraction failed: {extracted.stderr.strip()}')
-                metadata = None
-            else:
-                metadata = json.loads(extracted.stdout)
+            mode, findings = run_checks(artifacts, manifest, api_file, args.deep, args.reproducible, args.jobs)
+            errors.extend(findings.errors)
+            warnings.extend(findings.warnings)
+    return mode, errors, warnings
 
-            if metadata is not None:
-                try:
-                    catalog = json.loads(catalog_file.read_text(encoding='utf-8'))
-                except Exception as e:
-                    errors.append(f'ERROR: Invalid sdk-operation-catalog.json: {e}')
-                else:
-                    if catalog != metadata:
-                        errors.append('ERROR: SDK operation catalog differs from installed declarations; run yarn generate')
-
-                expected_operations = len(metadata.get('operations', []))
-                expected_methods = len(metadata.get('methods', {}))
-                if manifest.get('documented_operations') != expected_operations:
-                    errors.append('ERROR: Documentation manifest operation count does not match extracted metadata')
-                if manifest.get('resolved_sdk_methods') != expected_methods:
-                    errors.append('ERROR: Documentation manifest method count does not match extracted metadata')
-
-                docs_text = docs_file.read_text(encoding='utf-8')
-                ai_text = ai_file.read_text(encoding='utf-8')
-                if docs_text.count('<div class="returns">') != expected_operations:
-                    errors.append(
-                        f'ERROR: docs.html must contain return blocks for all {expected_operations} operations'
-                    )
-                if ai_text.count('\nReturns:\n') != expected_operations:
-                    errors.append(
-                        f'ERROR: AI_REFERENCE.md must contain return blocks for all {expected_operations} operations'
-                    )
-
-            for name, expected_hash in manifest.get('content_sha256', {}).items():
-                artifact = PUBLIC_DIR / name
-                if not artifact.exists():
-                    continue
-                actual_hash = hashlib.sha256(artifact.read_bytes()).hexdigest()
-                if actual_hash != expected_hash:
-                    errors.append(f'ERROR: {name} differs from the generated manifest; run yarn generate')
-
-            if ai_file.exists() and type_reference_file.exists():
-                ai_text = ai_file.read_text(encoding='utf-8')
-                type_text = type_reference_file.read_text(encoding='utf-8')
-                linked_anchors = set(re.findall(r'TYPE_REFERENCE\.md#(type-[a-z0-9-]+)', ai_text))
-                declared_anchors = set(re.findall(r'<a id="(type-[a-z0-9-]+)"></a>', type_text))
-                missing_anchors = sorted(linked_anchors - declared_anchors)
-                if missing_anchors:
-                    errors.append(f"ERROR: Missing return type anchors: {', '.join(missing_anchors)}")
-
-            if docs_file.exists() and type_reference_html_file.exists():
-                docs_text = docs_file.read_text(encoding='utf-8')
-                type_html = type_reference_html_file.read_text(encoding='utf-8')
-                linked_anchors = set(re.findall(r'TYPE_REFERENCE\.html#(type-[a-z0-9-]+)', docs_text))
-                declared_anchors = set(re.findall(r'id="(type-[a-z0-9-]+)"', type_html))
-                missing_anchors = sorted(linked_anchors - declared_anchors)
-                if missing_anchors:
-                    errors.append(f"ERROR: Missing HTML return type anchors: {', '.join(missing_anchors)}")
-
-    # Compose report
+
+def report_lines(mode: str, errors: List[str], warnings: List[str]) -> List[str]:
     lines = [
         '=' * 80,
         'Evo SDK Documentation Check',
         '=' * 80,
         f'Timestamp: {datetime.now().isoformat()}',
+        f'Mode: {mode}',
         ''
     ]
     if not errors and not warnings:
@@ -142,10 +527,37 @@ def main():
     lines.append('=' * 80)
     if errors:
         lines.append('\nTo fix these errors, run: python3 scripts/generate_docs.py')
+    return lines
+
+
+def profile_summary() -> List[str]:
+    lines = summary_lines(PROFILER.events, f'Profile: check_documentation.py ({datetime.now().isoformat()})')
+    try:
+        generate_trace = json.loads(GENERATE_TRACE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return lines
+    # The report is rewritten on every check, so carry the latest generator profile along.
+    recorded = datetime.fromtimestamp(GENERATE_TRACE_FILE.stat().st_mtime).isoformat()
+    return lines + [''] + summary_lines(
+        generate_trace.get('traceEvents', []),
+        f'Profile: generate_docs.py (from {GENERATE_TRACE_FILE.name}, {recorded})',
+    )
+
+
+def main(argv=None):
+    global PROFILER
+    args = parse_args(argv)
+    PROFILER = PhaseProfiler(args.profile is not None, 'check_documentation.py')
+    with PROFILER.phase('check_documentation.py', 'run'):
+        mode, errors, warnings = check(args)
+    lines = report_lines(mode, errors, warnings)
+    if args.profile is not None:
+        PROFILER.write_trace(Path(args.profile))
+        lines += ['', *profile_summary(), '', f'Trace: {Path(args.profile).name}']
 
     report = '\n'.join(lines)
     print(report)
-    (PUBLIC_DIR / 'documentation-check-report.txt').write_text(report, encoding='utf-8')
+    REPORT_FILE.write_text(report, encoding='utf-8')
 
     sys.exit(1 if errors else 0)
 
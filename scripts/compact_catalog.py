@@ -0,0 +1,239 @@
+"""
+Compact encoding of the SDK operation catalog.
+
+`sdk-operation-catalog.compact.json` carries the same information as
+`sdk-operation-catalog.json` without the redundancy:
+
+- recurring names (type expressions, referenced type names, parameter and
+  property names, declaration kinds, source files, groups, categories) are
+  interned in one `strings` table and referenced by index;
+- operations point at their method by index instead of repeating its
+  signature, parameters, return type and references, and method `variants`
+  are rebuilt from the operations that point at them;
+- records are positional arrays, anchors that follow the usual `type-<name>`
+  rule are omitted, and the file is written without whitespace.
+
+`expand_catalog` (and `expandCatalog` in public/src/compact-catalog.js)
+turns it back into the regular schema, key order included.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, List
+
+COMPACT_CATALOG_NAME = 'sdk-operation-catalog.compact.json'
+COMPACT_FORMAT = 'evo-sdk-catalog-compact'
+COMPACT_FORMAT_VERSION = 1
+
+PARAMETER_OPTIONAL = 1
+PARAMETER_REST = 2
+
+
+def default_anchor(name: str) -> str:
+    return 'type-' + re.sub(r'[^a-z0-9]+', '-', name.replace('wasm.', '').lower()).strip('-')
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def __call__(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def many(self, values) -> List[int]:
+        return [self(value) for value in values]
+
+
+def _encode_properties(properties: List[dict], intern: _StringTable) -> List[list]:
+    return [
+        [intern(prop['name']), intern(prop['type']), int(prop['optional']), prop['description'], intern.many(prop['references'])]
+        for prop in properties
+    ]
+
+
+def _encode_parameter(parameter: dict, intern: _StringTable) -> list:
+    flags = (PARAMETER_OPTIONAL if parameter['optional'] else 0) | (PARAMETER_REST if parameter['rest'] else 0)
+    return [
+        intern(parameter['name']),
+        intern(parameter['type']),
+        flags,
+        parameter['description'],
+        intern.many(parameter['references']),
+        _encode_properties(parameter['properties'], intern),
+    ]
+
+
+def encode_catalog(catalog: dict) -> dict:
+    """Build the compact form of `catalog`; raises ValueError if it cannot round-trip."""
+    intern = _StringTable()
+    method_names = list(catalog['methods'])
+    method_index = {name: index for index, name in enumerate(method_names)}
+
+    methods = []
+    for name in method_names:
+        method = catalog['methods'][name]
+        if method['references'] != method['returnReferences']:
+            raise ValueError(f'{name}: references differ from returnReferences')
+        methods.append([
+            method['sdkMethod'],
+            method['signature'],
+            method['description'],
+            [_encode_parameter(parameter, intern) for parameter in method['parameters']],
+            intern(method['returnType']),
+            intern.many(method['returnReferences']),
+            intern(method['source']),
+        ])
+
+    operations = []
+    variants: Dict[str, List[dict]] = {}
+    for operation in catalog['operations']:
+        method = catalog['methods'].get(operation['sdkMethod'])
+        if method is None:
+            raise ValueError(f"{operation['key']}: unknown SDK method {operation['sdkMethod']}")
+        for field in ('signature', 'parameters', 'returnType', 'references'):
+            if operation[field] != method[field]:
+                raise ValueError(f"{operation['key']}: {field} differs from {operation['sdkMethod']}")
+        variants.setdefault(operation['sdkMethod'], []).append(
+            {'key': operation['key'], 'group': operation['group'], 'category': operation['category']}
+        )
+        operations.append([
+            operation['key'],
+            intern(operation['group']),
+            intern(operation['category']),
+            method_index[operation['sdkMethod']],
+            operation['label'],
+            operation['description'],
+            operation['disabled'],
+        ])
+    for name, method in catalog['methods'].items():
+        if method['variants'] != variants.get(name, []):
+            raise ValueError(f'{name}: variants do not match the operations that use it')
+
+    types = []
+    for name, declaration in catalog['types'].items():
+        anchor = declaration['anchor']
+        types.append([
+            name,
+            intern(declaration['kind']),
+            None if anchor == default_anchor(name) else anchor,
+            declaration['declaration'],
+            _encode_properties(declaration['properties'], intern),
+            intern.many(declaration['references']),
+            intern(declaration['source']),
+        ])
+
+    return {
+        'format': COMPACT_FORMAT,
+        'formatVersion': COMPACT_FORMAT_VERSION,
+        'schemaVersion': catalog['schemaVersion'],
+        'sdk': catalog['sdk'],
+        'strings': intern.strings,
+        'operations': operations,
+        'methods': methods,
+        'types': types,
+    }
+
+
+def dumps_compact(compact: dict) -> str:
+    return json.dumps(compact, separators=(',', ':'), ensure_ascii=False)
+
+
+def _expand_properties(properties: List[list], strings: List[str]) -> List[dict]:
+    return [
+        {
+            'name': strings[name],
+            'type': strings[type_],
+            'optional': bool(optional),
+            'description': description,
+            'references': [strings[item] for item in references],
+        }
+        for name, type_, optional, description, references in properties
+    ]
+
+
+def _expand_parameters(parameters: List[list], strings: List[str]) -> List[dict]:
+    return [
+        {
+            'name': strings[name],
+            'type': strings[type_],
+            'optional': bool(flags & PARAMETER_OPTIONAL),
+            'rest': bool(flags & PARAMETER_REST),
+            'description': description,
+            'references': [strings[item] for item in references],
+            'properties': _expand_properties(properties, strings),
+        }
+        for name, type_, flags, description, references, properties in parameters
+    ]
+
+
+def expand_catalog(compact: dict) -> dict:
+    """Rebuild the regular catalog schema from its compact encoding."""
+    if compact.get('format') != COMPACT_FORMAT or compact.get('formatVersion') != COMPACT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported compact catalog format {compact.get('format')!r} v{compact.get('formatVersion')!r}")
+    strings = compact['strings']
+    methods = compact['methods']
+
+    operations = []
+    variants: List[List[dict]] = [[] for _ in methods]
+    for key, group, category, method_ref, label, description, disabled in compact['operations']:
+        sdk_method, signature, _, parameters, return_type, return_references, _ = methods[method_ref]
+        variants[method_ref].append({'key': key, 'group': strings[group], 'category': strings[category]})
+        operations.append({
+            'key': key,
+            'group': strings[group],
+            'category': strings[category],
+            'sdkMethod': sdk_method,
+            'label': label,
+            'description': description,
+            'disabled': disabled,
+            'signature': signature,
+            'parameters': _expand_parameters(parameters, strings),
+            'returnType': strings[return_type],
+            'references': [strings[item] for item in return_references],
+        })
+
+    expanded_methods = {}
+    for index, (sdk_method, signature, description, parameters, return_type, return_references, source) in enumerate(methods):
+        expanded_methods[sdk_method] = {
+            'sdkMethod': sdk_method,
+            'signature': signature,
+            'description': description,
+            'parameters': _expand_parameters(parameters, strings),
+            'returnType': strings[return_type],
+            'returnReferences': [strings[item] for item in return_references],
+            'references': [strings[item] for item in return_references],
+            'variants': variants[index],
+            'source': strings[source],
+        }
+
+    types = {}
+    for name, kind, anchor, declaration, properties, references, source in compact['types']:
+        types[name] = {
+            'kind': strings[kind],
+            'anchor': default_anchor(name) if anchor is None else anchor,
+            'declaration': declaration,
+            'properties': _expand_properties(properties, strings),
+            'references': [strings[item] for item in references],
+            'source': strings[source],
+        }
+
+    return {
+        'schemaVersion': compact['schemaVersion'],
+        'sdk': compact['sdk'],
+        'operations': operations,
+        'methods': expanded_methods,
+        'types': types,
+    }
+
+
+def load_compact_catalog(path: Path) -> dict:
+    """Read `sdk-operation-catalog.compact.json` and expand it to the regular schema."""
+    return expand_catalog(json.loads(Path(path).read_text(encoding='utf-8')))
@@ -0,0 +1,156 @@
+"""
+Incremental mirror of the installed SDK's dist/ into public/dist.
+
+Only files whose content changed are written. A file is current when it is
+the same inode as its source (a hardlink from an earlier sync), when size and
+mtime match, or, failing that, when its SHA-256 matches. In the last case its
+mtime is refreshed so the next sync decides without hashing. New content is
+placed with a copy-on-write clone (FICLONE) where the filesystem supports it,
+then a hardlink, then a plain copy, always through a temporary name and
+os.replace. Files that vanished from the source are removed.
+
+Files listed in `rewrites` are stored transformed (e.g. the wasm wrapper whose
+bare module specifier is replaced for the browser). They are compared with the
+transformed source, so a rewrite that is already applied costs one read and
+no write. They are always written as new files, never linked, so the source
+package can never be modified through public/dist. Files in `extra_files` are
+generated content that has no source file (e.g. the SDK's WebAssembly binary
+under a content-hashed name); they are written the same way and count as part
+of the mirror, so they are not removed as stale.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Set
+
+from artifact_store import hash_path, write_bytes
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl request number for FICLONE (Linux: btrfs, XFS, bcachefs, overlayfs on those).
+FICLONE = 0x40049409
+
+
+class SyncResult(NamedTuple):
+    copied: int
+    unchanged: int
+    removed: int
+
+
+def _temp_path(target: Path) -> Path:
+    fd, name = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.', suffix='.tmp')
+    os.close(fd)
+    return Path(name)
+
+
+def _reflink(source: Path, temp: Path) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with open(source, 'rb') as src, open(temp, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError:
+        return False
+    shutil.copystat(source, temp)
+    return True
+
+
+def _hardlink(source: Path, temp: Path) -> bool:
+    temp.unlink()
+    try:
+        os.link(source, temp)
+    except OSError:
+        # Different device, or the filesystem has no hardlinks.
+        return False
+    return True
+
+
+def place_file(source: Path, target: Path) -> None:
+    """Put `source`'s content at `target` atomically, sharing storage when the filesystem allows."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp = _temp_path(target)
+    try:
+        if not _reflink(source, temp) and not _hardlink(source, temp):
+            shutil.copy2(source, temp)
+        os.replace(temp, target)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+
+def is_current(source: Path, target: Path) -> bool:
+    try:
+        target_stat = target.stat()
+    except OSError:
+        return False
+    source_stat = source.stat()
+    if (source_stat.st_dev, source_stat.st_ino) == (target_stat.st_dev, target_stat.st_ino):
+        return True
+    if source_stat.st_size != target_stat.st_size:
+        return False
+    if source_stat.st_mtime_ns == target_stat.st_mtime_ns:
+        return True
+    if hash_path(source) != hash_path(target):
+        return False
+    os.utime(target, ns=(target_stat.st_atime_ns, source_stat.st_mtime_ns))
+    return True
+
+
+def sync_tree(
+    source: Path,
+    destination: Path,
+    rewrites: Dict[str, Callable[[bytes], bytes]] | None = None,
+    extra_files: Dict[str, bytes] | None = None,
+) -> SyncResult:
+    """Make `destination` mirror `source` plus `extra_files`, rewriting the files named (relative, POSIX) in `rewrites`."""
+    rewrites = rewrites or {}
+    copied = unchanged = 0
+    expected = set()
+    for relative, data in (extra_files or {}).items():
+        expected.add(relative)
+        if write_bytes(destination, relative, data).changed:
+            copied += 1
+        else:
+            unchanged += 1
+    for directory, _dirnames, filenames in os.walk(source):
+        for filename in filenames:
+            source_file = Path(directory) / filename
+            relative = source_file.relative_to(source).as_posix()
+            target_file = destination / relative
+            expected.add(relative)
+            if relative in rewrites:
+                changed = write_bytes(destination, relative, rewrites[relative](source_file.read_bytes())).changed
+            elif is_current(source_file, target_file):
+                changed = False
+            else:
+                place_file(source_file, target_file)
+                changed = True
+            if changed:
+                copied += 1
+            else:
+                unchanged += 1
+
+    return SyncResult(copied, unchanged, remove_stale(destination, expected))
+
+
+def remove_stale(destination: Path, expected: Set[str]) -> int:
+    """Delete files under `destination` not named (relative, POSIX) in `expected`, then empty directories."""
+    removed = 0
+    for directory, dirnames, filenames in os.walk(destination, topdown=False):
+        for filename in filenames:
+            target_file = Path(directory) / filename
+            if target_file.relative_to(destination).as_posix() not in expected:
+                target_file.unlink()
+                removed += 1
+        for dirname in dirnames:
+            path = Path(directory) / dirname
+            if not any(path.iterdir()):
+                path.rmdir()
+    return removed
@@ -38,8 +38,19 @@ export function documentedMethods(api) {
   return result;
 }
 
+// Parsed declaration files and normalized type text are memoized for the
+// lifetime of the process so a long-lived worker (scripts/sdk_worker.mjs)
+// parses each declaration once. Entries are revalidated by size and mtime.
+const sourceCache = new Map();
+const normalizedTypeCache = new Map();
+
 function parseFile(file) {
-  return ts.createSourceFile(file, fs.readFileSync(file, 'utf8'), ts.ScriptTarget.Latest, true, ts.ScriptKind.TS);
+  const stats = fs.statSync(file);
+  const cached = sourceCache.get(file);
+  if (cached && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) return cached.source;
+  const source = ts.createSourceFile(file, fs.readFileSync(file, 'utf8'), ts.ScriptTarget.Latest, true, ts.ScriptKind.TS);
+  sourceCache.set(file, { mtimeMs: stats.mtimeMs, size: stats.size, source });
+  return source;
 }
 
 function methodDeclarations(source, methodName) {
@@ -53,6 +64,13 @@ function methodDeclarations(source, methodName) {
 }
 
 function normalizeType(text) {
+  if (normalizedTypeCache.has(text)) return normalizedTypeCache.get(text);
+  const normalized = printType(text);
+  normalizedTypeCache.set(text, normalized);
+  return normalized;
+}
+
+function printType(text) {
   const source = ts.createSourceFile('type.ts', `type X = ${text};`, ts.ScriptTarget.Latest, true, ts.ScriptKind.TS);
   const alias = source.statements.find(ts.isTypeAliasDeclaration);
   if (!alias) fail(`Unable to parse type: ${text}`);
@@ -108,7 +126,10 @@ function collectDeclarationIndex(files) {
 
 function walkDts(dir) {
   if (!fs.existsSync(dir)) return [];
-  return fs.readdirSync(dir, { withFileTypes: true }).flatMap((entry) => {
+  // readdir order depends on the filesystem; sort so duplicate declarations always resolve the same way.
+  const entries = fs.readdirSync(dir, { withFileTypes: true })
+    .sort((a, b) => (a.name < b.name ? -1 : a.name > b.name ? 1 : 0));
+  return entries.flatMap((entry) => {
     const target = path.join(dir, entry.name);
     if (entry.isDirectory()) return walkDts(target);
     return entry.name.endsWith('.d.ts') ? [target] : [];
@@ -295,8 +316,12 @@ export function extractTypes({ apiFile, packageRoot }) {
   };
 }
 
+export function defaultOptions() {
+  return { apiFile: path.join(ROOT, 'public/api-definitions.json'), packageRoot: path.join(ROOT, 'node_modules/@dashevo/evo-sdk') };
+}
+
 function parseArgs(argv) {
-  const result = { apiFile: path.join(ROOT, 'public/api-definitions.json'), packageRoot: path.join(ROOT, 'node_modules/@dashevo/evo-sdk') };
+  const result = defaultOptions();
   for (let i = 0; i < argv.length; i += 1) {
     if (argv[i] === '--api') result.apiFile = path.resolve(argv[++i]);
     else if (argv[i] === '--package-root') result.packageRoot = path.resolve(argv[++i]);
@@ -0,0 +1,112 @@
+"""
+On-disk cache of rendered operation fragments.
+
+Each operation's HTML block in docs.html and Markdown block in
+AI_REFERENCE.md is cached under `node_modules/.cache/evo-sdk-docs/fragments`,
+keyed by a hash of everything that can change it: the operation's IR
+fingerprint (definition, SDK metadata and example), the renderer options, the
+set of linkable type names, and the generator source itself. Documents are
+assembled from cached fragments and only the misses are re-rendered, so
+editing one description re-renders one fragment per document.
+
+Fragments of one kind share a pack file (`<kind>.json`), so a build opens one
+file per document rather than one per operation. Packs are rewritten only
+when something missed; entries then record when they were last used, and the
+least recently used are dropped once a pack outgrows its size budget.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+MAX_PACK_BYTES = 32 * 1024 * 1024
+
+
+def fragment_key(*parts) -> str:
+    payload = json.dumps(parts, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class FragmentCache:
+    def __init__(self, root: Path, renderer_version: str, max_pack_bytes: int = MAX_PACK_BYTES):
+        self.root = root
+        self.renderer_version = renderer_version
+        self.max_pack_bytes = max_pack_bytes
+        self.hits = 0
+        self.misses = 0
+        # kind -> {key: [text, last_used]}
+        self._packs: Dict[str, Dict[str, list]] = {}
+        self._used: Dict[str, set] = {}
+        self._dirty: set = set()
+
+    def _pack_path(self, kind: str) -> Path:
+        return self.root / f'{kind}.json'
+
+    def _pack(self, kind: str) -> Dict[str, list]:
+        pack = self._packs.get(kind)
+        if pack is None:
+            try:
+                pack = json.loads(self._pack_path(kind).read_text(encoding='utf-8'))['entries']
+            except (OSError, ValueError, KeyError, TypeError):
+                pack = {}
+            self._packs[kind] = pack
+            self._used[kind] = set()
+        return pack
+
+    def key(self, kind: str, *parts) -> str:
+        return fragment_key(self.renderer_version, kind, *parts)
+
+    def fetch(self, kind: str, key: str, render: Callable[[], str]) -> str:
+        pack = self._pack(kind)
+        self._used[kind].add(key)
+        entry = pack.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        text = render()
+        pack[key] = [text, 0]
+        self._dirty.add(kind)
+        return text
+
+    def _evict(self, pack: Dict[str, list]) -> int:
+        sizes = {key: len(entry[0].encode('utf-8')) + 96 for key, entry in pack.items()}
+        total = sum(sizes.values())
+        removed = 0
+        for key in sorted(pack, key=lambda item: pack[item][1]):
+            if total <= self.max_pack_bytes:
+                break
+            total -= sizes[key]
+            del pack[key]
+            removed += 1
+        return removed
+
+    def flush(self) -> List[str]:
+        """Persist the packs that gained fragments this build; returns their kinds."""
+        flushed = []
+        now = int(time.time())
+        for kind in sorted(self._dirty):
+            pack = self._packs[kind]
+            for key in self._used[kind]:
+                if key in pack:
+                    pack[key][1] = now
+            self._evict(pack)
+            path = self._pack_path(kind)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'entries': pack}, f, separators=(',', ':'), ensure_ascii=False)
+                os.replace(temp_name, path)
+            except OSError:
+                # The cache is an optimisation; a read-only or full disk must not fail the build.
+                continue
+            flushed.append(kind)
+        self._dirty.clear()
+        return flushed
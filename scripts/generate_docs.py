@@ -9,47 +9,134 @@ version while sourcing content from the Evo SDK definitions.
 
 from __future__ import annotations
 
-import json
+import argparse
 import hashlib
+import json
+import os
 import re
-import shutil
 import subprocess
+import sys
 import textwrap
+import time
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from html import escape
 from pathlib import Path
-from typing import Callable, Iterable, List, Tuple
+from typing import Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+from asset_pipeline import AssetPlan, hashed_name, module_exports, module_files, plan_assets, write_site
+from artifact_store import ArtifactRecord, ArtifactStore, compression_formats, write_chunks, write_compressed_variants
+from build_cache import BuildCache, cache_key, hash_file, input_fingerprints, input_patterns
+from catalog_merkle import catalog_tree, describe_drift, diff_trees
+from catalog_shards import INDEX_NAME, prune_stale_shards, read_index, shard_names, write_catalog_shards
+from compact_catalog import COMPACT_CATALOG_NAME, dumps_compact, encode_catalog
+from dist_sync import SyncResult, sync_tree
+from fragment_cache import FragmentCache, fragment_key
+from input_watcher import InputWatcher
+from phase_profiler import PhaseProfiler, append_summary, summary_lines
+from precache_manifest import PRECACHE_MANIFEST_NAME, render_precache_manifest
+from sdk_worker import SdkWorker, SdkWorkerError
+from search_index import SEARCH_INDEX_NAME, build_search_index, dumps_search_index
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 PUBLIC_DIR = REPO_ROOT / 'public'
 NODE_MODULES_DIR = REPO_ROOT / 'node_modules'
+BUILD_CACHE_DIR = NODE_MODULES_DIR / '.cache' / 'evo-sdk-docs' / 'builds'
+FRAGMENT_CACHE_DIR = NODE_MODULES_DIR / '.cache' / 'evo-sdk-docs' / 'fragments'
+PROFILE_TRACE_FILE = REPO_ROOT / 'generate-docs.trace.json'
+CHECK_REPORT_FILE = PUBLIC_DIR / 'documentation-check-report.txt'
+DOCS_LAYOUTS = ('single', 'split')
+DOCS_FRAGMENT_DIR = 'docs'
+# Rough rendered height of one operation, reserved by a split-layout placeholder so that
+# sections loading above the reader shift the page as little as possible.
+OPERATION_PLACEHOLDER_HEIGHT = 480
+# Entry module of the browser SDK bundle mirrored into public/dist.
+SDK_MODULE_NAME = 'evo-sdk.module.js'
+# The raw (uncompressed) wasm-bindgen build, served out of line from public/dist/wasm-sdk/.
+WASM_SDK_RAW_DIR = NODE_MODULES_DIR / '@dashevo' / 'wasm-sdk' / 'dist' / 'raw'
+WASM_SDK_DIST_DIR = 'wasm-sdk'
 DEFAULT_TEST_IDENTITY = '5DbLwAxGBzUzo81VewMUwn4b5P4bpv9FNFybi25XB5Bk'
 TRANSITION_OPERATION_EXAMPLES: dict[str, str] = {}
+PROFILER = PhaseProfiler()
+
+
+class WasmSdkBuild(NamedTuple):
+    # Module the wrapper imports, relative to public/dist.
+    entry: str
+    # Relative to public/dist -> content.
+    files: Dict[str, bytes]
+
+
+def out_of_line_wasm_sdk(raw_dir: Path, compressed: Path) -> WasmSdkBuild | None:
+    """The raw wasm-bindgen build of @dashevo/wasm-sdk, with its binary under a content-hashed name.
+
+    `sdk.compressed.js` embeds the binary as a compressed string that is
+    inflated and compiled on the main thread on every visit. The raw glue
+    fetches a separate `.wasm` instead, and its init compiles the response with
+    `WebAssembly.instantiateStreaming` while it downloads; browsers can also
+    keep the compiled code for later visits. None when the package has no raw
+    build, when its glue does not locate the binary with
+    `new URL(..., import.meta.url)`, or when the glue does not export every
+    name `compressed` (the module it replaces) does.
+    """
+    binaries = sorted(raw_dir.glob('*.wasm')) if raw_dir.is_dir() else []
+    if len(binaries) != 1:
+        return None
+    binary = binaries[0]
+    data = binary.read_bytes()
+    hashed = hashed_name(binary.name, hashlib.sha256(data).hexdigest())
+    reference = re.compile(
+        r"""new URL\((['"])(?:\./)?""" + re.escape(binary.name) + r"""\1(?=\s*,\s*import\.meta\.url\))"""
+    )
+    files = {f'{WASM_SDK_DIST_DIR}/{hashed}': data}
+    entry = None
+    for path in sorted(raw_dir.rglob('*.js')):
+        name = f'{WASM_SDK_DIST_DIR}/{path.relative_to(raw_dir).as_posix()}'
+        text, count = reference.subn(
+            lambda match: f'new URL({match.group(1)}./{hashed}{match.group(1)}',
+            path.read_text(encoding='utf-8'),
+        )
+        if count:
+            entry = name
+        files[name] = text.encode('utf-8')
+    if entry is None:
+        return None
+    required = module_exports(compressed.parent, compressed.name)
+    provided = module_exports(raw_dir, entry.removeprefix(f'{WASM_SDK_DIST_DIR}/'))
+    if not required or provided is None or not required <= provided:
+        missing = ', '.join(sorted(required - provided)) if required and provided is not None else 'unknown'
+        print(
+            f'Warning: {raw_dir} does not export what {compressed.name} does (missing: {missing}); '
+            f'keeping {compressed.name}'
+        )
+        return None
+    return WasmSdkBuild(entry, files)
+
 
-def copy_node_modules_dist(package: str, destination: Path) -> bool:
-    """Copy the /dist directory from node_modules if it exists."""
+def sync_node_modules_dist(package: str, destination: Path) -> SyncResult | None:
+    """Mirror the package's /dist directory into `destination`; None when it is not installed."""
     package_path = NODE_MODULES_DIR
     for part in package.split('/'):
         package_path = package_path / part
     dist_path = package_path / 'dist'
     if not dist_path.exists():
-        return False
-
-    if destination.exists():
-        shutil.rmtree(destination)
-    shutil.copytree(dist_path, destination)
-    return True
+        return None
+    wasm_sdk = out_of_line_wasm_sdk(WASM_SDK_RAW_DIR, dist_path / 'sdk.compressed.js')
+    entry = f'./{wasm_sdk.entry}' if wasm_sdk else './sdk.compressed.js'
+    return sync_tree(
+        dist_path,
+        destination,
+        rewrites={'wasm.js': lambda contents: browser_wasm_wrapper(contents, entry)},
+        extra_files=wasm_sdk.files if wasm_sdk else None,
+    )
 
 
-def rewrite_wasm_wrapper(wasm_file: Path) -> None:
+def browser_wasm_wrapper(contents: bytes, wasm_module: str = './sdk.compressed.js') -> bytes:
     """Replace bare module specifiers with local relative paths for browser usage."""
-    if not wasm_file.exists():
-        return
-    contents = wasm_file.read_text(encoding='utf-8')
-    replacement = contents.replace("@dashevo/wasm-sdk/compressed", "./sdk.compressed.js")
-    if replacement != contents:
-        wasm_file.write_text(replacement, encoding='utf-8')
+    return contents.replace(b'@dashevo/wasm-sdk/compressed', wasm_module.encode('utf-8'))
+
 
 TESTNET_TEST_DATA = {
     'identity_id': DEFAULT_TEST_IDENTITY,
@@ -81,108 +168,283 @@ def load_api_definitions(api_definitions_file: Path) -> tuple[dict, dict]:
     return api_data.get('queries', {}), api_data.get('transitions', {})
 
 
-def load_sdk_type_metadata(api_definitions_file: Path) -> dict:
+def load_sdk_type_metadata(api_definitions_file: Path, worker: SdkWorker) -> dict:
     """Extract the operation catalog from declarations shipped by the installed Evo SDK."""
-    extractor = REPO_ROOT / 'scripts' / 'extract_sdk_types.mjs'
-    completed = subprocess.run(
-        ['node', str(extractor), '--api', str(api_definitions_file)],
-        cwd=REPO_ROOT,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    return json.loads(completed.stdout)
+    return worker.call('extract', apiFile=str(api_definitions_file))
 
 
-def load_transition_operation_examples() -> dict[str, str]:
+def load_transition_operation_examples(api_definitions_file: Path, worker: SdkWorker) -> dict[str, str]:
     """Render examples from the browser transition-operation registry."""
-    renderer = REPO_ROOT / 'scripts' / 'render_transition_examples.mjs'
-    completed = subprocess.run(
-        ['node', str(renderer)],
-        cwd=REPO_ROOT,
-        check=True,
-        stdout=subprocess.PIPE,
-        text=True,
-    )
-    return json.loads(completed.stdout)
+    return worker.call('renderTransitionExamples', apiFile=str(api_definitions_file))
 
 
-def attach_sdk_metadata(query_defs: dict, transition_defs: dict, type_metadata: dict) -> None:
+class OperationIR:
+    """One documented operation, resolved once and shared by every renderer."""
+
+    __slots__ = (
+        'group', 'prefix', 'key', 'anchor', 'label', 'description', 'disabled', 'sdk_method',
+        'signature', 'parameters', 'return_type', 'return_references', 'example', 'fingerprint',
+    )
+
+    def __init__(self, group: str, prefix: str, key: str, item: dict, metadata: dict, example: str | None):
+        self.group = group
+        self.prefix = prefix
+        self.key = key
+        self.anchor = f'{prefix}-{key}'
+        self.label = item.get('label', key)
+        self.description = item.get('description', 'No description available')
+        self.disabled = item.get('disabled')
+        self.sdk_method = item['sdk_method']
+        self.signature = metadata.get('signature', '')
+        self.parameters = metadata.get('parameters', [])
+        self.return_type = metadata['returnType']
+        self.return_references = metadata.get('returnReferences', [])
+        self.example = example
+        # Everything a rendered fragment depends on, hashed once for the fragment cache.
+        self.fingerprint = fragment_key(*(getattr(self, name) for name in self.__slots__[:-1]))
+
+
+class CategoryIR:
+    __slots__ = ('key', 'anchor', 'fragment', 'label', 'operations')
+
+    def __init__(self, prefix: str, key: str, category: dict, operations: Tuple[OperationIR, ...]):
+        self.key = key
+        self.anchor = f'{prefix}-category-{key}'
+        # Query and transition categories share keys (identity, token, ...), so the prefix keeps them apart.
+        self.fragment = f'{DOCS_FRAGMENT_DIR}/{prefix}-{key}.html'
+        self.label = category.get('label', key)
+        self.operations = operations
+
+    def documented(self) -> Tuple[OperationIR, ...]:
+        """Operations with an example; only these are published in docs.html."""
+        return tuple(operation for operation in self.operations if operation.example)
+
+
+class DocumentationIR:
+    """Operations grouped as in api-definitions.json, plus the catalog they were resolved against."""
+
+    __slots__ = ('queries', 'transitions', 'type_metadata')
+
+    def __init__(self, queries: Tuple[CategoryIR, ...], transitions: Tuple[CategoryIR, ...], type_metadata: dict):
+        self.queries = queries
+        self.transitions = transitions
+        self.type_metadata = type_metadata
+
+
+def build_operation_ir(query_defs: dict, transition_defs: dict, type_metadata: dict) -> DocumentationIR:
+    """Resolve every operation's SDK metadata and example in one pass over the definitions."""
     methods = type_metadata.get('methods', {})
     operation_count = 0
-    for definitions, entries_key in ((query_defs, 'queries'), (transition_defs, 'transitions')):
-        for category in definitions.values():
-            for item in (category.get(entries_key) or {}).values():
-                operation_count += 1
+    groups = {}
+    for group, prefix, definitions in (('queries', 'query', query_defs), ('transitions', 'transition', transition_defs)):
+        categories = []
+        for cat_key, category in definitions.items():
+            operations = []
+            for item_key, item in (category.get(group) or {}).items():
                 sdk_method = item.get('sdk_method')
                 metadata = methods.get(sdk_method)
                 if not metadata or not metadata.get('returnType'):
                     raise ValueError(f'Missing extracted return type for {sdk_method}')
-                item['_return_type'] = metadata['returnType']
-                item['_return_references'] = metadata.get('returnReferences', [])
-                item['_sdk_parameters'] = metadata.get('parameters', [])
-                item['_sdk_signature'] = metadata.get('signature', '')
+                if group == 'queries':
+                    example_code = evo_example_for_query(item_key)
+                else:
+                    example_code = item.get('sdk_example') or evo_example_for_transition(item_key)
+                operations.append(OperationIR(group, prefix, item_key, item, metadata, example_code))
+            operation_count += len(operations)
+            if operations:
+                categories.append(CategoryIR(prefix, cat_key, category, tuple(operations)))
+        groups[group] = tuple(categories)
     extracted_operation_count = len(type_metadata.get('operations', []))
     if operation_count != extracted_operation_count:
         raise ValueError(
             f'Documented operation count ({operation_count}) does not match extracted metadata '
             f'({extracted_operation_count})'
         )
+    return DocumentationIR(groups['queries'], groups['transitions'], type_metadata)
 
 
 def type_anchor(reference: str) -> str:
     return 'type-' + re.sub(r'[^a-z0-9]+', '-', reference.replace('wasm.', '').lower()).strip('-')
 
 
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _build_trie(names: Iterable[str]) -> dict:
+    """Character trie over `names`; a node's `None` key holds the name ending there."""
+    trie: dict = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[None] = name
+    return trie
+
+
+class TypeLinkEngine:
+    """Links type names inside type expressions with one left-to-right scan.
+
+    The engine holds a character trie over every declared type name and its
+    `wasm.`-qualified alias, built once per catalog. At each identifier start
+    the trie walk finds the longest name that ends on a word boundary, which is
+    exactly what the old per-call `\\b(?:longest|...|shortest)\\b` regex matched.
+    Rendered HTML and Markdown are memoized per expression and reference list.
+    The trie never changes after construction, so the output of a call does not
+    depend on the calls before it.
+    """
+
+    def __init__(self, names: Iterable[str] = (), source: dict | None = None):
+        names = list(names)
+        self.source = source
+        # Identifies the linkable name set, so cached fragments are not reused across catalogs.
+        self.fingerprint = hashlib.sha256('\n'.join(sorted(names)).encode('utf-8')).hexdigest()
+        self._names = frozenset(
+            alias for name in names
+            for alias in (name.removeprefix('wasm.'), 'wasm.' + name.removeprefix('wasm.'))
+        )
+        self._trie = _build_trie(self._names)
+        self._html_cache: dict[tuple, str] = {}
+        self._markdown_cache: dict[tuple, str] = {}
+
+    @classmethod
+    def from_type_metadata(cls, type_metadata: dict) -> 'TypeLinkEngine':
+        types = type_metadata.get('types', {})
+        return cls(types, source=types)
+
+    @staticmethod
+    def _longest_match(trie: dict, text: str, start: int, allowed: set[str] | None) -> Tuple[int, str] | None:
+        node = trie
+        best = None
+        index = start
+        length = len(text)
+        while index < length:
+            node = node.get(text[index])
+            if node is None:
+                break
+            index += 1
+            name = node.get(None)
+            if name is not None and (index == length or not _is_word_char(text[index])):
+                if allowed is None or name in allowed:
+                    best = (index, name)
+        return best
+
+    def linkify_html(self, type_expression: str, references: List[str] | None = None) -> str:
+        """Escape `type_expression`, linking referenced names (every known name when references is None)."""
+        key = (type_expression, None if references is None else tuple(references))
+        cached = self._html_cache.get(key)
+        if cached is not None:
+            return cached
+
+        trie = self._trie
+        allowed = None
+        if references is not None:
+            if not references:
+                self._html_cache[key] = safe_value(type_expression)
+                return self._html_cache[key]
+            allowed = {
+                name for reference in references
+                for name in (reference, reference.removeprefix('wasm.'))
+            }
+            if not allowed <= self._names:
+                # A reference the catalog does not declare: match this call against its own trie.
+                trie = _build_trie(allowed)
+
+        parts = []
+        cursor = 0
+        index = 0
+        length = len(type_expression)
+        while index < length:
+            if not _is_word_char(type_expression[index]) or (index and _is_word_char(type_expression[index - 1])):
+                index += 1
+                continue
+            match = self._longest_match(trie, type_expression, index, allowed)
+            if match is None:
+                index += 1
+                while index < length and _is_word_char(type_expression[index]):
+                    index += 1
+                continue
+            end, name = match
+            parts.append(safe_value(type_expression[cursor:index]))
+            parts.append(
+                f'<a class="param-type-link" href="TYPE_REFERENCE.html#{type_anchor(name)}">'
+                f'{safe_value(name)}</a>'
+            )
+            cursor = index = end
+        parts.append(safe_value(type_expression[cursor:]))
+        rendered = ''.join(parts)
+        self._html_cache[key] = rendered
+        return rendered
+
+    def markdown_links(self, references: List[str]) -> str:
+        key = tuple(references)
+        cached = self._markdown_cache.get(key)
+        if cached is None:
+            links = ', '.join(
+                f'[`{reference}`](TYPE_REFERENCE.md#{type_anchor(reference)})'
+                for reference in references
+            )
+            cached = f'  - Type declarations: {links}' if references else ''
+            self._markdown_cache[key] = cached
+        return cached
+
+
+TYPE_LINKS = TypeLinkEngine()
+
+
+def use_type_links(type_metadata: dict) -> TypeLinkEngine:
+    """Build the shared type-link engine for this catalog, reusing it across renderers."""
+    global TYPE_LINKS
+    if TYPE_LINKS.source is not type_metadata.get('types'):
+        TYPE_LINKS = TypeLinkEngine.from_type_metadata(type_metadata)
+    return TYPE_LINKS
+
+
+FRAGMENTS: FragmentCache | None = None
+
+
+def cached_fragment(kind: str, parts: tuple, render: Callable[[], str]) -> str:
+    """Return a rendered operation fragment from the fragment cache, rendering it on a miss."""
+    if FRAGMENTS is None:
+        return render()
+    return FRAGMENTS.fetch(kind, FRAGMENTS.key(kind, TYPE_LINKS.fingerprint, *parts), render)
+
+
 def render_type_expression_html(type_expression: str, references: List[str]) -> str:
     """Render a type expression, linking referenced identifiers in place."""
-    reference_by_name = {}
-    for reference in references:
-        reference_by_name[reference] = reference
-        reference_by_name[reference.removeprefix('wasm.')] = reference
-
-    if not reference_by_name:
-        return safe_value(type_expression)
-
-    pattern = re.compile(r'\b(?:' + '|'.join(
-        re.escape(name) for name in sorted(reference_by_name, key=len, reverse=True)
-    ) + r')\b')
-    parts = []
-    cursor = 0
-    for match in pattern.finditer(type_expression):
-        parts.append(safe_value(type_expression[cursor:match.start()]))
-        reference = reference_by_name[match.group(0)]
-        parts.append(
-            f'<a class="param-type-link" href="TYPE_REFERENCE.html#{type_anchor(reference)}">'
-            f'{safe_value(match.group(0))}</a>'
-        )
-        cursor = match.end()
-    parts.append(safe_value(type_expression[cursor:]))
-    return ''.join(parts)
+    return TYPE_LINKS.linkify_html(type_expression, references)
 
 
 def render_type_links_markdown(references: List[str]) -> str:
-    if not references:
-        return ''
-    links = ', '.join(
-        f'[`{reference}`](TYPE_REFERENCE.md#{type_anchor(reference)})'
-        for reference in references
-    )
-    return f'  - Type declarations: {links}'
+    return TYPE_LINKS.markdown_links(references or [])
 
 
-def generate_type_reference_md(type_metadata: dict) -> str:
+def join_lines(lines: Iterable[str]) -> Iterable[str]:
+    """Stream `'\\n'.join(lines)` without materializing the joined document."""
+    first = True
+    for line in lines:
+        if not first:
+            yield '\n'
+        first = False
+        yield line
+
+
+def iter_type_reference_md(type_metadata: dict) -> Iterable[str]:
     sdk = type_metadata['sdk']
-    lines = [
+    yield from join_lines(_type_reference_md_lines(type_metadata, sdk))
+
+
+def _type_reference_md_lines(type_metadata: dict, sdk: dict) -> Iterable[str]:
+    yield from (
         '# Evo SDK Type Reference',
         '',
         f"Generated from `{sdk['name']}@{sdk['version']}` published TypeScript declarations under `{sdk['declarationRoot']}/`.",
         '',
         'Named types reachable from documented method inputs and outputs are included recursively.',
         '',
-    ]
+    )
     for name, metadata in type_metadata.get('types', {}).items():
-        lines.extend([
+        yield from (
             f'<a id="{type_anchor(name)}"></a>',
             f'## `{name}`',
             '',
@@ -192,25 +454,17 @@ def generate_type_reference_md(type_metadata: dict) -> str:
             metadata['declaration'].strip(),
             '```',
             '',
-        ])
-    return '\n'.join(lines)
+        )
 
 
-def generate_type_reference_html(type_metadata: dict) -> str:
+def generate_type_reference_md(type_metadata: dict) -> str:
+    return ''.join(iter_type_reference_md(type_metadata))
+
+
+def iter_type_reference_html(type_metadata: dict) -> Iterable[str]:
     sdk = type_metadata['sdk']
-    sidebar = '\n'.join(
-        f'            <li><a href="#{type_anchor(name)}">{safe_value(name)}</a></li>'
-        for name in type_metadata.get('types', {})
-    )
-    declarations = '\n'.join(
-        f'''        <section class="category type-declaration" id="{type_anchor(name)}">
-            <h2><code>{safe_value(name)}</code></h2>
-            <p class="description">Source declaration: <code>{safe_value(metadata['source'])}</code></p>
-            <pre class="code-example"><code>{safe_value(metadata['declaration'].strip())}</code></pre>
-        </section>'''
-        for name, metadata in type_metadata.get('types', {}).items()
-    )
-    return f'''<!DOCTYPE html>
+    types = type_metadata.get('types', {})
+    yield '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -222,7 +476,12 @@ def generate_type_reference_html(type_metadata: dict) -> str:
     <div class="sidebar">
         <h2>Types</h2>
         <ul>
-{sidebar}
+'''
+    yield from join_lines(
+        f'            <li><a href="#{type_anchor(name)}">{safe_value(name)}</a></li>'
+        for name in types
+    )
+    yield f'''
         </ul>
     </div>
     <main class="main-content">
@@ -234,14 +493,27 @@ def generate_type_reference_html(type_metadata: dict) -> str:
         <h1>Evo SDK Type Reference</h1>
         <p>Generated from <code>{safe_value(sdk['name'])}@{safe_value(sdk['version'])}</code> published TypeScript declarations under <code>{safe_value(sdk['declarationRoot'])}/</code>.</p>
         <p class="description">Named types reachable from documented method inputs and outputs are included recursively.</p>
-{declarations}
+'''
+    yield from join_lines(
+        f'''        <section class="category type-declaration" id="{type_anchor(name)}">
+            <h2><code>{safe_value(name)}</code></h2>
+            <p class="description">Source declaration: <code>{safe_value(metadata['source'])}</code></p>
+            <pre class="code-example"><code>{safe_value(metadata['declaration'].strip())}</code></pre>
+        </section>'''
+        for name, metadata in types.items()
+    )
+    yield '''
     </main>
 </body>
 </html>
 '''
 
 
-def evo_example_for_query(key: str, inputs: List[dict]):
+def generate_type_reference_html(type_metadata: dict) -> str:
+    return ''.join(iter_type_reference_html(type_metadata))
+
+
+def _build_query_examples() -> dict[str, str]:
     data = TESTNET_TEST_DATA
     examples = {
         'getIdentity': example(f"""
@@ -511,52 +783,62 @@ def evo_example_for_query(key: str, inputs: List[dict]):
             return await sdk.identities.byNonUniquePublicKeyHash('{data['public_key_hash_non_unique']}')
         """),
     }
-    return examples.get(key)
+    return examples
+
+
+# Built once at import; every renderer looks examples up instead of rebuilding the table.
+QUERY_EXAMPLES = _build_query_examples()
+
+
+def evo_example_for_query(key: str) -> str | None:
+    return QUERY_EXAMPLES.get(key)
+
+
+TRANSITION_FALLBACK_EXAMPLES = {
+    # Identities
+    # 'identityCreate' - example in api-definitions.json
+    # 'identityTopUp' - example in api-definitions.json
+    'identityCreditTransfer': "await client.identities.creditTransfer({ identity, recipientId, amount: BigInt(amount), signer, signingKey: identityKey })",
+    'identityCreditWithdrawal': "await client.identities.creditWithdrawal({ identity, amount: BigInt(amount), toAddress, coreFeePerByte, signer, signingKey: identityKey })",
+    'identityUpdate': "await client.identities.update({ identity, addPublicKeys, disablePublicKeys, signer })",
+    'dataContractCreate': "await client.contracts.publish({ dataContract, identityKey, signer })",
+    'dataContractUpdate': "await client.contracts.update({ dataContract, identityKey, signer })",
+    # Documents
+    'documentCreate': "await client.documents.create({ document, identityKey, signer })",
+    'documentReplace': "await client.documents.replace({ document, identityKey, signer })",
+    'documentDelete': "await client.documents.delete({ document, identityKey, signer })",
+    'documentTransfer': "await client.documents.transfer({ document, recipientId, identityKey, signer })",
+    'documentPurchase': "await client.documents.purchase({ document, buyerId, price: BigInt(price), identityKey, signer })",
+    'documentSetPrice': "await client.documents.setPrice({ document, price: BigInt(price), identityKey, signer })",
+    # Tokens
+    'tokenMint': "await client.tokens.mint({ dataContractId, tokenPosition, amount: BigInt(amount), identityId, recipientId, publicNote, identityKey, signer })",
+    'tokenBurn': "await client.tokens.burn({ dataContractId, tokenPosition, amount: BigInt(amount), identityId, publicNote, identityKey, signer })",
+    'tokenTransfer': "await client.tokens.transfer({ dataContractId, tokenPosition, amount: BigInt(amount), senderId, recipientId, publicNote, identityKey, signer })",
+    'tokenFreeze': "await client.tokens.freeze({ dataContractId, tokenPosition, authorityId, frozenIdentityId, publicNote, identityKey, signer })",
+    'tokenUnfreeze': "await client.tokens.unfreeze({ dataContractId, tokenPosition, authorityId, frozenIdentityId, publicNote, identityKey, signer })",
+    'tokenDestroyFrozen': "await client.tokens.destroyFrozen({ dataContractId, tokenPosition, authorityId, frozenIdentityId, publicNote, identityKey, signer })",
+    'tokenSetPriceForDirectPurchase': "await client.tokens.setPrice({ dataContractId, tokenPosition, authorityId, price: BigInt(price), publicNote, identityKey, signer })",
+    'tokenDirectPurchase': "await client.tokens.directPurchase({ dataContractId, tokenPosition, buyerId, amount: BigInt(amount), maxTotalCost: BigInt(maxTotalCost), identityKey, signer })",
+    'tokenClaim': "await client.tokens.claim({ dataContractId, tokenPosition, distributionType, identityId, publicNote, identityKey, signer })",
+    'tokenEmergencyAction': "await client.tokens.emergencyAction({ dataContractId, tokenPosition, authorityId, action, publicNote, identityKey, signer })",
+    # Voting
+    'dpnsUsername': "await client.voting.masternodeVote({ masternodeProTxHash, votePoll, voteChoice, votingKey, signer })",
+    'masternodeVote': "await client.voting.masternodeVote({ masternodeProTxHash, votePoll, voteChoice, votingKey, signer })",
+    'dpnsRegister': "await client.dpns.registerName({ label, identity, identityKey, signer, preorderCallback })",
+    # Platform Addresses
+    'addressTransfer': "await client.addresses.transfer({ inputs, outputs, signer })",
+    'addressTopUpIdentity': "await client.addresses.topUpIdentity({ identity, inputs, signer })",
+    'addressWithdraw': "await client.addresses.withdraw({ inputs, coreFeePerByte, pooling, outputScript, signer })",
+    'addressTransferFromIdentity': "await client.addresses.transferFromIdentity({ identity, outputs, signer })",
+    'addressFundFromAssetLock': "await client.addresses.fundFromAssetLock({ assetLockProof, assetLockPrivateKey, outputs, signer })",
+    'addressCreateIdentity': "await client.addresses.createIdentity({ identity, inputs, identitySigner, addressSigner })",
+}
 
 
-def evo_example_for_transition(key: str):
+def evo_example_for_transition(key: str) -> str | None:
     if key in TRANSITION_OPERATION_EXAMPLES:
         return TRANSITION_OPERATION_EXAMPLES[key]
-    m = {
-        # Identities
-        # 'identityCreate' - example in api-definitions.json
-        # 'identityTopUp' - example in api-definitions.json
-        'identityCreditTransfer': "await client.identities.creditTransfer({ identity, recipientId, amount: BigInt(amount), signer, signingKey: identityKey })",
-        'identityCreditWithdrawal': "await client.identities.creditWithdrawal({ identity, amount: BigInt(amount), toAddress, coreFeePerByte, signer, signingKey: identityKey })",
-        'identityUpdate': "await client.identities.update({ identity, addPublicKeys, disablePublicKeys, signer })",
-        'dataContractCreate': "await client.contracts.publish({ dataContract, identityKey, signer })",
-        'dataContractUpdate': "await client.contracts.update({ dataContract, identityKey, signer })",
-        # Documents
-        'documentCreate': "await client.documents.create({ document, identityKey, signer })",
-        'documentReplace': "await client.documents.replace({ document, identityKey, signer })",
-        'documentDelete': "await client.documents.delete({ document, identityKey, signer })",
-        'documentTransfer': "await client.documents.transfer({ document, recipientId, identityKey, signer })",
-        'documentPurchase': "await client.documents.purchase({ document, buyerId, price: BigInt(price), identityKey, signer })",
-        'documentSetPrice': "await client.documents.setPrice({ document, price: BigInt(price), identityKey, signer })",
-        # Tokens
-        'tokenMint': "await client.tokens.mint({ dataContractId, tokenPosition, amount: BigInt(amount), identityId, recipientId, publicNote, identityKey, signer })",
-        'tokenBurn': "await client.tokens.burn({ dataContractId, tokenPosition, amount: BigInt(amount), identityId, publicNote, identityKey, signer })",
-        'tokenTransfer': "await client.tokens.transfer({ dataContractId, tokenPosition, amount: BigInt(amount), senderId, recipientId, publicNote, identityKey, signer })",
-        'tokenFreeze': "await client.tokens.freeze({ dataContractId, tokenPosition, authorityId, frozenIdentityId, publicNote, identityKey, signer })",
-        'tokenUnfreeze': "await client.tokens.unfreeze({ dataContractId, tokenPosition, authorityId, frozenIdentityId, publicNote, identityKey, signer })",
-        'tokenDestroyFrozen': "await client.tokens.destroyFrozen({ dataContractId, tokenPosition, authorityId, frozenIdentityId, publicNote, identityKey, signer })",
-        'tokenSetPriceForDirectPurchase': "await client.tokens.setPrice({ dataContractId, tokenPosition, authorityId, price: BigInt(price), publicNote, identityKey, signer })",
-        'tokenDirectPurchase': "await client.tokens.directPurchase({ dataContractId, tokenPosition, buyerId, amount: BigInt(amount), maxTotalCost: BigInt(maxTotalCost), identityKey, signer })",
-        'tokenClaim': "await client.tokens.claim({ dataContractId, tokenPosition, distributionType, identityId, publicNote, identityKey, signer })",
-        'tokenEmergencyAction': "await client.tokens.emergencyAction({ dataContractId, tokenPosition, authorityId, action, publicNote, identityKey, signer })",
-        # Voting
-        'dpnsUsername': "await client.voting.masternodeVote({ masternodeProTxHash, votePoll, voteChoice, votingKey, signer })",
-        'masternodeVote': "await client.voting.masternodeVote({ masternodeProTxHash, votePoll, voteChoice, votingKey, signer })",
-        'dpnsRegister': "await client.dpns.registerName({ label, identity, identityKey, signer, preorderCallback })",
-        # Platform Addresses
-        'addressTransfer': "await client.addresses.transfer({ inputs, outputs, signer })",
-        'addressTopUpIdentity': "await client.addresses.topUpIdentity({ identity, inputs, signer })",
-        'addressWithdraw': "await client.addresses.withdraw({ inputs, coreFeePerByte, pooling, outputScript, signer })",
-        'addressTransferFromIdentity': "await client.addresses.transferFromIdentity({ identity, outputs, signer })",
-        'addressFundFromAssetLock': "await client.addresses.fundFromAssetLock({ assetLockProof, assetLockPrivateKey, outputs, signer })",
-        'addressCreateIdentity': "await client.addresses.createIdentity({ identity, inputs, identitySigner, addressSigner })",
-    }
-    return m.get(key)
+    return TRANSITION_FALLBACK_EXAMPLES.get(key)
 
 
 def safe_value(text) -> str:
@@ -659,32 +941,18 @@ def format_example(code: str, header: str, add_return: bool) -> str:
     return '\n'.join(lines).rstrip()
 
 
-def render_operation(
-    prefix: str,
-    item_key: str,
-    item: dict,
-    example_code: str,
-    header: str,
-    include_run_button: bool,
-) -> str:
-    label = safe_value(item.get('label', item_key))
-    description = safe_value(item.get('description', 'No description available'))
-    params = item.get('_sdk_parameters', [])
+def render_operation(operation: OperationIR, header: str, include_run_button: bool) -> str:
+    item_key = operation.key
+    label = safe_value(operation.label)
+    description = safe_value(operation.description)
+    params = operation.parameters
     params_html = render_parameters(params)
-    raw_return_type = str(item.get('_return_type') or '')
-    signature_html = render_method_signature_html(
-        str(item.get('_sdk_signature') or ''),
-        params,
-        raw_return_type,
-    )
-    example_html = safe_value(format_example(example_code, header, include_run_button))
-    return_type = render_type_expression_html(
-        raw_return_type,
-        item.get('_return_references', []),
-    )
+    signature_html = render_method_signature_html(operation.signature, params, operation.return_type)
+    example_html = safe_value(format_example(operation.example, header, include_run_button))
+    return_type = render_type_expression_html(operation.return_type, operation.return_references)
     status_html = ''
-    if item.get('disabled'):
-        status_html = f'            <p class="description"><strong>Disabled:</strong> {safe_value(item["disabled"])}</p>\n'
+    if operation.disabled:
+        status_html = f'            <p class="description"><strong>Disabled:</strong> {safe_value(operation.disabled)}</p>\n'
 
     if include_run_button:
         run_section = (
@@ -695,7 +963,7 @@ def render_operation(
     else:
         run_section = f"                <div class=\"example-code\">{example_html}</div>"
 
-    sdk_method = str(item.get('sdk_method') or '')
+    sdk_method = operation.sdk_method
     sdk_namespace, separator, sdk_method_name = sdk_method.rpartition('.')
     if separator:
         sdk_path_html = (
@@ -705,13 +973,13 @@ def render_operation(
     else:
         sdk_path_html = f'<strong>sdk.{safe_value(sdk_method)}</strong>'
 
-    operation_id = f'{prefix}-{item_key}'
+    operation_id = operation.anchor
     return f'''        <div class="operation" id="{operation_id}">
             <div class="operation-kicker">{sdk_path_html}</div>
             <h4><a class="operation-anchor" href="#{operation_id}">{label}</a></h4>
             <p class="description">{description}</p>
 {status_html}
-            <pre class="method-signature" aria-label="{safe_value(item.get('_sdk_signature'))}"><code>{signature_html}</code></pre>
+            <pre class="method-signature" aria-label="{safe_value(operation.signature)}"><code>{signature_html}</code></pre>
             
             <div class="parameters">
                 <h5>Parameters</h5>
@@ -730,55 +998,92 @@ def render_operation(
         </div>'''
 
 
-def collect_sections(definitions: dict, entries_key: str, example_resolver: Callable[[str, dict], str | None]) -> List[Tuple[str, dict, List[Tuple[str, dict, str]]]]:
-    sections: List[Tuple[str, dict, List[Tuple[str, dict, str]]]] = []
-    for cat_key, category in definitions.items():
-        items = []
-        for item_key, item in (category.get(entries_key) or {}).items():
-            example = example_resolver(item_key, item)
-            if example:
-                items.append((item_key, item, example))
-        if items:
-            sections.append((cat_key, category, items))
+def documented_sections(categories: Iterable[CategoryIR]) -> List[Tuple[CategoryIR, Tuple[OperationIR, ...]]]:
+    sections = []
+    for category in categories:
+        operations = category.documented()
+        if operations:
+            sections.append((category, operations))
     return sections
 
 
-def build_sidebar_entries(sections: Iterable[Tuple[str, dict, List[Tuple[str, dict, str]]]], prefix: str) -> str:
-    lines: List[str] = []
-    for cat_key, category, items in sections:
-        label = safe_value(category.get('label', cat_key))
-        lines.append(f'            <li class="category">{label}</li>')
-        for item_key, item, _example in items:
-            item_label = safe_value(item.get('label', item_key))
-            lines.append(f'            <li style="margin-left: 20px;"><a href="#{prefix}-{item_key}">{item_label}</a></li>')
-    return '\n'.join(lines)
+def iter_sidebar_entries(
+    sections: Iterable[Tuple[CategoryIR, Tuple[OperationIR, ...]]],
+    indent: str = '',
+) -> Iterable[str]:
+    def lines() -> Iterable[str]:
+        for category, operations in sections:
+            yield f'{indent}            <li class="category">{safe_value(category.label)}</li>'
+            for operation in operations:
+                yield f'{indent}            <li style="margin-left: 20px;"><a href="#{operation.anchor}">{safe_value(operation.label)}</a></li>'
+    return join_lines(lines())
+
+
+def build_sidebar_entries(sections: Iterable[Tuple[CategoryIR, Tuple[OperationIR, ...]]]) -> str:
+    return ''.join(iter_sidebar_entries(sections))
+
+
+def iter_category_operations(operations: Iterable[OperationIR], header: str, include_run_button: bool) -> Iterable[str]:
+    return join_lines(
+        cached_fragment(
+            'operation-html',
+            (operation.fingerprint, header, include_run_button),
+            lambda: render_operation(operation, header, include_run_button),
+        )
+        for operation in operations
+    )
+
+
+def iter_categories(
+    sections: Iterable[Tuple[CategoryIR, Tuple[OperationIR, ...]]],
+    header: str,
+    include_run_button: bool,
+    split: bool = False,
+) -> Iterable[str]:
+    """Category blocks; with `split`, placeholders that load `category.fragment` on demand."""
+    for index, (category, operations) in enumerate(sections):
+        if index:
+            yield '\n'
+        heading = (
+            f'        <h3 id="{category.anchor}"><a class="category-anchor" href="#{category.anchor}">'
+            f'{safe_value(category.label)}</a></h3>\n'
+        )
+        if split:
+            yield (
+                f'    <div class="category operation-category docs-fragment" data-fragment="{category.fragment}" '
+                f'style="min-height: {len(operations) * OPERATION_PLACEHOLDER_HEIGHT}px">\n'
+                f'{heading}'
+                f'        <p class="fragment-status">Loading {safe_value(category.label)}…</p>\n'
+                '    </div>'
+            )
+            continue
+        yield '    <div class="category operation-category">\n'
+        yield heading
+        yield from iter_category_operations(operations, header, include_run_button)
+        yield '\n    </div>'
 
 
 def render_categories(
-    sections: Iterable[Tuple[str, dict, List[Tuple[str, dict, str]]]],
-    prefix: str,
+    sections: Iterable[Tuple[CategoryIR, Tuple[OperationIR, ...]]],
     header: str,
     include_run_button: bool,
 ) -> str:
-    blocks: List[str] = []
-    for cat_key, category, items in sections:
-        label = safe_value(category.get('label', cat_key))
-        category_id = f'{prefix}-category-{cat_key}'
-        operations = '\n'.join(
-            render_operation(prefix, item_key, item, example, header, include_run_button)
-            for item_key, item, example in items
-        )
-        blocks.append(f'''    <div class="category operation-category">
-        <h3 id="{category_id}"><a class="category-anchor" href="#{category_id}">{label}</a></h3>
-{operations}
-    </div>''')
-    return '\n'.join(blocks)
+    return ''.join(iter_categories(sections, header, include_run_button))
 
 
-def generate_docs_script() -> str:
+def generate_docs_script(sdk_files: Sequence[Tuple[str, int]] = ()) -> str:
+    """The docs page module; `sdk_files` (dist-relative name, size) drive the SDK download progress."""
     script = """
-        import { EvoSDK } from './dist/evo-sdk.module.js';
+        import { createSearchIndexLoader } from './src/search-index.js';
 
+        // The SDK (WebAssembly included) is only needed to run examples, so it is
+        // imported on the first Run, or preloaded when the browser is idle.
+        const SDK_MODULE_URL = './dist/evo-sdk.module.js';
+        const SDK_FILES = __SDK_FILES__;
+
+        const loadSearchIndex = createSearchIndexLoader();
+        const preloadedFiles = new Set();
+        let sdkPromise = null;
         let client = null;
         let clientPromise = null;
 
@@ -807,6 +1112,80 @@ def generate_docs_script() -> str:
             }
         }
 
+        function formatBytes(bytes) {
+            return bytes >= 1048576 ? `${(bytes / 1048576).toFixed(1)} MB` : `${Math.ceil(bytes / 1024)} KB`;
+        }
+
+        function preloadSdk() {
+            if (sdkPromise || navigator.connection?.saveData) {
+                return;
+            }
+            for (const [url] of SDK_FILES) {
+                const link = document.createElement('link');
+                if (url.endsWith('.wasm')) {
+                    link.rel = 'preload';
+                    link.as = 'fetch';
+                    link.type = 'application/wasm';
+                    link.crossOrigin = 'anonymous';
+                } else {
+                    link.rel = 'modulepreload';
+                }
+                link.href = url;
+                link.addEventListener('load', () => preloadedFiles.add(url));
+                document.head.appendChild(link);
+            }
+        }
+
+        // Fetch the SDK files with a byte count, so the import that follows reads them from the cache.
+        async function downloadSdk(onProgress) {
+            const total = SDK_FILES.reduce((sum, [, size]) => sum + size, 0);
+            let received = 0;
+            const report = () => onProgress(Math.min(received, total), total);
+            await Promise.all(SDK_FILES.map(async ([url, size]) => {
+                let fileReceived = 0;
+                if (!preloadedFiles.has(url)) {
+                    const response = await fetch(url);
+                    // A failed download is reported by the import itself.
+                    const reader = response.ok && response.body ? response.body.getReader() : null;
+                    while (reader) {
+                        const { done, value } = await reader.read();
+                        if (done) break;
+                        // Sizes are of the published files; a transfer encoding does not change what is read here.
+                        const counted = Math.min(value.length, Math.max(size - fileReceived, 0));
+                        fileReceived += counted;
+                        received += counted;
+                        report();
+                    }
+                }
+                received += Math.max(size - fileReceived, 0);
+                report();
+            }));
+        }
+
+        function loadSdk() {
+            if (!sdkPromise) {
+                sdkPromise = (async () => {
+                    if (SDK_FILES.length) {
+                        await downloadSdk((received, total) => {
+                            updateProgress(
+                                5 + Math.round(65 * received / total),
+                                `Downloading Evo SDK... ${formatBytes(received)} of ${formatBytes(total)}`,
+                            );
+                        });
+                    }
+                    updateProgress(70, 'Compiling Evo SDK...');
+                    const started = performance.now();
+                    const sdk = await import(SDK_MODULE_URL);
+                    console.info(`Evo SDK loaded in ${Math.round(performance.now() - started)} ms after download`);
+                    return sdk;
+                })().catch((error) => {
+                    sdkPromise = null;
+                    throw error;
+                });
+            }
+            return sdkPromise;
+        }
+
         async function getClient() {
             if (client && client.isConnected !== false) {
                 return client;
@@ -818,7 +1197,8 @@ def generate_docs_script() -> str:
             clientPromise = (async () => {
                 showPreloader();
                 try {
-                    updateProgress(20, 'Creating Evo SDK client...');
+                    const { EvoSDK } = await loadSdk();
+                    updateProgress(80, 'Creating Evo SDK client...');
                     let instance;
                     if (typeof EvoSDK.testnetTrusted === 'function') {
                         instance = EvoSDK.testnetTrusted();
@@ -827,7 +1207,7 @@ def generate_docs_script() -> str:
                     }
 
                     if (instance && typeof instance.connect === 'function') {
-                        updateProgress(45, 'Connecting to Dash Platform...');
+                        updateProgress(85, 'Connecting to Dash Platform...');
                         await instance.connect();
                     }
 
@@ -965,6 +1345,7 @@ def generate_docs_script() -> str:
 
             try {
                 const sdk = await getClient();
+                const { EvoSDK } = await loadSdk();
                 const code = codeElement.textContent;
                 const fn = new Function('EvoSDK', 'getClient', 'sdk', 'return (async () => { ' + code + ' })();');
                 const output = await fn(EvoSDK, getClient, sdk);
@@ -1048,6 +1429,8 @@ def generate_docs_script() -> str:
 
         async function runAllTests() {
             const refs = ensureTestRunner();
+            // The split layout loads sections lazily; the runner needs every example on the page.
+            await window.evoDocsFragments?.loadAll();
             const runButtons = Array.from(document.querySelectorAll('.run-button'));
             const total = runButtons.length;
 
@@ -1171,8 +1554,22 @@ def generate_docs_script() -> str:
             });
 
             if (searchInput) {
-                searchInput.addEventListener('input', (event) => {
-                    const term = event.target.value.trim().toLowerCase();
+                // Fetch the index once the reader shows intent to search, not on every page load.
+                searchInput.addEventListener('focus', () => loadSearchIndex().catch(() => {}), { once: true });
+                searchInput.addEventListener('input', async (event) => {
+                    const query = event.target.value.trim();
+                    const term = query.toLowerCase();
+                    let anchors = null;
+                    if (term) {
+                        try {
+                            anchors = new Set((await loadSearchIndex()).search(query).map((operation) => `#${operation.anchor}`));
+                        } catch (error) {
+                            console.warn('Search index unavailable, matching titles instead:', error);
+                        }
+                        if (event.target.value.trim() !== query) {
+                            return;
+                        }
+                    }
                     let hasResults = false;
 
                     categories.forEach(cat => {
@@ -1187,7 +1584,8 @@ def generate_docs_script() -> str:
                         if (!link) {
                             return;
                         }
-                        const matches = term === '' || link.textContent.toLowerCase().includes(term);
+                        const matches = term === ''
+                            || (anchors ? anchors.has(link.getAttribute('href')) : link.textContent.toLowerCase().includes(term));
                         if (matches) {
                             item.classList.remove('hidden');
                             hasResults = true;
@@ -1213,42 +1611,173 @@ def generate_docs_script() -> str:
                 });
             }
 
-            getClient().catch((error) => {
-                const consoleMessage = error?.message || error;
-                console.error('Evo SDK docs client failed to initialize:', consoleMessage);
-            });
+            const whenIdle = window.requestIdleCallback || ((callback) => setTimeout(callback, 2000));
+            whenIdle(preloadSdk, { timeout: 10000 });
 
             setupTestRunnerShortcut();
         });
 
         if ('serviceWorker' in navigator) {
-            navigator.serviceWorker.register('/service-worker-simple.js').catch((error) => {
+            navigator.serviceWorker.register('service-worker-simple.js').catch((error) => {
                 console.warn('Service worker registration failed:', error);
             });
         }
     """
+    files = json.dumps([[f'./dist/{name}', size] for name, size in sdk_files])
+    return textwrap.dedent(script).strip().replace('__SDK_FILES__', files)
+
+
+def generate_docs_fragment_loader_script() -> str:
+    script = """
+        // Split layout: each category's operations live in docs/<prefix>-<category>.html
+        // and are fetched when the reader scrolls near them or links to one of them.
+        const fragmentMap = JSON.parse(document.getElementById('docs-fragment-map').textContent);
+        const loads = new Map();
+        let observer = null;
+
+        // Sections above the reader grow when they load; compensate explicitly (native
+        // scroll anchoring is not available everywhere and would double-correct).
+        document.documentElement.style.overflowAnchor = 'none';
+
+        function loadFragment(placeholder) {
+            const path = placeholder.dataset.fragment;
+            if (!loads.has(path)) {
+                const load = fetch(path)
+                    .then((response) => {
+                        if (!response.ok) {
+                            throw new Error(`${response.status} ${response.statusText}`);
+                        }
+                        return response.text();
+                    })
+                    .then((html) => {
+                        const aboveReader = placeholder.getBoundingClientRect().bottom <= 0;
+                        const previousHeight = placeholder.offsetHeight;
+                        placeholder.querySelector('.fragment-status')?.remove();
+                        placeholder.insertAdjacentHTML('beforeend', html);
+                        placeholder.style.minHeight = '';
+                        placeholder.classList.add('docs-fragment--loaded');
+                        if (aboveReader) {
+                            window.scrollBy(0, placeholder.offsetHeight - previousHeight);
+                        }
+                    })
+                    .catch((error) => {
+                        loads.delete(path);
+                        const status = placeholder.querySelector('.fragment-status');
+                        if (status) {
+                            status.textContent = `Could not load this section (${error.message}); scroll back to retry.`;
+                        }
+                        observer?.observe(placeholder);
+                        throw error;
+                    });
+                loads.set(path, load);
+            }
+            return loads.get(path);
+        }
+
+        function placeholderFor(path) {
+            return document.querySelector(`.docs-fragment[data-fragment="${CSS.escape(path)}"]`);
+        }
+
+        async function revealHash() {
+            const id = decodeURIComponent(window.location.hash.slice(1));
+            const path = fragmentMap[id];
+            if (!path || document.getElementById(id)) {
+                return;
+            }
+            const placeholder = placeholderFor(path);
+            if (!placeholder) {
+                return;
+            }
+            try {
+                await loadFragment(placeholder);
+            } catch (error) {
+                console.error(`Failed to load ${path}:`, error);
+                return;
+            }
+            document.getElementById(id)?.scrollIntoView();
+        }
+
+        window.evoDocsFragments = {
+            load: loadFragment,
+            loadAll: () => Promise.allSettled(Array.from(document.querySelectorAll('.docs-fragment'), loadFragment)),
+        };
+
+        window.addEventListener('hashchange', revealHash);
+        window.addEventListener('DOMContentLoaded', () => {
+            const placeholders = document.querySelectorAll('.docs-fragment');
+            if ('IntersectionObserver' in window) {
+                observer = new IntersectionObserver((entries) => {
+                    for (const entry of entries) {
+                        if (entry.isIntersecting) {
+                            observer.unobserve(entry.target);
+                            loadFragment(entry.target).catch(() => {});
+                        }
+                    }
+                }, { rootMargin: '1500px 0px' });
+                placeholders.forEach((placeholder) => observer.observe(placeholder));
+            } else {
+                window.evoDocsFragments.loadAll();
+            }
+            revealHash();
+        });
+    """
     return textwrap.dedent(script).strip()
 
 
-def generate_docs_html(query_defs: dict, transition_defs: dict, type_metadata: dict) -> str:
-    query_sections = collect_sections(
-        query_defs,
-        'queries',
-        lambda key, item: evo_example_for_query(key, item.get('inputs', []))
-    )
-    transition_sections = collect_sections(
-        transition_defs,
-        'transitions',
-        lambda key, item: item.get('sdk_example') or evo_example_for_transition(key)
-    )
+def docs_fragment_map(sections: Iterable[Tuple[CategoryIR, Tuple[OperationIR, ...]]]) -> str:
+    """JSON mapping every operation anchor to the fragment that holds it, for deep links."""
+    mapping = {operation.anchor: category.fragment for category, operations in sections for operation in operations}
+    return json.dumps(mapping, separators=(',', ':'))
 
-    sidebar_queries = build_sidebar_entries(query_sections, 'query')
-    sidebar_transitions = build_sidebar_entries(transition_sections, 'transition')
 
-    query_content = render_categories(query_sections, 'query', '// Evo SDK example', True) if query_sections else ''
-    transition_content = render_categories(transition_sections, 'transition', '// Evo SDK example (requires keys/funding)', False) if transition_sections else ''
+def iter_docs_fragments(ir: DocumentationIR) -> Iterable[Tuple[str, Iterable[str]]]:
+    """(file name, chunks) for each category fragment of the split layout."""
+    use_type_links(ir.type_metadata)
+    for categories, header, include_run_button in (
+        (ir.queries, '// Evo SDK example', True),
+        (ir.transitions, '// Evo SDK example (requires keys/funding)', False),
+    ):
+        for category, operations in documented_sections(categories):
+            yield category.fragment, [*iter_category_operations(operations, header, include_run_button), '\n']
 
-    docs_script = generate_docs_script()
+
+def docs_fragment_names(ir: DocumentationIR, layout: str) -> List[str]:
+    if layout != 'split':
+        return []
+    return [
+        category.fragment
+        for category, _operations in documented_sections(ir.queries) + documented_sections(ir.transitions)
+    ]
+
+
+def prune_docs_fragments(output_dir: Path, keep: Iterable[str]) -> None:
+    """Delete fragments (and their compressed siblings) of categories that are no longer published."""
+    keep_files = {Path(name).name for name in keep}
+    for path in (output_dir / DOCS_FRAGMENT_DIR).glob('*.html*'):
+        if path.name.removesuffix('.br').removesuffix('.gz') not in keep_files:
+            path.unlink(missing_ok=True)
+
+
+def iter_docs_html(
+    ir: DocumentationIR,
+    layout: str = 'single',
+    sdk_files: Sequence[Tuple[str, int]] = (),
+) -> Iterable[str]:
+    type_metadata = ir.type_metadata
+    use_type_links(type_metadata)
+    query_sections = documented_sections(ir.queries)
+    transition_sections = documented_sections(ir.transitions)
+    split = layout == 'split'
+
+    docs_script = generate_docs_script(sdk_files)
+    if split:
+        fragment_head = f"""
+    <script type=\"application/json\" id=\"docs-fragment-map\">{docs_fragment_map(query_sections + transition_sections)}</script>
+    <script type=\"module\">
+{textwrap.indent(generate_docs_fragment_loader_script(), '        ')}
+    </script>"""
+    else:
+        fragment_head = ''
 
     overview_block = f'''        <div class="category" id="overview">
             <h2>Overview</h2>
@@ -1271,7 +1800,7 @@ def generate_docs_html(query_defs: dict, transition_defs: dict, type_metadata: d
             </div>
         </div>'''
 
-    html = f"""<!DOCTYPE html>
+    yield f"""<!DOCTYPE html>
 <html lang=\"en\">
 <head>
     <meta charset=\"UTF-8\">
@@ -1282,7 +1811,7 @@ def generate_docs_html(query_defs: dict, transition_defs: dict, type_metadata: d
     <link rel=\"stylesheet\" href=\"docs.css\">
     <script type=\"module\">
 {textwrap.indent(docs_script, '        ')}
-    </script>
+    </script>{fragment_head}
 </head>
 <body>
     <div id=\"preloader\">
@@ -1312,12 +1841,16 @@ def generate_docs_html(query_defs: dict, transition_defs: dict, type_metadata: d
 
         <div class=\"section-header\">Queries</div>
         <ul>
-{textwrap.indent(sidebar_queries, '            ')}
+"""
+    yield from iter_sidebar_entries(query_sections, '            ')
+    yield """
         </ul>
 
         <div class=\"section-header state-transitions\">State Transitions</div>
         <ul>
-{textwrap.indent(sidebar_transitions, '            ')}
+"""
+    yield from iter_sidebar_entries(transition_sections, '            ')
+    yield f"""
         </ul>
     </div>
 
@@ -1337,16 +1870,27 @@ def generate_docs_html(query_defs: dict, transition_defs: dict, type_metadata: d
 {overview_block}
 
         <h2 id=\"queries\"><a class=\"section-anchor\" href=\"#queries\">Queries</a></h2>
-{query_content}
+"""
+    yield from iter_categories(query_sections, '// Evo SDK example', True, split)
+    yield """
 
         <h2 id=\"state-transitions\"><a class=\"section-anchor\" href=\"#state-transitions\">State Transitions</a></h2>
         <p class=\"description\">Evo SDK v4 state transitions accept constructed payload objects plus the appropriate public key and signer object. Build an <code>IdentitySigner</code> with <code>addKeyFromWif</code>; do not pass a WIF string directly in a transition call. Identity creation and asset-lock top ups instead take typed <code>AssetLockProof</code> and <code>PrivateKey</code> objects.</p>
-{transition_content}
+"""
+    yield from iter_categories(transition_sections, '// Evo SDK example (requires keys/funding)', False, split)
+    yield """
     </div>
 </body>
 </html>
 """
-    return html
+
+
+def generate_docs_html(
+    ir: DocumentationIR,
+    layout: str = 'single',
+    sdk_files: Sequence[Tuple[str, int]] = (),
+) -> str:
+    return ''.join(iter_docs_html(ir, layout, sdk_files))
 
 
 def format_ai_example_block(code: str | None, item_key: str) -> str:
@@ -1393,11 +1937,77 @@ def format_ai_example_block(code: str | None, item_key: str) -> str:
     return joined
 
 
-def generate_ai_reference_md(query_defs: dict, transition_defs: dict, type_metadata: dict) -> str:
+def ai_reference_param_lines(params: List[dict]) -> Iterable[str]:
+    if not params:
+        yield 'No parameters required.'
+        yield ''
+        return
+
+    yield 'Parameters:'
+    for param in params:
+        name = param.get('name', 'unknown')
+        param_type = param.get('type', 'unknown')
+        required = 'optional' if param.get('optional') else 'required'
+        yield f"- `{name}`: `{param_type}` ({required})"
+        if param.get('description'):
+            yield f"  - {param['description']}"
+        references = render_type_links_markdown(param.get('references', []))
+        if references:
+            yield references
+        for prop in param.get('properties') or []:
+            prop_required = 'optional' if prop.get('optional') else 'required'
+            yield f"  - `{prop['name']}`: `{prop['type']}` ({prop_required})"
+            if prop.get('description'):
+                yield f"    - {prop['description']}"
+            prop_links = render_type_links_markdown(prop.get('references', []))
+            if prop_links:
+                yield f"  {prop_links.strip()}"
+
+        yield ''
+
+
+def ai_reference_operation_lines(operation: OperationIR) -> Iterable[str]:
+    yield f"**{operation.label}** - `{operation.sdk_method}`"
+    yield f"*{operation.description}*"
+    yield ''
+    if operation.disabled:
+        yield f"**Disabled:** {operation.disabled}"
+        yield ''
+    yield f"Signature: `{operation.signature}`"
+    yield ''
+
+    yield from ai_reference_param_lines(operation.parameters)
+
+    yield 'Returns:'
+    yield ''
+    yield f"- `{operation.return_type}`"
+    type_links = render_type_links_markdown(operation.return_references)
+    if type_links:
+        yield type_links
+    yield ''
+
+    yield 'Example:'
+    yield '```javascript'
+    yield format_ai_example_block(operation.example, operation.key)
+    yield '```'
+    yield ''
+
+
+def ai_reference_operation_md(operation: OperationIR) -> str:
+    return cached_fragment(
+        'operation-md',
+        (operation.fingerprint,),
+        lambda: '\n'.join(ai_reference_operation_lines(operation)),
+    )
+
+
+def ai_reference_lines(ir: DocumentationIR) -> Iterable[str]:
+    type_metadata = ir.type_metadata
+    use_type_links(type_metadata)
     identity_sample = TESTNET_TEST_DATA['identity_id']
     contract_sample = TESTNET_TEST_DATA['data_contract_id']
 
-    lines: List[str] = [
+    yield from (
         '# Evo SDK - AI Reference',
         '',
         f"Return types: generated from `{type_metadata['sdk']['name']}@{type_metadata['sdk']['version']}` published declarations under `{type_metadata['sdk']['declarationRoot']}/`. See [named return type declarations](TYPE_REFERENCE.md).",
@@ -1446,81 +2056,15 @@ def generate_ai_reference_md(query_defs: dict, transition_defs: dict, type_metad
         '```',
         '',
         '### Available Queries',
-    ]
-
-    def append_param_section(target: List[str], params: List[dict]) -> None:
-        if not params:
-            target.append('No parameters required.')
-            target.append('')
-            return
+    )
 
-        target.append('Parameters:')
-        for param in params:
-            name = param.get('name', 'unknown')
-            param_type = param.get('type', 'unknown')
-            required = 'optional' if param.get('optional') else 'required'
-            target.append(f"- `{name}`: `{param_type}` ({required})")
-            if param.get('description'):
-                target.append(f"  - {param['description']}")
-            references = render_type_links_markdown(param.get('references', []))
-            if references:
-                target.append(references)
-            for prop in param.get('properties') or []:
-                prop_required = 'optional' if prop.get('optional') else 'required'
-                target.append(f"  - `{prop['name']}`: `{prop['type']}` ({prop_required})")
-                if prop.get('description'):
-                    target.append(f"    - {prop['description']}")
-                prop_links = render_type_links_markdown(prop.get('references', []))
-                if prop_links:
-                    target.append(f"  {prop_links.strip()}")
-
-            target.append('')
-
-    def append_query_sections() -> None:
-        for cat_key, category in query_defs.items():
-            queries = category.get('queries') or {}
-            if not queries:
-                continue
+    for category in ir.queries:
+        yield f"#### {category.label}"
+        yield ''
+        for operation in category.operations:
+            yield ai_reference_operation_md(operation)
 
-            lines.append(f"#### {category.get('label', cat_key)}")
-            lines.append('')
-
-            for query_key, query in queries.items():
-                label = query.get('label', query_key)
-                description = query.get('description', 'No description available')
-                example_code = evo_example_for_query(query_key, query.get('inputs', []))
-
-                # Use sdk_method field from api-definitions.json if available, otherwise fall back to query_key
-                sdk_method = query.get('sdk_method', query_key)
-
-                lines.append(f"**{label}** - `{sdk_method}`")
-                lines.append(f"*{description}*")
-                lines.append('')
-                if query.get('disabled'):
-                    lines.append(f"**Disabled:** {query['disabled']}")
-                    lines.append('')
-                lines.append(f"Signature: `{query['_sdk_signature']}`")
-                lines.append('')
-
-                append_param_section(lines, query.get('_sdk_parameters', []))
-
-                lines.append('Returns:')
-                lines.append('')
-                lines.append(f"- `{query['_return_type']}`")
-                type_links = render_type_links_markdown(query.get('_return_references', []))
-                if type_links:
-                    lines.append(type_links)
-                lines.append('')
-
-                lines.append('Example:')
-                lines.append('```javascript')
-                lines.append(format_ai_example_block(example_code, query_key))
-                lines.append('```')
-                lines.append('')
-
-    append_query_sections()
-
-    lines.extend([
+    yield from (
         '## State Transition Operations',
         '',
         '### Pattern',
@@ -1531,49 +2075,15 @@ def generate_ai_reference_md(query_defs: dict, transition_defs: dict, type_metad
         '```',
         '',
         '### Available State Transitions',
-    ])
+    )
 
-    for cat_key, category in transition_defs.items():
-        transitions = category.get('transitions') or {}
-        if not transitions:
-            continue
+    for category in ir.transitions:
+        yield f"#### {category.label}"
+        yield ''
+        for operation in category.operations:
+            yield ai_reference_operation_md(operation)
 
-        lines.append(f"#### {category.get('label', cat_key)}")
-        lines.append('')
-
-        for transition_key, transition in transitions.items():
-            label = transition.get('label', transition_key)
-            description = transition.get('description', 'No description available')
-            example_code = transition.get('sdk_example') or evo_example_for_transition(transition_key)
-            # Use sdk_method field from api-definitions.json if available, otherwise fall back to transition_key
-            sdk_method = transition.get('sdk_method', transition_key)
-
-            lines.append(f"**{label}** - `{sdk_method}`")
-            lines.append(f"*{description}*")
-            lines.append('')
-            if transition.get('disabled'):
-                lines.append(f"**Disabled:** {transition['disabled']}")
-                lines.append('')
-            lines.append(f"Signature: `{transition['_sdk_signature']}`")
-            lines.append('')
-
-            append_param_section(lines, transition.get('_sdk_parameters', []))
-
-            lines.append('Returns:')
-            lines.append('')
-            lines.append(f"- `{transition['_return_type']}`")
-            type_links = render_type_links_markdown(transition.get('_return_references', []))
-            if type_links:
-                lines.append(type_links)
-            lines.append('')
-
-            lines.append('Example:')
-            lines.append('```javascript')
-            lines.append(format_ai_example_block(example_code, transition_key))
-            lines.append('```')
-            lines.append('')
-
-    lines.extend([
+    yield from (
         '## Common Patterns',
         '',
         '### Error Handling',
@@ -1639,9 +2149,34 @@ def generate_ai_reference_md(query_defs: dict, transition_defs: dict, type_metad
         '- **Invalid parameters**: Check that required fields are present and types align with the documented parameter metadata.',
         '- **Authentication failures**: Confirm private keys are correct, funded, and permitted to sign the requested transition.',
         '- **Query errors**: Ensure contract IDs, document types, and field names exist on the network you are querying.',
-    ])
+    )
+
+
+def iter_ai_reference_md(ir: DocumentationIR) -> Iterable[str]:
+    for line in ai_reference_lines(ir):
+        yield line + '\n'
+
 
-    return '\n'.join(lines) + '\n'
+def generate_ai_reference_md(ir: DocumentationIR) -> str:
+    return ''.join(iter_ai_reference_md(ir))
+
+
+def source_date_epoch() -> int | None:
+    """The SOURCE_DATE_EPOCH reproducible-builds timestamp, when set."""
+    value = os.environ.get('SOURCE_DATE_EPOCH', '').strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise SystemExit(f'SOURCE_DATE_EPOCH must be an integer number of seconds, got {value!r}')
+
+
+def build_timestamp() -> str:
+    epoch = source_date_epoch()
+    if epoch is None:
+        return datetime.now(timezone.utc).isoformat()
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat()
 
 
 def generate_version_info() -> dict:
@@ -1669,68 +2204,602 @@ def generate_version_info() -> dict:
         version_info['commitHash'] = 'unknown'
 
     # Add build timestamp
-    version_info['buildTime'] = datetime.now(timezone.utc).isoformat()
+    version_info['buildTime'] = build_timestamp()
 
     return version_info
 
 
-def main() -> None:
-    global TRANSITION_OPERATION_EXAMPLES
-    api_file = PUBLIC_DIR / 'api-definitions.json'
-    if not api_file.exists():
-        raise SystemExit(f'api-definitions.json not found at {api_file}')
+@dataclass(frozen=True)
+class ArtifactTarget:
+    """A node in the artifact build graph.
+
+    `inputs` names the shared metadata the renderer consumes: `definitions`
+    (api-definitions.json), `type_metadata` (the extracted operation catalog),
+    and `transition_examples` (examples rendered from the browser transition
+    registry, which needs public/dist). Every renderer reads them through the
+    operation IR in `context['ir']`, built once per run.
+    """
+    name: str
+    files: Tuple[str, ...]
+    inputs: Tuple[str, ...]
+    render: Callable[[dict, Path], List[ArtifactRecord]]
+
+
+def iter_catalog_json(type_metadata: dict) -> Iterable[str]:
+    yield from json.JSONEncoder(indent=2).iterencode(type_metadata)
+    yield '\n'
+
+
+def render_catalog_target(context: dict, output_dir: Path) -> List[ArtifactRecord]:
+    type_metadata = context['ir'].type_metadata
+    return [
+        write_chunks(output_dir, 'sdk-operation-catalog.json', iter_catalog_json(type_metadata)),
+        write_chunks(output_dir, COMPACT_CATALOG_NAME, [dumps_compact(encode_catalog(type_metadata))]),
+        *write_catalog_shards(output_dir, type_metadata),
+    ]
+
 
+def render_docs_target(context: dict, output_dir: Path) -> List[ArtifactRecord]:
+    layout = context['docs_layout']
+    records = []
+    if layout == 'split':
+        # Fragments first, so the shell never points at a section that isn't there yet.
+        records = [write_chunks(output_dir, name, chunks) for name, chunks in iter_docs_fragments(context['ir'])]
+    records.append(write_chunks(output_dir, 'docs.html', iter_docs_html(context['ir'], layout, context['sdk_files'])))
+    prune_docs_fragments(output_dir, [record.name for record in records])
+    return records
+
+
+def render_search_target(context: dict, output_dir: Path) -> List[ArtifactRecord]:
+    return [write_chunks(output_dir, SEARCH_INDEX_NAME, [dumps_search_index(build_search_index(context['ir']))])]
+
+
+def render_ai_reference_target(context: dict, output_dir: Path) -> List[ArtifactRecord]:
+    chunks = iter_ai_reference_md(context['ir'])
+    return [write_chunks(output_dir, 'AI_REFERENCE.md', chunks)]
+
+
+def render_type_reference_md_target(context: dict, output_dir: Path) -> List[ArtifactRecord]:
+    return [write_chunks(output_dir, 'TYPE_REFERENCE.md', iter_type_reference_md(context['ir'].type_metadata))]
+
+
+def render_type_reference_html_target(context: dict, output_dir: Path) -> List[ArtifactRecord]:
+    return [write_chunks(output_dir, 'TYPE_REFERENCE.html', iter_type_reference_html(context['ir'].type_metadata))]
+
+
+ARTIFACT_TARGETS = {
+    target.name: target
+    for target in (
+        ArtifactTarget('docs', ('docs.html',), ('definitions', 'type_metadata', 'transition_examples'), render_docs_target),
+        ArtifactTarget('ai', ('AI_REFERENCE.md',), ('definitions', 'type_metadata', 'transition_examples'), render_ai_reference_target),
+        ArtifactTarget('types-md', ('TYPE_REFERENCE.md',), ('type_metadata',), render_type_reference_md_target),
+        ArtifactTarget('types-html', ('TYPE_REFERENCE.html',), ('type_metadata',), render_type_reference_html_target),
+        ArtifactTarget('catalog', ('sdk-operation-catalog.json', COMPACT_CATALOG_NAME, INDEX_NAME), ('type_metadata',), render_catalog_target),
+        ArtifactTarget('search', (SEARCH_INDEX_NAME,), ('definitions', 'type_metadata'), render_search_target),
+    )
+}
+TARGET_ALIASES = {'types': ('types-md', 'types-html')}
+GENERATED_FILES = [name for target in ARTIFACT_TARGETS.values() for name in target.files]
+
+
+def select_targets(only: str | None) -> List[ArtifactTarget]:
+    """Resolve a comma-separated `--only` selection (with aliases) to graph nodes in build order."""
+    if not only:
+        return list(ARTIFACT_TARGETS.values())
+    selected = set()
+    for raw_name in only.split(','):
+        name = raw_name.strip()
+        if not name:
+            continue
+        if name in TARGET_ALIASES:
+            selected.update(TARGET_ALIASES[name])
+        elif name in ARTIFACT_TARGETS:
+            selected.add(name)
+        else:
+            choices = ', '.join(sorted([*ARTIFACT_TARGETS, *TARGET_ALIASES]))
+            raise SystemExit(f'Unknown artifact target {name!r}; choose from: {choices}')
+    return [target for name, target in ARTIFACT_TARGETS.items() if name in selected]
+
+
+_RENDER_CONTEXT: dict = {}
+
+
+def _init_render_process(context: dict) -> None:
+    global _RENDER_CONTEXT, FRAGMENTS
+    _RENDER_CONTEXT = context
+    fragment_cache = context.get('fragment_cache')
+    FRAGMENTS = FragmentCache(Path(fragment_cache['root']), fragment_cache['renderer_version']) if fragment_cache else None
+
+
+def render_target(target: ArtifactTarget, context: dict, output_dir: Path) -> List[ArtifactRecord]:
+    """Render one graph node and refresh the precompressed siblings of everything it wrote."""
+    with PROFILER.phase(f'render {target.name}', 'renderer'):
+        records = target.render(context, output_dir)
+        if FRAGMENTS is not None:
+            FRAGMENTS.flush()
+    with PROFILER.phase(f'compress {target.name}', 'renderer'):
+        for record in list(records):
+            records.extend(write_compressed_variants(output_dir, record.name))
+    return records
+
+
+def _init_pool_process(context: dict) -> None:
+    global PROFILER
+    _init_render_process(context)
+    PROFILER = PhaseProfiler(context.get('profile', False), 'renderer')
+
+
+def _render_in_process(name: str, output_dir: Path) -> Tuple[List[ArtifactRecord], List[dict]]:
+    records = render_target(ARTIFACT_TARGETS[name], _RENDER_CONTEXT, output_dir)
+    return records, PROFILER.drain()
+
+
+def render_targets(targets: List[ArtifactTarget], context: dict, output_dir: Path, jobs: int) -> List[ArtifactRecord]:
+    """Run the selected renderers; independent targets share one process pool."""
+    if jobs <= 1 or len(targets) <= 1:
+        _init_render_process(context)
+        return [record for target in targets for record in render_target(target, context, output_dir)]
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(targets)),
+        initializer=_init_pool_process,
+        initargs=(context,),
+    ) as pool:
+        futures = [pool.submit(_render_in_process, target.name, output_dir) for target in targets]
+        records = []
+        for future in futures:
+            target_records, events = future.result()
+            PROFILER.extend(events)
+            records.extend(target_records)
+        return records
+
+
+def write_version_info(store: ArtifactStore, refresh_only: bool = False) -> dict:
+    """Write version-info.json; with refresh_only, keep it when SDK version and commit are unchanged.
+
+    Under SOURCE_DATE_EPOCH it is always rewritten, so the build time is the epoch's.
+    """
+    version_file = store.output_dir / 'version-info.json'
+    version_info = generate_version_info()
+    if refresh_only and source_date_epoch() is None and version_file.exists():
+        try:
+            existing = json.loads(version_file.read_text(encoding='utf-8'))
+        except ValueError:
+            existing = {}
+        if all(existing.get(key) == version_info[key] for key in ('sdkVersion', 'commitHash')):
+            return existing
+    store.write_json('version-info.json', version_info, indent=2)
+    return version_info
+
+
+def read_manifest(output_dir: Path) -> dict:
+    try:
+        return json.loads((output_dir / 'docs_manifest.json').read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(store: ArtifactStore, manifest: dict) -> None:
+    """Write docs_manifest.json, keeping the previous `generated_at` when nothing else changed.
+
+    Under SOURCE_DATE_EPOCH the timestamp is the epoch's, so nothing is carried over.
+    """
+    previous = read_manifest(store.output_dir)
+    unchanged = {**previous, 'generated_at': None} == {**manifest, 'generated_at': None}
+    if manifest.get('source_date_epoch') is None and previous.get('generated_at') and unchanged:
+        manifest = {**manifest, 'generated_at': previous['generated_at']}
+    store.write_json('docs_manifest.json', manifest, indent=2)
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Generate Evo SDK documentation artifacts.')
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore the content-addressed build cache and regenerate every artifact.',
+    )
+    parser.add_argument(
+        '--only',
+        metavar='TARGETS',
+        help=(
+            'Comma-separated artifacts to rebuild: '
+            + ', '.join([*ARTIFACT_TARGETS, *TARGET_ALIASES])
+            + ' (the others must already exist).'
+        ),
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Maximum renderer processes to run concurrently (default: CPU count; 1 renders inline).',
+    )
+    parser.add_argument(
+        '--docs-layout',
+        choices=DOCS_LAYOUTS,
+        default='single',
+        help=(
+            'single: one docs.html with every operation (default). split: a docs.html shell with the '
+            f'sidebar and overview, plus one {DOCS_FRAGMENT_DIR}/<query|transition>-<category>.html '
+            'per category, fetched as the reader scrolls or follows a link.'
+        ),
+    )
+    parser.add_argument(
+        '--output-dir',
+        metavar='DIR',
+        help='Write the artifacts to DIR instead of public/ (inputs are still read from public/).',
+    )
+    parser.add_argument(
+        '--site-dir',
+        metavar='DIR',
+        help=(
+            'Also assemble a deployable copy of the site in DIR, with scripts, stylesheets, WebAssembly '
+            'and docs fragments under content-hashed names and every reference to them rewritten.'
+        ),
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='After a full build, keep watching the inputs and rebuild only the artifacts each change affects.',
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const=str(PROFILE_TRACE_FILE),
+        metavar='TRACE',
+        help=(
+            'Record wall time, CPU time and peak memory per phase and renderer; writes a Chrome trace '
+            f'(default: {PROFILE_TRACE_FILE.name}) and appends a summary to documentation-check-report.txt.'
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def prepare_public_dist(public_dist: Path) -> None:
     # Transition modules import the browser SDK bundle through sdk-types.js, so
     # prepare public/dist before rendering examples on a clean checkout.
-    public_dist = PUBLIC_DIR / 'dist'
-    if copy_node_modules_dist('@dashevo/evo-sdk', public_dist):
-        print('Copied Evo SDK dist from node_modules into public/dist')
-        rewrite_wasm_wrapper(public_dist / 'wasm.js')
-    else:
+    with PROFILER.phase('sync SDK dist'):
+        synced = sync_node_modules_dist('@dashevo/evo-sdk', public_dist)
+    if synced is None:
         raise SystemExit('Evo SDK dist not found; install dependencies before generating documentation.')
+    if synced.copied or synced.removed:
+        print(
+            f'Synced Evo SDK dist from node_modules into public/dist '
+            f'({synced.copied} updated, {synced.removed} removed, {synced.unchanged} unchanged)'
+        )
 
-    queries, transitions = load_api_definitions(api_file)
-    TRANSITION_OPERATION_EXAMPLES = load_transition_operation_examples()
-    type_metadata = load_sdk_type_metadata(api_file)
-    attach_sdk_metadata(queries, transitions, type_metadata)
 
-    (PUBLIC_DIR / 'sdk-operation-catalog.json').write_text(
-        json.dumps(type_metadata, indent=2) + '\n', encoding='utf-8'
-    )
+def site_roots(output_dir: Path) -> List[Path]:
+    """public/ with the generated artifacts laid over it, when they were written elsewhere."""
+    return [PUBLIC_DIR] if output_dir.resolve() == PUBLIC_DIR.resolve() else [PUBLIC_DIR, output_dir]
 
-    docs_html = generate_docs_html(queries, transitions, type_metadata)
-    (PUBLIC_DIR / 'docs.html').write_text(docs_html, encoding='utf-8')
 
-    ai_md = generate_ai_reference_md(queries, transitions, type_metadata)
-    (PUBLIC_DIR / 'AI_REFERENCE.md').write_text(ai_md, encoding='utf-8')
+def publish_precache_manifest(store: ArtifactStore, plan: AssetPlan) -> str:
+    """Write precache-manifest.js and stage its fingerprinted copy for the site; returns the cache version."""
+    version, text = render_precache_manifest(plan, fingerprinted=False)
+    store.write_text(PRECACHE_MANIFEST_NAME, text)
+    plan.sources[PRECACHE_MANIFEST_NAME] = store.output_dir / PRECACHE_MANIFEST_NAME
+    plan.rewritten[PRECACHE_MANIFEST_NAME] = render_precache_manifest(plan, fingerprinted=True)[1].encode('utf-8')
+    return version
 
-    type_reference_md = generate_type_reference_md(type_metadata)
-    (PUBLIC_DIR / 'TYPE_REFERENCE.md').write_text(type_reference_md, encoding='utf-8')
 
-    type_reference_html = generate_type_reference_html(type_metadata)
-    (PUBLIC_DIR / 'TYPE_REFERENCE.html').write_text(type_reference_html, encoding='utf-8')
+def refresh_asset_map(output_dir: Path) -> Tuple[AssetPlan, bool]:
+    """Re-fingerprint the assets after a cache restore, since static assets may have changed.
+
+    Returns the plan and whether docs_manifest.json had to be updated.
+    """
+    with PROFILER.phase('fingerprint assets'):
+        plan = plan_assets(site_roots(output_dir))
+        current = {'assets': plan.assets, 'precache_version': publish_precache_manifest(ArtifactStore(output_dir), plan)}
+    manifest = read_manifest(output_dir)
+    if not manifest or all(manifest.get(key) == value for key, value in current.items()):
+        return plan, False
+    write_manifest(ArtifactStore(output_dir), {**manifest, 'generated_at': build_timestamp(), **current})
+    return plan, True
+
+
+def store_build(cache: BuildCache, build_key: str, output_dir: Path, artifact_names: List[str], formats: Tuple[str, ...]) -> None:
+    compressed_files = [f'{name}.{fmt}' for name in artifact_names for fmt in formats]
+    with PROFILER.phase('store build cache'):
+        cache.store(build_key, output_dir, artifact_names + compressed_files + ['docs_manifest.json'])
+
+
+def publish_site(plan: AssetPlan, site_dir: Path) -> None:
+    with PROFILER.phase('write site'):
+        synced = write_site(plan, site_dir)
+    if synced.copied or synced.removed:
+        print(
+            f'Wrote fingerprinted site to {site_dir} '
+            f'({synced.copied} updated, {synced.removed} removed, {synced.unchanged} unchanged)'
+        )
 
-    # Generate version info
-    version_info = generate_version_info()
-    (PUBLIC_DIR / 'version-info.json').write_text(json.dumps(version_info, indent=2), encoding='utf-8')
-    print(f'Generated version info: SDK {version_info["sdkVersion"]}, commit {version_info["commitHash"]}')
 
-    generated_files = ['docs.html', 'AI_REFERENCE.md', 'TYPE_REFERENCE.md', 'TYPE_REFERENCE.html', 'sdk-operation-catalog.json']
-    manifest = {
-        'generated_at': datetime.now(timezone.utc).isoformat(),
-        'source_api': 'api-definitions.json',
-        'operation_catalog': {'file': 'sdk-operation-catalog.json', 'schema_version': type_metadata['schemaVersion']},
-        'sdk_types': type_metadata['sdk'],
-        'documented_operations': len(type_metadata['operations']),
-        'resolved_sdk_methods': len(type_metadata['methods']),
-        'files': generated_files + ['version-info.json'],
-        'content_sha256': {
-            name: hashlib.sha256((PUBLIC_DIR / name).read_bytes()).hexdigest()
-            for name in generated_files
-        },
+def render_context(ir: DocumentationIR, use_cache: bool, docs_layout: str) -> dict:
+    return {
+        'ir': ir,
+        'docs_layout': docs_layout,
+        # The SDK module graph in public/dist, which docs.html downloads on the first Run.
+        'sdk_files': module_files(PUBLIC_DIR / 'dist', SDK_MODULE_NAME),
+        # Operation fragments are keyed by the generator source, so editing a renderer invalidates them.
+        'fragment_cache': {
+            'root': str(FRAGMENT_CACHE_DIR),
+            'renderer_version': hash_file(Path(__file__)),
+        } if use_cache else None,
+        'profile': PROFILER.enabled,
     }
-    (PUBLIC_DIR / 'docs_manifest.json').write_text(json.dumps(manifest, indent=2), encoding='utf-8')
-    print('Generated: docs.html, AI_REFERENCE.md, TYPE_REFERENCE.md, TYPE_REFERENCE.html, sdk-operation-catalog.json, docs_manifest.json, version-info.json')
+
+
+def publish_artifacts(
+    targets: List[ArtifactTarget],
+    context: dict,
+    output_dir: Path,
+    jobs: int,
+    fingerprints: dict | None,
+    formats: Tuple[str, ...],
+    partial: bool,
+    site_dir: Path | None = None,
+) -> List[str]:
+    """Render `targets`, then refresh version-info.json and docs_manifest.json; returns the artifact names.
+
+    With `site_dir`, the fingerprinted deployable copy of the site is assembled there as well.
+    """
+    type_metadata = context['ir'].type_metadata
+    store = ArtifactStore(output_dir)
+    with PROFILER.phase('render artifacts'):
+        for record in render_targets(targets, context, output_dir, jobs):
+            store.add(record)
+    rendered = [name for target in targets for name in target.files]
+    # Catalog shards are content-addressed, so their names come from the index.
+    artifact_names = (
+        GENERATED_FILES
+        + docs_fragment_names(context['ir'], context['docs_layout'])
+        + shard_names(read_index(output_dir))
+    )
+    with PROFILER.phase('compress kept artifacts'):
+        for name in artifact_names:
+            if name not in store.records:
+                # Kept from an earlier build; its siblings may predate compression support.
+                for record in write_compressed_variants(output_dir, name):
+                    store.add(record)
+    rendered_changed = store.changed()
+
+    # Generate version info; the build time only moves when an artifact actually changed.
+    with PROFILER.phase('write version info'):
+        version_info = write_version_info(store, refresh_only=not rendered_changed)
+    print(f'Generated version info: SDK {version_info["sdkVersion"]}, commit {version_info["commitHash"]}')
+
+    with PROFILER.phase('write manifest'):
+        previous_manifest = read_manifest(output_dir)
+        if partial and previous_manifest.get('input_fingerprints') != fingerprints:
+            # Targets left out of this build may predate the current inputs, so the
+            # manifest must not vouch for them; check_documentation.py then runs deep.
+            fingerprints = None
+
+        manifest = {
+            'generated_at': build_timestamp(),
+            'source_date_epoch': source_date_epoch(),
+            'input_fingerprints': fingerprints,
+            'source_api': 'api-definitions.json',
+            'docs_layout': context['docs_layout'],
+            'operation_catalog': {'file': 'sdk-operation-catalog.json', 'schema_version': type_metadata['schemaVersion']},
+            'sdk_types': type_metadata['sdk'],
+            'documented_operations': len(type_metadata['operations']),
+            'resolved_sdk_methods': len(type_metadata['methods']),
+            'files': artifact_names + ['version-info.json', PRECACHE_MANIFEST_NAME],
+            'content_sha256': store.sha256(artifact_names),
+            'catalog_merkle': catalog_tree(type_metadata),
+            'compressed': {
+                name: {
+                    fmt: {'sha256': store.record(f'{name}.{fmt}').sha256, 'size': store.record(f'{name}.{fmt}').size}
+                    for fmt in formats
+                }
+                for name in artifact_names
+            },
+        }
+        with PROFILER.phase('fingerprint assets'):
+            plan = plan_assets(site_roots(output_dir))
+            manifest['precache_version'] = publish_precache_manifest(store, plan)
+        manifest['assets'] = plan.assets
+        if previous_manifest.get('catalog_merkle'):
+            for line in describe_drift(diff_trees(previous_manifest['catalog_merkle'], manifest['catalog_merkle'])):
+                print(f'Catalog {line}')
+        write_manifest(store, manifest)
+    unchanged = [name for name in rendered if name not in rendered_changed]
+    print(f"Generated: {', '.join(rendered)}, docs_manifest.json, version-info.json")
+    if unchanged:
+        print(f"Unchanged (left untouched): {', '.join(unchanged)}")
+    if site_dir is not None:
+        publish_site(plan, site_dir)
+    return artifact_names
+
+
+# Watched input groups (those of build_cache.input_patterns) and the ArtifactTarget
+# inputs a change to each one invalidates. A generator source change restarts
+# the process instead, since the running one still holds the old code.
+WATCH_INPUTS = {
+    'api_definitions': ('definitions', 'type_metadata', 'transition_examples'),
+    'transition_modules': ('transition_examples',),
+    'sdk_package': ('definitions', 'type_metadata', 'transition_examples'),
+    'wasm_sdk_package': ('definitions', 'type_metadata', 'transition_examples'),
+    'sdk_declarations': ('definitions', 'type_metadata', 'transition_examples'),
+    'generator_sources': (),
+}
+SDK_PACKAGE_INPUTS = {'sdk_package', 'wasm_sdk_package'}
+
+
+def watch(args: argparse.Namespace) -> None:
+    """Rebuild the artifacts affected by each settled change to the documentation inputs."""
+    global TRANSITION_OPERATION_EXAMPLES
+    api_file = PUBLIC_DIR / 'api-definitions.json'
+    output_dir = Path(args.output_dir) if args.output_dir else PUBLIC_DIR
+    formats = compression_formats()
+    watcher = InputWatcher(input_patterns(REPO_ROOT, api_file))
+    # Declaration extraction stays warm across rebuilds (parsed files are revalidated
+    # by mtime). Node caches ES modules, so the worker that imports the transition
+    # registry is restarted whenever a transition module changes.
+    extractor = SdkWorker(REPO_ROOT)
+    examples_worker = SdkWorker(REPO_ROOT)
+    queries = transitions = type_metadata = None
+    catalog_root = None
+    pending = set(WATCH_INPUTS)
+    print(
+        'Watching api-definitions.json, public/src/transitions/*.js, the installed SDK '
+        'and scripts/ (Ctrl+C to stop)'
+    )
+    try:
+        while True:
+            started = time.perf_counter()
+            inputs = {name for group in pending for name in WATCH_INPUTS[group]}
+            try:
+                if pending & SDK_PACKAGE_INPUTS:
+                    prepare_public_dist(PUBLIC_DIR / 'dist')
+                    extractor.close()
+                if pending & SDK_PACKAGE_INPUTS or 'transition_modules' in pending:
+                    examples_worker.close()
+                if 'definitions' in inputs:
+                    queries, transitions = load_api_definitions(api_file)
+                if 'transition_examples' in inputs:
+                    TRANSITION_OPERATION_EXAMPLES = load_transition_operation_examples(api_file, examples_worker)
+                if 'type_metadata' in inputs:
+                    type_metadata = load_sdk_type_metadata(api_file, extractor)
+                    root = catalog_tree(type_metadata)['root']
+                    if root == catalog_root:
+                        inputs.discard('type_metadata')
+                    catalog_root = root
+                ir = build_operation_ir(queries, transitions, type_metadata)
+                targets = [target for target in ARTIFACT_TARGETS.values() if inputs & set(target.inputs)]
+                publish_artifacts(
+                    targets,
+                    render_context(ir, not args.no_cache, args.docs_layout),
+                    output_dir,
+                    args.jobs,
+                    input_fingerprints(REPO_ROOT, api_file),
+                    formats,
+                    partial=False,
+                    site_dir=Path(args.site_dir) if args.site_dir else None,
+                )
+            except (SdkWorkerError, ValueError, OSError) as e:
+                # Keep the failed groups pending so the next save retries them.
+                print(f'Rebuild failed: {e}')
+            else:
+                print(f"Rebuilt {', '.join(target.name for target in targets)} in {time.perf_counter() - started:.2f}s")
+                pending = set()
+            changed = watcher.wait()
+            print(f"Changed: {', '.join(sorted(changed))}")
+            if 'generator_sources' in changed:
+                print('Generator sources changed; restarting')
+                extractor.close()
+                examples_worker.close()
+                os.execv(sys.executable, [sys.executable, *sys.argv])
+            pending |= changed
+    except KeyboardInterrupt:
+        pass
+    finally:
+        extractor.close()
+        examples_worker.close()
+
+
+def generate(args: argparse.Namespace) -> None:
+    global TRANSITION_OPERATION_EXAMPLES
+    api_file = PUBLIC_DIR / 'api-definitions.json'
+    if not api_file.exists():
+        raise SystemExit(f'api-definitions.json not found at {api_file}')
+    if args.watch:
+        if args.only:
+            raise SystemExit('--watch rebuilds whichever artifacts a change affects; it cannot be combined with --only.')
+        watch(args)
+        return
+
+    output_dir = Path(args.output_dir) if args.output_dir else PUBLIC_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if args.site_dir and Path(args.site_dir).resolve().is_relative_to(PUBLIC_DIR.resolve()):
+        raise SystemExit('--site-dir must be outside public/, which it is assembled from.')
+    targets = select_targets(args.only)
+    partial = len(targets) != len(ARTIFACT_TARGETS)
+    if partial:
+        missing = [
+            name for name in GENERATED_FILES
+            if not any(name in target.files for target in targets) and not (output_dir / name).exists()
+        ]
+        if missing:
+            raise SystemExit(f"--only requires existing {', '.join(missing)}; run a full yarn generate first.")
+        previous_layout = read_manifest(output_dir).get('docs_layout', 'single')
+        if ARTIFACT_TARGETS['docs'] not in targets and previous_layout != args.docs_layout:
+            raise SystemExit(f'docs.html was built with --docs-layout {previous_layout}; include docs in --only to switch.')
+    needed_inputs = {name for target in targets for name in target.inputs}
+
+    public_dist = PUBLIC_DIR / 'dist'
+    cache = None if args.no_cache or partial else BuildCache(BUILD_CACHE_DIR)
+    formats = compression_formats()
+    with PROFILER.phase('fingerprint inputs'):
+        fingerprints = input_fingerprints(REPO_ROOT, api_file)
+    build_key = cache_key(fingerprints, {'compression': list(formats), 'docs_layout': args.docs_layout})
+    if cache is not None:
+        with PROFILER.phase('restore build cache'):
+            restored = cache.restore(build_key, output_dir)
+        if restored is not None:
+            # The cache holds the generated artifacts, not public/dist: still repair
+            # a dist copy that was deleted, interrupted or edited (cheap when current).
+            prepare_public_dist(public_dist)
+            prune_stale_shards(output_dir, shard_names(read_index(output_dir)))
+            prune_docs_fragments(output_dir, read_manifest(output_dir).get('files', []))
+            version_info = write_version_info(ArtifactStore(output_dir), refresh_only=True)
+            plan, manifest_changed = refresh_asset_map(output_dir)
+            if manifest_changed:
+                # Keep the entry's manifest current, or every later restore would rewrite it again.
+                kept = [
+                    name for name in read_manifest(output_dir)['files']
+                    if name not in ('version-info.json', PRECACHE_MANIFEST_NAME)
+                ]
+                store_build(cache, build_key, output_dir, kept, formats)
+            detail = f"restored {', '.join(restored)}" if restored else 'artifacts already current'
+            print(f'Documentation inputs unchanged (build {build_key[:12]}); {detail}')
+            print(f'Version info: SDK {version_info.get("sdkVersion")}, commit {version_info.get("commitHash")}')
+            if args.site_dir:
+                publish_site(plan, Path(args.site_dir))
+            return
+
+    if 'transition_examples' in needed_inputs:
+        prepare_public_dist(public_dist)
+
+    with PROFILER.phase('load api definitions'):
+        queries, transitions = load_api_definitions(api_file)
+    # One warm Node worker serves both the registry render and the declaration extraction.
+    try:
+        with SdkWorker(REPO_ROOT) as worker:
+            if PROFILER.enabled:
+                # Time Node startup on its own rather than inside the first request.
+                with PROFILER.phase('node: start worker', 'node'):
+                    worker.call('ping')
+            if 'transition_examples' in needed_inputs:
+                with PROFILER.phase('node: render transition examples', 'node'):
+                    TRANSITION_OPERATION_EXAMPLES = load_transition_operation_examples(api_file, worker)
+            with PROFILER.phase('node: extract SDK types', 'node'):
+                type_metadata = load_sdk_type_metadata(api_file, worker)
+    except SdkWorkerError as e:
+        raise SystemExit(f'SDK metadata extraction failed: {e}')
+    with PROFILER.phase('build operation IR'):
+        ir = build_operation_ir(queries, transitions, type_metadata)
+
+    context = render_context(ir, not args.no_cache, args.docs_layout)
+    site_dir = Path(args.site_dir) if args.site_dir else None
+    artifact_names = publish_artifacts(targets, context, output_dir, args.jobs, fingerprints, formats, partial, site_dir)
+
+    if cache is not None:
+        store_build(cache, build_key, output_dir, artifact_names, formats)
+
+
+def main(argv: List[str] | None = None) -> None:
+    global PROFILER
+    args = parse_args(argv)
+    PROFILER = PhaseProfiler(args.profile is not None, 'generate_docs.py')
+    with PROFILER.phase('generate_docs.py', 'run'):
+        generate(args)
+    if args.profile is not None:
+        trace_file = Path(args.profile)
+        PROFILER.write_trace(trace_file)
+        summary = summary_lines(PROFILER.events, f'Profile: generate_docs.py ({datetime.now().isoformat()})')
+        append_summary(CHECK_REPORT_FILE, summary)
+        print('\n'.join(summary))
+        print(f'Wrote trace to {trace_file} and appended the summary to {CHECK_REPORT_FILE.name}')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,66 @@
+"""
+Polling file watcher for `generate_docs.py --watch`.
+
+Inputs are grouped by name (the groups of `build_cache.input_patterns`); each
+group is a list of glob patterns (`**` spans directories), so files added to
+or removed from a watched directory count as changes. Every poll stats the
+matched files, and a burst of saves is reported once, after the inputs have
+been quiet for the debounce window. Polling keeps the watcher dependency-free
+and behaves the same on every platform and with editors that save by rename.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+POLL_INTERVAL = 0.1
+DEBOUNCE = 0.2
+
+Snapshot = Dict[str, Dict[str, Tuple[int, int]]]
+
+
+class InputWatcher:
+    def __init__(self, groups: Dict[str, List[Path]], interval: float = POLL_INTERVAL, debounce: float = DEBOUNCE):
+        self.groups = groups
+        self.interval = interval
+        self.debounce = debounce
+        self._state = self.snapshot()
+
+    def _stat_group(self, patterns: List[Path]) -> Dict[str, Tuple[int, int]]:
+        stats = {}
+        for pattern in patterns:
+            for name in sorted(glob.glob(str(pattern), recursive=True)):
+                try:
+                    stat = os.stat(name)
+                except OSError:
+                    # Removed between the glob and the stat; the next poll sees it gone.
+                    continue
+                stats[name] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def snapshot(self) -> Snapshot:
+        return {group: self._stat_group(patterns) for group, patterns in self.groups.items()}
+
+    def poll(self) -> Set[str]:
+        """Groups that changed since the previous poll."""
+        current = self.snapshot()
+        changed = {group for group, stats in current.items() if stats != self._state.get(group)}
+        self._state = current
+        return changed
+
+    def wait(self) -> Set[str]:
+        """Block until some inputs change and then settle; returns the groups that changed."""
+        changed: Set[str] = set()
+        last_change = 0.0
+        while True:
+            time.sleep(self.interval)
+            moved = self.poll()
+            if moved:
+                changed |= moved
+                last_change = time.monotonic()
+            elif changed and time.monotonic() - last_change >= self.debounce:
+                return changed
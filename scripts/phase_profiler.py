@@ -0,0 +1,135 @@
+"""
+Phase-level profiling for the documentation scripts (`--profile`).
+
+Each phase records wall time, CPU time of the calling thread and the peak of
+Python allocations traced by tracemalloc while it ran. Phases nest, may run
+on several threads, and renderer processes send theirs back to the parent,
+so one run yields a single Chrome trace-event file (open it in
+chrome://tracing or https://ui.perfetto.dev) plus a plain-text summary table.
+
+tracemalloc tracks the whole process, so the peaks of phases that overlap on
+different threads include each other's allocations. Timestamps come from
+time.perf_counter_ns, which on Linux and macOS is a system-wide monotonic
+clock shared by the renderer processes.
+
+A disabled profiler hands out a no-op context, so instrumented code costs
+nothing when --profile is not given.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+
+class PhaseProfiler:
+    def __init__(self, enabled: bool = False, process_name: str | None = None):
+        self.enabled = enabled
+        self.events: List[dict] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            if process_name:
+                self.events.append({'name': 'process_name', 'ph': 'M', 'pid': os.getpid(), 'args': {'name': process_name}})
+
+    def _stack(self) -> List[list]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextlib.contextmanager
+    def _record(self, name: str, category: str) -> Iterator[None]:
+        stack = self._stack()
+        if stack:
+            # Fold the enclosing phase's peak so far in before resetting the counter for this one.
+            stack[-1][0] = max(stack[-1][0], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        frame = [0]
+        stack.append(frame)
+        started = time.perf_counter_ns()
+        cpu_started = time.thread_time_ns()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter_ns() - started
+            cpu = time.thread_time_ns() - cpu_started
+            stack.pop()
+            peak = max(frame[0], tracemalloc.get_traced_memory()[1])
+            if stack:
+                stack[-1][0] = max(stack[-1][0], peak)
+            event = {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': started // 1000,
+                'dur': wall // 1000,
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+                'args': {'cpu_ms': round(cpu / 1e6, 3), 'peak_kib': round(peak / 1024, 1)},
+            }
+            with self._lock:
+                self.events.append(event)
+
+    def phase(self, name: str, category: str = 'phase'):
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._record(name, category)
+
+    def extend(self, events: List[dict]) -> None:
+        """Add phases recorded by another process (e.g. a renderer in the pool)."""
+        with self._lock:
+            self.events.extend(events)
+
+    def drain(self) -> List[dict]:
+        """Hand over and forget the events recorded so far."""
+        with self._lock:
+            events, self.events = self.events, []
+        return events
+
+    def trace(self) -> dict:
+        metadata = [event for event in self.events if event['ph'] == 'M']
+        phases = sorted((event for event in self.events if event['ph'] != 'M'), key=lambda event: event['ts'])
+        origin = phases[0]['ts'] if phases else 0
+        return {
+            'traceEvents': metadata + [{**event, 'ts': event['ts'] - origin} for event in phases],
+            'displayTimeUnit': 'ms',
+        }
+
+    def write_trace(self, path: Path) -> None:
+        path.write_text(json.dumps(self.trace(), indent=1) + '\n', encoding='utf-8')
+
+
+def summary_lines(events: List[dict], title: str) -> List[str]:
+    """Tabulate complete ('X') events, slowest phase first; repeated names are summed."""
+    totals: Dict[str, list] = {}
+    for event in events:
+        if event.get('ph') != 'X':
+            continue
+        entry = totals.setdefault(event['name'], [0, 0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += event['dur']
+        entry[2] += event['args']['cpu_ms']
+        entry[3] = max(entry[3], event['args']['peak_kib'])
+    width = max([len('Phase'), *map(len, totals)])
+    lines = [
+        title,
+        f"{'Phase':<{width}}  {'Calls':>5}  {'Wall ms':>9}  {'CPU ms':>9}  {'Peak KiB':>10}",
+        '-' * (width + 41),
+    ]
+    for name, (calls, wall_us, cpu_ms, peak_kib) in sorted(totals.items(), key=lambda item: -item[1][1]):
+        lines.append(f'{name:<{width}}  {calls:>5}  {wall_us / 1000:>9.1f}  {cpu_ms:>9.1f}  {peak_kib:>10.1f}')
+    return lines
+
+
+def append_summary(report_file: Path, lines: List[str]) -> None:
+    with report_file.open('a', encoding='utf-8') as f:
+        f.write('\n\n' + '\n'.join(lines) + '\n')
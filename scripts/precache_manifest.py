@@ -0,0 +1,73 @@
+"""
+Service-worker precache manifest (`precache-manifest.js`).
+
+service-worker-simple.js loads this file with importScripts. It lists what a
+first visit caches so that later visits load instantly and work offline:
+- the entry pages,
+- every script, stylesheet, WebAssembly binary and docs fragment reachable
+  from them through the asset pipeline's reference graph,
+- the data files the pages fetch at run time.
+The cache version is a hash over the content of all of them. Any content
+change therefore moves the worker to a new cache, and a deploy that changes
+nothing keeps the old one, with no hand-bumped version. Browsers byte-compare
+imported scripts when they check for a worker update, so a new manifest is
+enough to install the new worker.
+
+The copy in public/ lists plain names and marks only the files that are
+already content-addressed (catalog shards, the SDK's WebAssembly binary) as
+immutable. The copy in a fingerprinted site (`--site-dir`) lists the hashed
+names and marks them all immutable. The worker serves immutable entries
+cache-first without revalidating, and serves everything else
+stale-while-revalidate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Tuple
+
+from asset_pipeline import PAGES, AssetPlan
+from catalog_shards import CATALOG_DIR, INDEX_NAME
+from compact_catalog import COMPACT_CATALOG_NAME
+from search_index import SEARCH_INDEX_NAME
+
+PRECACHE_MANIFEST_NAME = 'precache-manifest.js'
+VERSION_LENGTH = 16
+# Fetched by the pages at run time, so the reference graph cannot see them.
+RUNTIME_DATA = ('api-definitions.json', 'version-info.json', COMPACT_CATALOG_NAME, INDEX_NAME, SEARCH_INDEX_NAME)
+
+
+def _catalog_shards(plan: AssetPlan) -> set:
+    # Shards are named by content hash, so they are immutable under either layout.
+    return {
+        name for name in plan.sources
+        if name.startswith(f'{CATALOG_DIR}/') and name.endswith('.json') and name != INDEX_NAME
+    }
+
+
+def render_precache_manifest(plan: AssetPlan, fingerprinted: bool) -> Tuple[str, str]:
+    """The cache version and the manifest script, with hashed names when `fingerprinted`."""
+    shards = _catalog_shards(plan)
+    names = sorted(
+        plan.reachable(PAGES) | shards | {name for name in RUNTIME_DATA if name in plan.sources}
+    )
+    digest = hashlib.sha256()
+    for name in names:
+        # A hashed asset name already stands for its bytes.
+        token = plan.assets[name] if name in plan.assets else hashlib.sha256(plan.read(name)).hexdigest()
+        digest.update(f'{name}\0{token}\0'.encode('utf-8'))
+    if fingerprinted:
+        urls = [plan.assets.get(name, name) for name in names]
+        immutable = sorted({plan.assets[name] for name in names if name in plan.assets} | shards)
+    else:
+        urls = names
+        # Assets whose plain name already carries their hash (see asset_pipeline.hashed_name).
+        immutable = sorted({name for name in names if plan.assets.get(name) == name} | shards)
+    version = digest.hexdigest()[:VERSION_LENGTH]
+    manifest = {'version': version, 'urls': urls, 'immutable': immutable}
+    return version, (
+        '// Generated by scripts/generate_docs.py from the files it publishes; do not edit.\n'
+        f'self.EVO_PRECACHE = {json.dumps(manifest, indent=2)};\n'
+    )
+
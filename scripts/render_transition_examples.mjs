@@ -1,22 +1,34 @@
 import fs from 'node:fs';
-import { transitionOperations } from '../public/src/transitions/registry.js';
+import path from 'node:path';
+import { fileURLToPath } from 'node:url';
 
-const definitions = JSON.parse(fs.readFileSync(new URL('../public/api-definitions.json', import.meta.url), 'utf8'));
-const byKey = new Map();
-for (const category of Object.values(definitions.transitions || {})) {
-  for (const [key, definition] of Object.entries(category.transitions || {})) byKey.set(key, definition);
-}
+const SCRIPT_FILE = fileURLToPath(import.meta.url);
+const DEFAULT_API_FILE = fileURLToPath(new URL('../public/api-definitions.json', import.meta.url));
+
+// The registry pulls in the browser SDK bundle through sdk-types.js, so it is
+// imported lazily; callers that only need declaration metadata never load it.
+export async function renderTransitionExamples({ apiFile = DEFAULT_API_FILE } = {}) {
+  const { transitionOperations } = await import('../public/src/transitions/registry.js');
+  const definitions = JSON.parse(fs.readFileSync(apiFile, 'utf8'));
+  const byKey = new Map();
+  for (const category of Object.values(definitions.transitions || {})) {
+    for (const [key, definition] of Object.entries(category.transitions || {})) byKey.set(key, definition);
+  }
 
-const examples = {};
-for (const [key, operation] of Object.entries(transitionOperations)) {
-  const definition = byKey.get(key);
-  if (!definition) continue;
-  const values = Object.fromEntries((definition.inputs || []).map(input => [input.name, `<${input.name}>`]));
-  values.ownerId = '<ownerId>';
-  values.buyerId = '<buyerId>';
-  values.keyId = 0;
-  values.privateKeyWif = '<privateKeyWif>';
-  examples[key] = operation.renderCode(values);
+  const examples = {};
+  for (const [key, operation] of Object.entries(transitionOperations)) {
+    const definition = byKey.get(key);
+    if (!definition) continue;
+    const values = Object.fromEntries((definition.inputs || []).map(input => [input.name, `<${input.name}>`]));
+    values.ownerId = '<ownerId>';
+    values.buyerId = '<buyerId>';
+    values.keyId = 0;
+    values.privateKeyWif = '<privateKeyWif>';
+    examples[key] = operation.renderCode(values);
+  }
+  return examples;
 }
 
-process.stdout.write(JSON.stringify(examples));
+if (process.argv[1] && path.resolve(process.argv[1]) === SCRIPT_FILE) {
+  process.stdout.write(JSON.stringify(await renderTransitionExamples()));
+}
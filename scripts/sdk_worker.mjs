@@ -0,0 +1,66 @@
+#!/usr/bin/env node
+
+// Long-lived Node worker for the Python documentation scripts.
+//
+// Speaks line-delimited JSON-RPC on stdin/stdout: each request is one line
+// `{"id": 1, "method": "extract", "params": {...}}` and each response is one
+// line `{"id": 1, "result": ...}` or `{"id": 1, "error": {"message": "..."}}`.
+// The TypeScript compiler, parsed declaration files, and the transition
+// registry stay loaded between requests, so generate_docs.py and
+// check_documentation.py pay Node startup once per run instead of per call.
+
+import fs from 'node:fs';
+import path from 'node:path';
+import readline from 'node:readline';
+import { defaultOptions, documentedMethods, extractTypes } from './extract_sdk_types.mjs';
+import { renderTransitionExamples } from './render_transition_examples.mjs';
+
+// stdout carries the protocol; route incidental logging from imported modules
+// (the SDK bundle, transition registry) to stderr so it cannot corrupt it.
+console.log = console.error;
+console.info = console.error;
+console.debug = console.error;
+
+function resolveOptions(params = {}) {
+  const defaults = defaultOptions();
+  return {
+    apiFile: params.apiFile ? path.resolve(params.apiFile) : defaults.apiFile,
+    packageRoot: params.packageRoot ? path.resolve(params.packageRoot) : defaults.packageRoot,
+  };
+}
+
+const handlers = {
+  extract: (params) => extractTypes(resolveOptions(params)),
+  renderTransitionExamples: (params) => renderTransitionExamples({ apiFile: resolveOptions(params).apiFile }),
+  documentedMethods: (params) => documentedMethods(JSON.parse(fs.readFileSync(resolveOptions(params).apiFile, 'utf8'))),
+  ping: () => 'pong',
+};
+
+async function handle(line) {
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (error) {
+    return { id: null, error: { message: `Invalid request: ${error.message}` } };
+  }
+  const handler = Object.hasOwn(handlers, request.method) ? handlers[request.method] : null;
+  if (!handler) return { id: request.id ?? null, error: { message: `Unknown method: ${request.method}` } };
+  try {
+    return { id: request.id ?? null, result: await handler(request.params || {}) };
+  } catch (error) {
+    return { id: request.id ?? null, error: { message: error?.message || String(error) } };
+  }
+}
+
+const input = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+// Requests are answered strictly in order so the client can stay synchronous.
+let queue = Promise.resolve();
+input.on('line', (line) => {
+  if (!line.trim()) return;
+  queue = queue.then(async () => {
+    process.stdout.write(`${JSON.stringify(await handle(line))}\n`);
+  });
+});
+input.on('close', () => {
+  queue.then(() => process.exit(0));
+});
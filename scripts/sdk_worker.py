@@ -0,0 +1,93 @@
+"""
+Client for the long-lived Node worker in scripts/sdk_worker.mjs.
+
+The worker keeps the TypeScript compiler, parsed SDK declarations, and the
+transition registry warm, and answers line-delimited JSON-RPC requests on
+stdin/stdout. Use it as a context manager so the process is always reaped:
+
+    with SdkWorker(REPO_ROOT) as worker:
+        metadata = worker.call('extract', apiFile=str(api_file))
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Any
+
+
+class SdkWorkerError(RuntimeError):
+    """Raised when the worker reports an error or exits unexpectedly."""
+
+
+class SdkWorker:
+    def __init__(self, repo_root: Path):
+        self.repo_root = repo_root
+        self.script = repo_root / 'scripts' / 'sdk_worker.mjs'
+        self._process: subprocess.Popen | None = None
+        self._next_id = 1
+
+    def start(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            return
+        self._process = subprocess.Popen(
+            ['node', str(self.script)],
+            cwd=self.repo_root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+        )
+
+    def call(self, method: str, **params: Any) -> Any:
+        self.start()
+        assert self._process is not None and self._process.stdin and self._process.stdout
+        request_id = self._next_id
+        self._next_id += 1
+        try:
+            self._process.stdin.write(json.dumps({'id': request_id, 'method': method, 'params': params}) + '\n')
+            self._process.stdin.flush()
+        except BrokenPipeError as e:
+            raise SdkWorkerError(f'SDK worker exited before {method}') from e
+
+        line = self._process.stdout.readline()
+        if not line:
+            code = self._process.wait()
+            raise SdkWorkerError(f'SDK worker exited with status {code} during {method}')
+        try:
+            response = json.loads(line)
+        except ValueError:
+            response = None
+        if not isinstance(response, dict):
+            # Something wrote to stdout past the protocol; later replies can no longer be matched up.
+            self.close()
+            raise SdkWorkerError(f'SDK worker wrote a non-protocol line during {method}: {line.strip()[:200]}')
+        if response.get('id') != request_id:
+            raise SdkWorkerError(f'SDK worker answered request {response.get("id")}, expected {request_id}')
+        if 'error' in response:
+            raise SdkWorkerError(response['error'].get('message') or f'{method} failed')
+        return response.get('result')
+
+    def close(self) -> None:
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+        if process.stdin:
+            process.stdin.close()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        if process.stdout:
+            process.stdout.close()
+
+    def __enter__(self) -> 'SdkWorker':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
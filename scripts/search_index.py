@@ -0,0 +1,132 @@
+"""
+Prebuilt search index over the documented operations (`search-index.json`).
+
+The docs sidebar and the playground operation picker both search with
+public/src/search-index.js, which only walks this index and never the DOM or
+the definitions. Each operation is indexed by its label and key, description,
+SDK method name, parameter names (including the properties of options
+objects) and return type:
+
+    operations  [[group, category, key, label, anchor], ...]
+    terms       every indexed term, sorted
+    postings    per term, flat [operation, field mask, operation, field mask, ...]
+    trigrams    three-letter substring -> ids of the terms that contain it
+    stopwords   words never indexed, which the client drops from queries
+    minTermLength  shorter words are never indexed either
+
+Terms are lowercase words split at case changes, digits and punctuation
+(`getIdentityBalance` -> get, identity, balance), plus the whole identifier
+run together (`getidentitybalance`), so a query matches an exact term, a
+prefix (binary search over `terms`) or, from three letters on, a substring
+(intersection of `trigrams` lists). A lookup touches only the terms and
+postings it matches, not every operation.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+SEARCH_INDEX_NAME = 'search-index.json'
+SEARCH_INDEX_FORMAT = 'evo-sdk-search-index'
+SEARCH_INDEX_VERSION = 2
+# Bit positions in a posting's field mask; the client weighs matches by field.
+SEARCH_FIELDS = ('label', 'sdkMethod', 'parameter', 'returnType', 'description')
+TRIGRAM_LENGTH = 3
+MIN_TERM_LENGTH = 2
+
+WORD_RE = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+IDENTIFIER_RE = re.compile(r'[A-Za-z0-9_.$]+')
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it', 'its', 'of', 'on',
+    'or', 'that', 'the', 'this', 'to', 'with',
+    # Noise from type expressions: every method is async and most types live under `wasm.`.
+    'promise', 'wasm', 'undefined', 'null', 'void',
+})
+
+
+def words(text: str) -> List[str]:
+    """Lowercase words of `text`, split as public/src/search-index.js splits queries."""
+    return [word.lower() for word in WORD_RE.findall(text)]
+
+
+def _keep(term: str) -> bool:
+    return len(term) >= MIN_TERM_LENGTH and term not in STOPWORDS
+
+
+def field_terms(text: str, identifiers: bool) -> Set[str]:
+    """Terms for one field; identifier fields also index each identifier run together."""
+    terms = {word for word in words(text) if _keep(word)}
+    if identifiers:
+        for identifier in IDENTIFIER_RE.findall(text):
+            compound = ''.join(words(identifier))
+            if _keep(compound):
+                terms.add(compound)
+    return terms
+
+
+def trigrams(term: str) -> Iterable[str]:
+    for start in range(len(term) - TRIGRAM_LENGTH + 1):
+        yield term[start:start + TRIGRAM_LENGTH]
+
+
+def _parameter_names(parameters: Iterable[dict]) -> List[str]:
+    names = []
+    for parameter in parameters:
+        names.append(parameter.get('name', ''))
+        names.extend(prop.get('name', '') for prop in parameter.get('properties') or ())
+    return names
+
+
+def _operation_fields(operation) -> Tuple[Tuple[str, bool], ...]:
+    """(text, is identifier) per entry of SEARCH_FIELDS."""
+    return (
+        # Readers often know an operation by its key (`getIdentityBalance`) rather than its label.
+        (f'{operation.label} {operation.key}', True),
+        (operation.sdk_method, True),
+        (' '.join(_parameter_names(operation.parameters)), True),
+        (operation.return_type, True),
+        (operation.description, False),
+    )
+
+
+def build_search_index(ir) -> dict:
+    """The search index document for every operation in the documentation IR."""
+    operations = []
+    masks: Dict[str, Dict[int, int]] = {}
+    for categories in (ir.queries, ir.transitions):
+        for category in categories:
+            for operation in category.operations:
+                operation_id = len(operations)
+                operations.append([operation.group, category.key, operation.key, operation.label, operation.anchor])
+                for bit, (text, identifiers) in enumerate(_operation_fields(operation)):
+                    for term in field_terms(text, identifiers):
+                        entry = masks.setdefault(term, {})
+                        entry[operation_id] = entry.get(operation_id, 0) | (1 << bit)
+
+    terms = sorted(masks)
+    term_trigrams: Dict[str, List[int]] = {}
+    for term_id, term in enumerate(terms):
+        for trigram in dict.fromkeys(trigrams(term)):
+            term_trigrams.setdefault(trigram, []).append(term_id)
+    return {
+        'format': SEARCH_INDEX_FORMAT,
+        'version': SEARCH_INDEX_VERSION,
+        'fields': list(SEARCH_FIELDS),
+        'operations': operations,
+        'terms': terms,
+        'postings': [
+            [value for operation_id, mask in sorted(masks[term].items()) for value in (operation_id, mask)]
+            for term in terms
+        ],
+        'trigrams': {trigram: term_trigrams[trigram] for trigram in sorted(term_trigrams)},
+        # Shipped so the client drops the same words from a query instead of
+        # requiring a match for a word that can never have one.
+        'stopwords': sorted(STOPWORDS),
+        'minTermLength': MIN_TERM_LENGTH,
+    }
+
+
+def dumps_search_index(index: dict) -> str:
+    return json.dumps(index, separators=(',', ':'), ensure_ascii=False)
@@ -0,0 +1,126 @@
+import assert from 'node:assert/strict';
+import { spawnSync } from 'node:child_process';
+import { createHash } from 'node:crypto';
+import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import test from 'node:test';
+import { fileURLToPath } from 'node:url';
+
+const SCRIPTS = fileURLToPath(new URL('../scripts/', import.meta.url));
+
+// Plans the site in `root` and mirrors it into `root/../site` twice, reporting both runs.
+const DRIVER = `
+import json, sys
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+from asset_pipeline import plan_assets, write_site
+root = Path(sys.argv[2])
+site = root.parent / 'site'
+plan = plan_assets([root])
+runs = [write_site(plan, site)._asdict() for _ in range(2)]
+print(json.dumps({'assets': plan.assets, 'runs': runs}))
+`;
+
+// Lists the exports of `entry` in `root`, as the generator does before serving the raw WebAssembly glue.
+const EXPORTS_DRIVER = `
+import json, sys
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+from asset_pipeline import module_exports
+exports = module_exports(Path(sys.argv[2]), sys.argv[3])
+print(json.dumps(None if exports is None else sorted(exports)))
+`;
+
+function writeFiles(root, files) {
+  for (const [name, contents] of Object.entries(files)) {
+    fs.mkdirSync(path.dirname(path.join(root, name)), { recursive: true });
+    fs.writeFileSync(path.join(root, name), contents);
+  }
+}
+
+function fixture(wasm = 'wasm-v1') {
+  const root = path.join(fs.mkdtempSync(path.join(os.tmpdir(), 'evo-asset-test-')), 'public');
+  writeFiles(root, {
+    'index.html': '<link rel="stylesheet" href="./style.css">\n<script type="module" src="./src/a.js"></script>\n',
+    'style.css': 'body { cursor: url("src/pointer.wasm"); background: url(./bg.png); }\n',
+    'bg.png': 'png',
+    'src/a.js': "import { b } from './b.js';\nexport const a = () => b;\n",
+    'src/b.js': "import { a } from './a.js';\nexport const b = new URL('./pointer.wasm', import.meta.url);\nexport { a };\n",
+    'src/pointer.wasm': wasm,
+  });
+  return root;
+}
+
+function buildSite(root) {
+  const result = spawnSync('python3', ['-c', DRIVER, SCRIPTS, root], { encoding: 'utf8' });
+  assert.equal(result.status, 0, result.stderr);
+  return JSON.parse(result.stdout);
+}
+
+const read = (root, name) => fs.readFileSync(path.join(root, '..', 'site', name), 'utf8');
+const digest = (data) => createHash('sha256').update(data).digest('hex').slice(0, 10);
+
+test('hashes assets and rewrites HTML, CSS url() and new URL(..., import.meta.url) references', () => {
+  const root = fixture();
+  const { assets } = buildSite(root);
+  const wasm = `src/pointer.${digest('wasm-v1')}.wasm`;
+  assert.equal(assets['src/pointer.wasm'], wasm);
+  assert.equal(assets['bg.png'], undefined);
+
+  const css = read(root, assets['style.css']);
+  assert.equal(css, `body { cursor: url("${wasm}"); background: url(./bg.png); }\n`);
+  assert.equal(assets['style.css'], `style.${digest(css)}.css`);
+
+  assert.match(read(root, assets['src/b.js']), new RegExp(`new URL\\('\\./${path.basename(wasm)}', import\\.meta\\.url\\)`));
+  const html = read(root, 'index.html');
+  assert.ok(html.includes(`href="./${assets['style.css']}"`));
+  assert.ok(html.includes(`src="./${assets['src/a.js']}"`));
+});
+
+test('gives an import cycle one hash that follows its dependencies', () => {
+  const first = buildSite(fixture('wasm-v1')).assets;
+  const hashOf = (name) => name.split('.').at(-2);
+  assert.equal(hashOf(first['src/a.js']), hashOf(first['src/b.js']));
+
+  const root = fixture('wasm-v1');
+  const { assets } = buildSite(root);
+  assert.ok(read(root, assets['src/a.js']).includes(`from './${path.basename(assets['src/b.js'])}'`));
+  assert.ok(read(root, assets['src/b.js']).includes(`from './${path.basename(assets['src/a.js'])}'`));
+  assert.deepEqual(assets, first);
+
+  const changed = buildSite(fixture('wasm-v2')).assets;
+  assert.notEqual(changed['src/a.js'], first['src/a.js']);
+  assert.equal(hashOf(changed['src/a.js']), hashOf(changed['src/b.js']));
+});
+
+test('leaves an up-to-date site untouched on the second run', () => {
+  const root = fixture();
+  const { runs } = buildSite(root);
+  assert.equal(runs[0].copied, 6);
+  assert.deepEqual(runs[1], { copied: 0, unchanged: 6, removed: 0 });
+});
+
+test('lists module exports through relative export * re-exports', () => {
+  const root = fs.mkdtempSync(path.join(os.tmpdir(), 'evo-exports-test-'));
+  writeFiles(root, {
+    'glue.js': [
+      "export * from './classes.js';",
+      "export * as snippets from './snippets/inline0.js';",
+      'export async function init() {}',
+      'const initSync = () => {};',
+      'export { initSync, init as default };',
+    ].join('\n'),
+    'classes.js': 'export class Identity {}\nexport const VERSION = 1;\nexport default Identity;\n',
+    'snippets/inline0.js': 'export function helper() {}\n',
+    'bare.js': "export * from '@dashevo/wasm-sdk/compressed';\n",
+  });
+  const exportsOf = (entry) => {
+    const result = spawnSync('python3', ['-c', EXPORTS_DRIVER, SCRIPTS, root, entry], { encoding: 'utf8' });
+    assert.equal(result.status, 0, result.stderr);
+    return JSON.parse(result.stdout);
+  };
+  assert.deepEqual(exportsOf('glue.js'), ['Identity', 'VERSION', 'default', 'init', 'initSync', 'snippets']);
+  assert.equal(exportsOf('bare.js'), null);
+  assert.equal(exportsOf('missing.js'), null);
+});
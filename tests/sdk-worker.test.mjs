@@ -0,0 +1,107 @@
+import assert from 'node:assert/strict';
+import { spawn, spawnSync } from 'node:child_process';
+import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import readline from 'node:readline';
+import test from 'node:test';
+import { fileURLToPath } from 'node:url';
+
+const WORKER = fileURLToPath(new URL('../scripts/sdk_worker.mjs', import.meta.url));
+const SCRIPTS = fileURLToPath(new URL('../scripts/', import.meta.url));
+
+function startWorker() {
+  const child = spawn(process.execPath, [WORKER], { stdio: ['pipe', 'pipe', 'inherit'] });
+  const lines = readline.createInterface({ input: child.stdout })[Symbol.asyncIterator]();
+  let nextId = 1;
+  return {
+    async call(method, params = {}) {
+      const id = nextId++;
+      child.stdin.write(`${JSON.stringify({ id, method, params })}\n`);
+      const { value } = await lines.next();
+      const response = JSON.parse(value);
+      assert.equal(response.id, id);
+      return response;
+    },
+    close() {
+      child.stdin.end();
+      return new Promise((resolve) => child.on('exit', resolve));
+    },
+  };
+}
+
+function fixture() {
+  const root = fs.mkdtempSync(path.join(os.tmpdir(), 'evo-worker-test-'));
+  const packageRoot = path.join(root, 'node_modules/@dashevo/evo-sdk');
+  const wasmRoot = path.join(root, 'node_modules/@dashevo/wasm-sdk');
+  fs.mkdirSync(path.join(packageRoot, 'dist/example'), { recursive: true });
+  fs.mkdirSync(path.join(wasmRoot, 'dist/raw'), { recursive: true });
+  fs.writeFileSync(path.join(packageRoot, 'package.json'), JSON.stringify({ name: '@dashevo/evo-sdk', version: '4.0.0' }));
+  fs.writeFileSync(path.join(wasmRoot, 'package.json'), JSON.stringify({ name: '@dashevo/wasm-sdk', version: '4.0.0' }));
+  fs.writeFileSync(path.join(packageRoot, 'dist/example/facade.d.ts'), 'export declare class ExampleFacade {\n  sample(): Promise<wasm.ResultType>;\n}');
+  fs.writeFileSync(path.join(wasmRoot, 'dist/raw/wasm_sdk.d.ts'), 'export interface ResultType { value: bigint; }');
+  const apiFile = path.join(root, 'api.json');
+  fs.writeFileSync(apiFile, JSON.stringify({ queries: { example: { queries: { operation: { sdk_method: 'example.sample', label: 'Sample' } } } }, transitions: {} }));
+  return { packageRoot, apiFile };
+}
+
+test('serves documentedMethods and extract requests from one process', async () => {
+  const fx = fixture();
+  const worker = startWorker();
+  try {
+    const documented = await worker.call('documentedMethods', { apiFile: fx.apiFile });
+    assert.deepEqual(documented.result.map(({ key, sdkMethod }) => ({ key, sdkMethod })), [{ key: 'operation', sdkMethod: 'example.sample' }]);
+
+    for (let attempt = 0; attempt < 2; attempt += 1) {
+      const extracted = await worker.call('extract', fx);
+      assert.equal(extracted.result.methods['example.sample'].returnType, 'Promise<wasm.ResultType>');
+      assert.match(extracted.result.types.ResultType.declaration, /interface ResultType/);
+    }
+  } finally {
+    assert.equal(await worker.close(), 0);
+  }
+});
+
+test('reports failures as JSON-RPC errors and keeps serving', async () => {
+  const fx = fixture();
+  const worker = startWorker();
+  try {
+    assert.match((await worker.call('missingMethod')).error.message, /Unknown method: missingMethod/);
+    fs.writeFileSync(fx.apiFile, JSON.stringify({ queries: { example: { queries: { operation: {} } } }, transitions: {} }));
+    assert.match((await worker.call('extract', fx)).error.message, /has no sdk_method/);
+    assert.equal((await worker.call('ping')).result, 'pong');
+  } finally {
+    await worker.close();
+  }
+});
+
+test('the Python client turns a non-protocol stdout line into SdkWorkerError', () => {
+  const root = fs.mkdtempSync(path.join(os.tmpdir(), 'evo-worker-client-test-'));
+  fs.mkdirSync(path.join(root, 'scripts'));
+  // Answers every request, but a dependency has printed to stdout first.
+  fs.writeFileSync(path.join(root, 'scripts/sdk_worker.mjs'), [
+    "import readline from 'node:readline';",
+    'for await (const line of readline.createInterface({ input: process.stdin })) {',
+    "  process.stdout.write('progress: 50%\\n');",
+    "  process.stdout.write(`${JSON.stringify({ id: JSON.parse(line).id, result: 'pong' })}\\n`);",
+    '}',
+  ].join('\n'));
+  const driver = [
+    'import sys',
+    'from pathlib import Path',
+    'sys.path.insert(0, sys.argv[1])',
+    'from sdk_worker import SdkWorker, SdkWorkerError',
+    'with SdkWorker(Path(sys.argv[2])) as worker:',
+    '    for _ in range(2):',
+    '        try:',
+    "            worker.call('ping')",
+    '        except SdkWorkerError as e:',
+    '            print(e)',
+  ].join('\n');
+  const result = spawnSync('python3', ['-c', driver, SCRIPTS, root], { encoding: 'utf8' });
+  assert.equal(result.status, 0, result.stderr);
+  assert.deepEqual(result.stdout.trim().split('\n'), [
+    'SDK worker wrote a non-protocol line during ping: progress: 50%',
+    'SDK worker wrote a non-protocol line during ping: progress: 50%',
+  ]);
+});
@@ -138,3 +138,12 @@ test('fails for conflicting inherited properties', () => {
   });
   assert.throws(() => extractTypes(fx), /Conflicting property SampleOptions\.value/);
 });
+
+test('re-parses declarations that change between extractions in one process', () => {
+  const fx = fixture({ returnType: 'Promise<void>' });
+  assert.equal(extractTypes(fx).methods['example.sample'].returnType, 'Promise<void>');
+  const facade = path.join(fx.packageRoot, 'dist/example/facade.d.ts');
+  fs.writeFileSync(facade, 'export declare class ExampleFacade {\n  sample(): Promise<string | undefined>;\n}');
+  fs.utimesSync(facade, new Date(), new Date(Date.now() + 1000));
+  assert.equal(extractTypes(fx).methods['example.sample'].returnType, 'Promise<string | undefined>');
+});
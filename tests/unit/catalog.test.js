@@ -0,0 +1,99 @@
+import { describe, expect, it } from 'vitest';
+import { createCatalogLoader, methodNamespace } from '../../public/src/catalog.js';
+
+const index = {
+  schemaVersion: 1,
+  sdk: { name: '@dashevo/evo-sdk', version: '4.1.0' },
+  operations: [{ key: 'getIdentity', group: 'queries', category: 'identity', sdkMethod: 'identities.fetch' }],
+  namespaces: {
+    identities: { file: 'identities.0123456789abcdef.json', methods: ['identities.fetch'] },
+    tokens: { file: 'tokens.fedcba9876543210.json', methods: ['tokens.mint'] },
+  },
+  types: { Identity: ['identities'], TokenMintResult: ['tokens'] },
+};
+
+const shards = {
+  'identities.0123456789abcdef.json': {
+    namespace: 'identities',
+    methods: { 'identities.fetch': { sdkMethod: 'identities.fetch', returnType: 'Promise<wasm.Identity | undefined>' } },
+    types: { Identity: { kind: 'ClassDeclaration', anchor: 'type-identity' } },
+  },
+  'tokens.fedcba9876543210.json': {
+    namespace: 'tokens',
+    methods: { 'tokens.mint': { sdkMethod: 'tokens.mint' } },
+    types: { TokenMintResult: { kind: 'InterfaceDeclaration', anchor: 'type-tokenmintresult' } },
+  },
+};
+
+function fakeFetch(files) {
+  const requests = [];
+  const fetchImpl = async (url) => {
+    requests.push(url);
+    const name = url.slice('./catalog/'.length);
+    if (!(name in files)) return { ok: false, status: 404 };
+    return { ok: true, status: 200, json: async () => structuredClone(files[name]) };
+  };
+  return { fetchImpl, requests };
+}
+
+describe('methodNamespace', () => {
+  it('takes the facade namespace before the first dot', () => {
+    expect(methodNamespace('identities.fetch')).toBe('identities');
+    expect(methodNamespace('stateTransitions.waitForResponse')).toBe('stateTransitions');
+  });
+});
+
+describe('createCatalogLoader', () => {
+  it('fetches only the index and the shard for the requested namespace', async () => {
+    const { fetchImpl, requests } = fakeFetch({ 'index.json': index, ...shards });
+    const loader = createCatalogLoader({ fetchImpl });
+
+    const method = await loader.getMethod('identities.fetch');
+    expect(method.returnType).toBe('Promise<wasm.Identity | undefined>');
+    expect(requests).toEqual(['./catalog/index.json', './catalog/identities.0123456789abcdef.json']);
+  });
+
+  it('reuses loaded shards for later method and type lookups', async () => {
+    const { fetchImpl, requests } = fakeFetch({ 'index.json': index, ...shards });
+    const loader = createCatalogLoader({ fetchImpl });
+
+    await loader.getMethod('identities.fetch');
+    expect((await loader.getType('wasm.Identity')).anchor).toBe('type-identity');
+    expect(await loader.getOperation('getIdentity')).toMatchObject({ sdkMethod: 'identities.fetch' });
+    expect(requests).toHaveLength(2);
+  });
+
+  it('returns null for unknown methods, types, and operations', async () => {
+    const { fetchImpl } = fakeFetch({ 'index.json': index, ...shards });
+    const loader = createCatalogLoader({ fetchImpl });
+
+    expect(await loader.getMethod('nope.fetch')).toBeNull();
+    expect(await loader.getMethod('identities.nope')).toBeNull();
+    expect(await loader.getType('Missing')).toBeNull();
+    expect(await loader.getOperation('missing')).toBeNull();
+  });
+
+  it('reports failed fetches and retries them on the next call', async () => {
+    const files = { 'index.json': index };
+    const { fetchImpl, requests } = fakeFetch(files);
+    const loader = createCatalogLoader({ fetchImpl });
+
+    await expect(loader.getMethod('tokens.mint')).rejects.toThrow('Failed to load catalog/tokens.fedcba9876543210.json (404)');
+    files['tokens.fedcba9876543210.json'] = shards['tokens.fedcba9876543210.json'];
+    expect(await loader.getMethod('tokens.mint')).toEqual({ sdkMethod: 'tokens.mint' });
+    expect(requests.filter((url) => url.endsWith('tokens.fedcba9876543210.json'))).toHaveLength(2);
+  });
+
+  it('honours a custom base URL', async () => {
+    const requests = [];
+    const loader = createCatalogLoader({
+      baseUrl: 'https://mirror.example/catalog',
+      fetchImpl: async (url) => {
+        requests.push(url);
+        return { ok: true, json: async () => index };
+      },
+    });
+    await loader.loadIndex();
+    expect(requests).toEqual(['https://mirror.example/catalog/index.json']);
+  });
+});
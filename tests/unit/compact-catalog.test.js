@@ -0,0 +1,62 @@
+import { describe, expect, it } from 'vitest';
+import fs from 'node:fs';
+import { defaultAnchor, expandCatalog, loadCompactCatalog } from '../../public/src/compact-catalog.js';
+
+const catalogText = fs.readFileSync(new URL('../../public/sdk-operation-catalog.json', import.meta.url), 'utf8');
+const compactText = fs.readFileSync(new URL('../../public/sdk-operation-catalog.compact.json', import.meta.url), 'utf8');
+const catalog = JSON.parse(catalogText);
+const compact = JSON.parse(compactText);
+
+describe('expandCatalog', () => {
+  it('restores the committed catalog exactly, key order included', () => {
+    // Stringify both sides so key order is compared too, not just structure.
+    expect(JSON.stringify(expandCatalog(compact))).toBe(JSON.stringify(catalog));
+  });
+
+  it('stores each method once and interns recurring names', () => {
+    expect(compact.methods).toHaveLength(Object.keys(catalog.methods).length);
+    expect(compact.operations).toHaveLength(catalog.operations.length);
+    expect(new Set(compact.strings).size).toBe(compact.strings.length);
+    expect(compact.strings).toContain('wasm.IdentifierLike');
+    expect(compactText).not.toMatch(/\n/);
+    expect(compactText.length).toBeLessThan(catalogText.length / 2);
+  });
+
+  it('rebuilds method variants from the operations that use them', () => {
+    const expanded = expandCatalog(compact);
+    for (const [name, method] of Object.entries(catalog.methods)) {
+      expect(expanded.methods[name].variants).toEqual(method.variants);
+    }
+  });
+
+  it('rejects unknown formats', () => {
+    expect(() => expandCatalog({ ...compact, formatVersion: 99 })).toThrow('Unsupported compact catalog format');
+    expect(() => expandCatalog(catalog)).toThrow('Unsupported compact catalog format');
+  });
+});
+
+describe('defaultAnchor', () => {
+  it('matches the anchors the extractor assigns', () => {
+    for (const [name, declaration] of Object.entries(catalog.types)) {
+      expect(defaultAnchor(name)).toBe(declaration.anchor);
+    }
+  });
+});
+
+describe('loadCompactCatalog', () => {
+  it('fetches and expands the compact file', async () => {
+    const requests = [];
+    const fetchImpl = async (url) => {
+      requests.push(url);
+      return { ok: true, json: async () => JSON.parse(compactText) };
+    };
+    const expanded = await loadCompactCatalog(undefined, { fetchImpl });
+    expect(requests).toEqual(['./sdk-operation-catalog.compact.json']);
+    expect(expanded.methods['identities.fetch'].returnType).toBe(catalog.methods['identities.fetch'].returnType);
+  });
+
+  it('reports HTTP failures', async () => {
+    const fetchImpl = async () => ({ ok: false, status: 503 });
+    await expect(loadCompactCatalog('./x.json', { fetchImpl })).rejects.toThrow('Failed to load ./x.json (503)');
+  });
+});
@@ -0,0 +1,149 @@
+import { describe, expect, it } from 'vitest';
+import { createSearchIndex, createSearchIndexLoader, tokenize } from '../../public/src/search-index.js';
+
+const FIELDS = ['label', 'sdkMethod', 'parameter', 'returnType', 'description'];
+const LABEL = 1;
+const SDK_METHOD = 2;
+const PARAMETER = 4;
+const RETURN_TYPE = 8;
+const DESCRIPTION = 16;
+
+// Same layout scripts/search_index.py writes, built from {term: {operation: mask}}.
+function buildIndex(operations, masks) {
+  const terms = Object.keys(masks).sort();
+  const trigrams = {};
+  terms.forEach((term, id) => {
+    for (let i = 0; i + 3 <= term.length; i += 1) {
+      const list = (trigrams[term.slice(i, i + 3)] ||= []);
+      if (list.at(-1) !== id) list.push(id);
+    }
+  });
+  return {
+    format: 'evo-sdk-search-index',
+    version: 2,
+    fields: FIELDS,
+    operations,
+    terms,
+    postings: terms.map((term) => Object.entries(masks[term]).flatMap(([operation, mask]) => [Number(operation), mask])),
+    trigrams,
+    stopwords: ['by', 'for', 'of', 'to'],
+    minTermLength: 2,
+  };
+}
+
+const data = buildIndex(
+  [
+    ['queries', 'identity', 'getIdentityBalanceAndRevision', 'Get Identity Balance and Revision', 'query-getIdentityBalanceAndRevision'],
+    ['queries', 'identity', 'getIdentityBalance', 'Get Identity Balance', 'query-getIdentityBalance'],
+    ['transitions', 'token', 'tokenMint', 'Token Mint', 'transition-tokenMint'],
+    ['queries', 'document', 'getDocuments', 'Get Documents', 'query-getDocuments'],
+    ['queries', 'identity', 'getIdentityByPublicKeyHash', 'Get Identity by Public Key Hash', 'query-getIdentityByPublicKeyHash'],
+    ['transitions', 'identity', 'identityCreditTransfer', 'Transfer to Identity', 'transition-identityCreditTransfer'],
+    ['queries', 'document', 'getDocumentsOffset', 'Get Documents Offset', 'query-getDocumentsOffset'],
+  ],
+  {
+    get: { 0: LABEL, 1: LABEL, 3: LABEL, 4: LABEL, 6: LABEL },
+    identity: { 0: LABEL | PARAMETER, 1: LABEL | PARAMETER, 4: LABEL, 5: LABEL },
+    identities: { 0: SDK_METHOD, 1: SDK_METHOD },
+    identityid: { 0: PARAMETER, 1: PARAMETER },
+    balance: { 0: LABEL | SDK_METHOD | RETURN_TYPE, 1: LABEL | SDK_METHOD },
+    revision: { 0: LABEL },
+    getidentitybalance: { 1: LABEL },
+    getidentitybalanceandrevision: { 0: LABEL },
+    token: { 2: LABEL | SDK_METHOD },
+    mint: { 2: LABEL | SDK_METHOD },
+    tokenmint: { 2: LABEL },
+    recipient: { 2: PARAMETER | DESCRIPTION },
+    documents: { 3: LABEL | SDK_METHOD },
+    where: { 3: PARAMETER },
+    public: { 4: LABEL },
+    key: { 4: LABEL },
+    hash: { 4: LABEL },
+    getidentitybypublickeyhash: { 4: LABEL },
+    transfer: { 2: DESCRIPTION, 5: LABEL },
+    credit: { 5: SDK_METHOD },
+    offset: { 6: LABEL | PARAMETER },
+  },
+);
+
+const keys = (operations) => operations.map((operation) => operation.key);
+
+describe('tokenize', () => {
+  it('splits camelCase, punctuation and digits into lowercase words', () => {
+    expect(tokenize('getIdentityBalance')).toEqual(['get', 'identity', 'balance']);
+    expect(tokenize('identities.fetch DPNSName v2')).toEqual(['identities', 'fetch', 'dpns', 'name', 'v', '2']);
+    expect(tokenize('  ')).toEqual([]);
+  });
+});
+
+describe('createSearchIndex', () => {
+  const index = createSearchIndex(data);
+
+  it('matches exact terms, prefixes and substrings', () => {
+    expect(keys(index.search('mint'))).toEqual(['tokenMint']);
+    expect(keys(index.search('recip'))).toEqual(['tokenMint']);
+    expect(keys(index.search('ocumen'))).toEqual(['getDocuments']);
+  });
+
+  it('requires every query word to match', () => {
+    expect(keys(index.search('identity revision'))).toEqual(['getIdentityBalanceAndRevision']);
+    expect(index.search('identity mint')).toEqual([]);
+    expect(index.search('nothing')).toEqual([]);
+    expect(index.search('')).toEqual([]);
+  });
+
+  it('ranks an operation named exactly as typed first', () => {
+    expect(keys(index.search('getIdentityBalance'))).toEqual(['getIdentityBalance', 'getIdentityBalanceAndRevision']);
+  });
+
+  it('ranks label matches above parameter and description matches', () => {
+    expect(keys(index.search('identity'))[0]).toBe('getIdentityBalance');
+    expect(keys(index.search('where'))).toEqual(['getDocuments']);
+  });
+
+  it('applies the filter and the limit', () => {
+    expect(keys(index.search('get', { filter: (operation) => operation.category === 'document' }))).toEqual(['getDocuments', 'getDocumentsOffset']);
+    expect(index.search('get', { limit: 2 })).toHaveLength(2);
+  });
+
+  it('finds an operation by its full label, ignoring words the index never holds', () => {
+    expect(keys(index.search('Get Identity by Public Key Hash'))).toEqual(['getIdentityByPublicKeyHash']);
+    expect(keys(index.search('Transfer to Identity'))).toEqual(['identityCreditTransfer']);
+    expect(keys(index.search('balance of identity')).sort()).toEqual(['getIdentityBalance', 'getIdentityBalanceAndRevision']);
+    expect(keys(index.search('getIdentityByPublicKeyHash'))).toEqual(['getIdentityByPublicKeyHash']);
+  });
+
+  it('searches for stopwords only when the query has nothing else', () => {
+    expect(keys(index.search('documents for'))).toEqual(['getDocuments']);
+    expect(keys(index.search('of'))).toEqual(['getDocumentsOffset']);
+  });
+
+  it('returns the operation records', () => {
+    expect(index.search('tokenmint')[0]).toEqual({
+      id: 2, group: 'transitions', category: 'token', key: 'tokenMint', label: 'Token Mint', anchor: 'transition-tokenMint',
+    });
+  });
+
+  it('rejects an index in another format', () => {
+    expect(() => createSearchIndex({ ...data, version: 99 })).toThrow('Unsupported search index');
+  });
+});
+
+describe('createSearchIndexLoader', () => {
+  it('fetches the index once and retries after a failure', async () => {
+    const requests = [];
+    let available = false;
+    const loadSearchIndex = createSearchIndexLoader({
+      fetchImpl: async (url) => {
+        requests.push(url);
+        return available ? { ok: true, json: async () => data } : { ok: false, status: 503 };
+      },
+    });
+
+    await expect(loadSearchIndex()).rejects.toThrow('Failed to load ./search-index.json (503)');
+    available = true;
+    const index = await loadSearchIndex();
+    expect(await loadSearchIndex()).toBe(index);
+    expect(requests).toEqual(['./search-index.json', './search-index.json']);
+  });
+});
@@ -28,6 +28,9 @@ export default defineConfig({
         'public/src/form/parse-input.js',
         'public/src/auth-preview.js',
         'public/src/version-display.js',
+        'public/src/catalog.js',
+        'public/src/compact-catalog.js',
+        'public/src/search-index.js',
         'public/src/state.js',
         'public/src/transitions/address-operations.js',
         'public/src/transitions/asset-lock-operations.js',